@@ -0,0 +1,195 @@
+"""
+Benchmark de escalamiento de los simulate_*.
+
+Corre cada algoritmo sobre cargas generadas de 10^2 a 10^6 procesos en varios regímenes de
+ráfagas, mide tiempo de pared, memoria pico (con tracemalloc) y eventos por segundo, y ajusta
+el exponente empírico de complejidad (pendiente de log(tiempo) contra log(n)). Los resultados
+se guardan en JSON para poder comparar corridas entre commits.
+
+Uso:
+    python3 -m experiments.bench --max-size 100000 --output data/results/bench.json
+"""
+from typing import Any, Callable, Dict, List, Optional, Sequence
+import argparse
+import json
+import math
+import platform
+import random
+import subprocess
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+from src.cpu_scheduler import ProcessTable, select_algorithms, summary_options
+
+DEFAULT_OUTPUT = Path("data/results/bench.json")
+DEFAULT_SIZES = [10**2, 10**3, 10**4, 10**5, 10**6]
+
+# Regímenes de ráfagas: (ráfaga mínima, ráfaga máxima)
+BURST_REGIMES: Dict[str, tuple[int, int]] = {
+    "short": (1, 10),
+    "mixed": (1, 1_000),
+    "long": (10_000, 1_000_000),
+}
+
+def generate_workload(n: int, min_burst: int, max_burst: int, utilization: float = 0.9, seed: int = 0) -> ProcessTable:
+    """
+    Carga reproducible de n procesos con ráfagas uniformes y llegadas uniformes en una
+    ventana calculada para que la utilización de la CPU ronde `utilization`.
+    """
+    rng = random.Random(seed)
+    bursts = [rng.randint(min_burst, max_burst) for _ in range(n)]
+    window = max(1, int(sum(bursts) / utilization))
+    arrivals = sorted(rng.randrange(window) for _ in range(n))
+    return ProcessTable(list(range(1, n + 1)), arrivals, bursts)
+
+def fit_exponent(sizes: Sequence[float], times: Sequence[float]) -> Optional[float]:
+    """Pendiente por mínimos cuadrados de log(tiempo) contra log(n)."""
+    points = [(math.log(n), math.log(t)) for n, t in zip(sizes, times) if n > 0 and t > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    sxx = sum((x - mean_x) ** 2 for x, _ in points)
+    if sxx == 0:
+        return None
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    return sxy / sxx
+
+def measure(fn: Callable[..., Dict[str, Any]], table: ProcessTable, memory: bool = True) -> Dict[str, Any]:
+    """
+    Mide una ejecución solo por sus métricas (summary_options: sin métricas por proceso y
+    con Round Robin comprimiendo sus rondas), así que la memoria no crece con el número de
+    rebanadas. El tiempo se toma sin tracemalloc; la memoria pico, en una segunda ejecución
+    con tracemalloc activo. Los eventos son los que procesó el kernel (counters["events"]).
+    """
+    options = summary_options(fn)
+    started = time.perf_counter()
+    result = fn(table, **options)
+    wall_time = time.perf_counter() - started
+
+    events = result["counters"]["events"]
+    sample = {
+        "wall_time": wall_time,
+        "events": events,
+        "events_per_second": events / wall_time if wall_time > 0 else None,
+        "peak_memory": None,
+    }
+    del result
+
+    if memory:
+        tracemalloc.start()
+        fn(table, **options)
+        sample["peak_memory"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return sample
+
+def run_benchmarks(
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    regimes: Optional[Sequence[str]] = None,
+    algorithms: Optional[Sequence[str]] = None,
+    memory: bool = True,
+    budget: float = 30.0,
+    max_memory: Optional[int] = 2**30,
+    seed: int = 0,
+    log: Callable[[str], None] = print,
+) -> Dict[str, Any]:
+    """
+    Corre el benchmark completo. Si una corrida de un (algoritmo, régimen) tarda más que
+    `budget` segundos, o si su memoria pico (cuando se mide) escalada al siguiente tamaño
+    pasa de `max_memory` bytes, se saltan los tamaños mayores para ese par.
+    """
+    regimes = list(regimes or BURST_REGIMES)
+    selected = select_algorithms(algorithms)
+
+    runs: List[Dict[str, Any]] = []
+    fits: List[Dict[str, Any]] = []
+    for regime in regimes:
+        min_burst, max_burst = BURST_REGIMES[regime]
+        tables = {}
+        for name, fn in selected:
+            ok_sizes: List[int] = []
+            ok_times: List[float] = []
+            for n in sorted(sizes):
+                if n not in tables:
+                    tables[n] = generate_workload(n, min_burst, max_burst, seed=seed)
+                sample = measure(fn, tables[n], memory=memory)
+                runs.append({"algorithm": name, "regime": regime, "n": n, **sample})
+                ok_sizes.append(n)
+                ok_times.append(sample["wall_time"])
+                log(f"{name:<6} {regime:<6} n={n:<8} {sample['wall_time']:9.4f} s")
+                if sample["wall_time"] > budget:
+                    log(f"{name:<6} {regime:<6} se omiten tamaños mayores (presupuesto de {budget} s)")
+                    break
+                # La memoria crece al menos linealmente con n: si el siguiente tamaño no
+                # cabe en `max_memory`, no se corre (quedarse sin memoria no se recupera)
+                larger = [m for m in sizes if m > n]
+                peak = sample["peak_memory"]
+                if max_memory is not None and peak is not None and larger and peak * min(larger) / n > max_memory:
+                    log(f"{name:<6} {regime:<6} se omiten tamaños mayores (memoria pico de {peak / 2**20:.0f} MiB)")
+                    break
+            fits.append({
+                "algorithm": name,
+                "regime": regime,
+                "exponent": fit_exponent(ok_sizes, ok_times),
+            })
+
+    return {
+        "meta": _metadata(),
+        "runs": runs,
+        "fits": fits,
+    }
+
+def _metadata() -> Dict[str, Any]:
+    """Datos para comparar corridas: commit, versión de Python y fecha."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+
+def save_json(report: Dict[str, Any], path: Path = DEFAULT_OUTPUT) -> None:
+    out_path = Path(path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text(json.dumps(report, indent=2))
+    print(f"Benchmark guardado en {out_path}")
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark de escalamiento de los algoritmos.")
+    parser.add_argument("--max-size", type=int, default=10**6, help="tamaño máximo de carga")
+    parser.add_argument("--regime", action="append", choices=sorted(BURST_REGIMES), help="régimen de ráfagas (repetible)")
+    parser.add_argument("--algorithm", action="append", help="algoritmo del registro a medir, por ejemplo RR_q8 (repetible)")
+    parser.add_argument("--no-memory", action="store_true", help="no mide memoria pico (evita la segunda ejecución)")
+    parser.add_argument("--budget", type=float, default=30.0, help="segundos máximos por corrida antes de omitir tamaños mayores")
+    parser.add_argument("--max-memory", type=float, default=1024, help="MiB de memoria pico estimada para el siguiente tamaño antes de omitirlo (requiere medir memoria)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    args = parser.parse_args(argv)
+
+    sizes = [n for n in DEFAULT_SIZES if n <= args.max_size]
+    report = run_benchmarks(
+        sizes=sizes,
+        regimes=args.regime,
+        algorithms=args.algorithm,
+        memory=not args.no_memory,
+        budget=args.budget,
+        max_memory=int(args.max_memory * 2**20),
+        seed=args.seed,
+    )
+
+    print("\nExponentes empíricos (tiempo ~ n^k):")
+    for fit in report["fits"]:
+        k = "n/a" if fit["exponent"] is None else f"{fit['exponent']:.2f}"
+        print(f"  {fit['algorithm']:<6} {fit['regime']:<6} k = {k}")
+    save_json(report, args.output)
+
+if __name__ == "__main__":
+    main()
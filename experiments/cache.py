@@ -0,0 +1,134 @@
+"""
+Caché en disco de resultados de simulación, direccionada por contenido.
+
+La llave de cada celda es un hash estable de:
+  - el contenido de la carga (columnas pid, arrival, burst y priority),
+  - el nombre de la función del algoritmo y sus parámetros (por ejemplo el quantum de RR),
+  - la versión del código del simulador (hash del archivo fuente donde vive el algoritmo).
+
+Los resultados se guardan comprimidos en un archivo SQLite bajo data/cache/ y, cuando el
+tamaño total supera el límite, se desalojan las entradas usadas hace más tiempo (LRU).
+"""
+import functools
+import hashlib
+import inspect
+import json
+import sqlite3
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from src.cpu_scheduler import ProcessTable
+
+DEFAULT_CACHE_PATH = Path("data/cache/results.sqlite")
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Cambiar si cambia el formato de lo que se guarda
+CACHE_FORMAT = 1
+
+def workload_digest(table: ProcessTable) -> str:
+    """Hash estable del contenido de una carga."""
+    digest = hashlib.sha256()
+    for column in (table.pid, table.arrival, table.burst, table.priority):
+        data = column.tobytes() if hasattr(column, "tobytes") else repr(list(column)).encode()
+        digest.update(len(data).to_bytes(8, "little"))
+        digest.update(data)
+    return digest.hexdigest()
+
+@functools.lru_cache(maxsize=None)
+def _source_digest(path: str) -> str:
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+def algorithm_signature(fn: Callable[..., Any]) -> Dict[str, Any]:
+    """Nombre, parámetros y versión del código de un algoritmo (función o functools.partial)."""
+    keywords: Dict[str, Any] = {}
+    args: tuple = ()
+    while isinstance(fn, functools.partial):
+        keywords = {**fn.keywords, **keywords}
+        args = fn.args + args
+        fn = fn.func
+
+    return {
+        "function": f"{fn.__module__}.{fn.__qualname__}",
+        "args": list(args),
+        "params": dict(sorted(keywords.items())),
+        "code": _source_digest(inspect.getsourcefile(fn)),
+    }
+
+def cell_key(table: ProcessTable, fn: Callable[..., Any]) -> str:
+    """Llave de caché de una celda (carga, algoritmo)."""
+    payload = {
+        "format": CACHE_FORMAT,
+        "workload": workload_digest(table),
+        "algorithm": algorithm_signature(fn),
+    }
+    text = json.dumps(payload, sort_keys=True, default=repr)
+    return hashlib.sha256(text.encode()).hexdigest()
+
+class ResultCache:
+    """
+    Caché LRU acotada por tamaño en un archivo SQLite.
+
+    Cada valor es un diccionario serializable a JSON, guardado comprimido con zlib.
+    """
+
+    def __init__(self, path: Path = DEFAULT_CACHE_PATH, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path))
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            " key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._db.commit()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        row = self._db.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        self._db.execute("UPDATE results SET last_used = ? WHERE key = ?", (time.time(), key))
+        return json.loads(zlib.decompress(row[0]))
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        blob = zlib.compress(json.dumps(value, separators=(",", ":")).encode())
+        self._db.execute(
+            "INSERT OR REPLACE INTO results (key, value, size, last_used) VALUES (?, ?, ?, ?)",
+            (key, blob, len(blob), time.time()),
+        )
+        self._evict()
+
+    def _evict(self) -> None:
+        """Borra las entradas menos usadas recientemente hasta quedar dentro del límite."""
+        total = self.size()
+        if total <= self.max_bytes:
+            return
+        rows = self._db.execute("SELECT key, size FROM results ORDER BY last_used").fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._db.execute("DELETE FROM results WHERE key = ?", (key,))
+            total -= size
+
+    def size(self) -> int:
+        """Tamaño total de los valores guardados, en bytes."""
+        return self._db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def clear(self) -> None:
+        self._db.execute("DELETE FROM results")
+        self._db.commit()
+        self._db.execute("VACUUM")
+
+    def close(self) -> None:
+        self._db.commit()
+        self._db.close()
+
+    def __enter__(self) -> "ResultCache":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
@@ -0,0 +1,258 @@
+"""
+Diagrama de Gantt con nivel de detalle para timelines muy grandes (requiere `numpy`;
+`matplotlib` solo para dibujar).
+
+En vez de dibujar un rectángulo por segmento, el timeline (start, end, pid) de los
+simulate_* se agrega en cubetas del ancho de un pixel. Por cubeta se calcula:
+  - el proceso dominante (el que más tiempo corrió en ella; -1 si la CPU estuvo libre)
+  - la utilización (tiempo ocupado / duración de la cubeta)
+  - los cambios de contexto (despachos de un proceso distinto al anterior)
+
+GanttPyramid precalcula una pirámide de resoluciones: el nivel 0 tiene cubetas finas
+calculadas exactamente y cada nivel siguiente junta pares de cubetas del anterior. Una
+consulta por ventana toma el nivel cuya cubeta cabe en un pixel y solo combina ~2 cubetas
+por pixel, así que hacer zoom en cualquier ventana no depende del número de segmentos.
+En niveles gruesos el resultado es aproximado: cada cubeta del nivel se asigna completa al
+pixel que contiene su centro (el error es de menos de un pixel) y el proceso dominante es
+el de la subcubeta con más tiempo. Con más detalle que el nivel 0 la agregación es exacta.
+"""
+import math
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+from src.cpu_scheduler import CompactTimeline, expand_rounds
+
+IDLE = -1
+
+Buckets = Dict[str, np.ndarray]
+
+def timeline_arrays(
+    timeline: Union[CompactTimeline, Sequence[tuple]],
+    quantum: Optional[int] = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Convierte un timeline en (starts, ends, jobs, labels): jobs son códigos 0..k-1 de
+    `labels` (los pids distintos) y IDLE para la CPU libre.
+
+    Los timelines de Round Robin con compress_rounds=True (pid como tupla de pids) se
+    expanden rebanada por rebanada con su `quantum`, que no se puede deducir del segmento.
+    """
+    if not isinstance(timeline, CompactTimeline) and any(isinstance(pid, tuple) for _, _, pid in timeline):
+        if quantum is None:
+            raise ValueError("El timeline tiene rondas comprimidas (compress_rounds=True): pasa su quantum")
+        timeline = expand_rounds(timeline, quantum)
+    if isinstance(timeline, CompactTimeline):
+        starts = np.frombuffer(timeline.starts, dtype=np.int64)
+        ends = np.frombuffer(timeline.ends, dtype=np.int64)
+        rows = np.frombuffer(timeline.jobs, dtype=np.int64)
+        busy = rows != CompactTimeline.IDLE
+        labels, codes = np.unique(np.asarray(timeline.pids)[rows[busy]], return_inverse=True)
+    else:
+        n = len(timeline)
+        starts = np.fromiter((start for start, _, _ in timeline), dtype=np.int64, count=n)
+        ends = np.fromiter((end for _, end, _ in timeline), dtype=np.int64, count=n)
+        busy = np.fromiter((pid is not None for _, _, pid in timeline), dtype=bool, count=n)
+        labels, codes = np.unique(np.asarray([pid for _, _, pid in timeline if pid is not None]), return_inverse=True)
+    jobs = np.full(len(starts), IDLE, dtype=np.int64)
+    jobs[busy] = codes.reshape(-1)
+    return starts, ends, jobs, labels
+
+def aggregate(starts: np.ndarray, ends: np.ndarray, jobs: np.ndarray, edges: np.ndarray) -> Buckets:
+    """
+    Agregación exacta de los segmentos ocupados (sin IDLE, ordenados) en las cubetas
+    [edges[i], edges[i+1]). Regresa busy, switches, dominant y dominant_time por cubeta.
+    Solo se recorren los segmentos que tocan la ventana.
+    """
+    m = len(edges) - 1
+
+    # Segmentos que tocan la ventana, recortados a ella
+    lo = np.searchsorted(ends, edges[0], side="right")
+    hi = np.searchsorted(starts, edges[-1], side="left")
+    s = np.maximum(starts[lo:hi], edges[0])
+    e = np.minimum(ends[lo:hi], edges[-1])
+    j = jobs[lo:hi]
+
+    # Cambio de contexto: un despacho de un proceso distinto al último que corrió
+    previous = jobs[lo - 1:hi - 1] if lo > 0 else np.r_[j[:1], j[:-1]]
+    switch_times = starts[lo:hi][j != previous]
+    switches = np.diff(np.searchsorted(switch_times, edges, side="left"))
+
+    b0 = np.clip(np.searchsorted(edges, s, side="right") - 1, 0, m - 1)
+    b1 = np.clip(np.searchsorted(edges, e, side="left") - 1, 0, m - 1)
+
+    # Cada segmento se parte en: pedazo en su primera cubeta, cubetas completas intermedias
+    # y pedazo en su última cubeta. Las intermedias suman a lo más m (los segmentos no se traslapan).
+    single = b0 == b1
+    multi = ~single
+    middle = np.maximum(b1[multi] - b0[multi] - 1, 0)
+    total = int(middle.sum())
+    offsets = np.repeat(np.cumsum(middle) - middle, middle)
+    middle_buckets = np.arange(total) - offsets + np.repeat(b0[multi] + 1, middle)
+
+    piece_bucket = np.concatenate([b0[single], b0[multi], b1[multi], middle_buckets])
+    piece_job = np.concatenate([j[single], j[multi], j[multi], np.repeat(j[multi], middle)])
+    piece_time = np.concatenate([
+        (e - s)[single],
+        edges[b0[multi] + 1] - s[multi],
+        e[multi] - edges[b1[multi]],
+        edges[middle_buckets + 1] - edges[middle_buckets],
+    ]).astype(np.float64)
+
+    busy = np.bincount(piece_bucket, weights=piece_time, minlength=m)
+
+    # Tiempo por (cubeta, proceso) y el proceso con más tiempo en cada cubeta
+    dominant = np.full(m, IDLE, dtype=np.int64)
+    dominant_time = np.zeros(m)
+    if len(piece_bucket):
+        order = np.lexsort((piece_job, piece_bucket))
+        pb, pj, pt = piece_bucket[order], piece_job[order], piece_time[order]
+        starts_of_group = np.flatnonzero(np.r_[True, (pb[1:] != pb[:-1]) | (pj[1:] != pj[:-1])])
+        gb, gj, gt = pb[starts_of_group], pj[starts_of_group], np.add.reduceat(pt, starts_of_group)
+        order = np.lexsort((gt, gb))
+        gb, gj, gt = gb[order], gj[order], gt[order]
+        last = np.flatnonzero(np.r_[gb[1:] != gb[:-1], True])
+        dominant[gb[last]] = gj[last]
+        dominant_time[gb[last]] = gt[last]
+
+    return {"busy": busy, "switches": switches, "dominant": dominant, "dominant_time": dominant_time}
+
+def _merge_pairs(level: Buckets) -> Buckets:
+    """Nivel siguiente de la pirámide: junta cubetas de dos en dos."""
+    n = len(level["busy"])
+    if n % 2:
+        level = {
+            key: np.concatenate([values, [IDLE if key == "dominant" else 0]]).astype(values.dtype)
+            for key, values in level.items()
+        }
+    dominant = level["dominant"].reshape(-1, 2)
+    dominant_time = level["dominant_time"].reshape(-1, 2)
+    pick = np.argmax(dominant_time, axis=1)
+    rows = np.arange(len(pick))
+    return {
+        "busy": level["busy"].reshape(-1, 2).sum(axis=1),
+        "switches": level["switches"].reshape(-1, 2).sum(axis=1),
+        "dominant": dominant[rows, pick],
+        "dominant_time": dominant_time[rows, pick],
+    }
+
+class GanttPyramid:
+    """
+    Pirámide de resoluciones de un timeline para dibujar cualquier ventana rápidamente.
+
+    `base_buckets` es el número de cubetas del nivel 0 (el más fino); las ventanas que
+    piden más detalle que el nivel 0 se agregan directamente de los segmentos. `quantum`
+    solo hace falta con timelines de rondas comprimidas (ver timeline_arrays).
+    """
+
+    def __init__(
+        self,
+        timeline: Union[CompactTimeline, Sequence[tuple]],
+        base_buckets: int = 2**20,
+        quantum: Optional[int] = None,
+    ) -> None:
+        starts, ends, jobs, self.labels = timeline_arrays(timeline, quantum)
+        if len(starts) == 0:
+            raise ValueError("El timeline está vacío")
+        self.t0 = int(starts[0])
+        self.t1 = int(ends[-1])
+        # Solo los segmentos ocupados; la CPU libre es lo que no cubren
+        busy = jobs != IDLE
+        self.starts, self.ends, self.jobs = starts[busy], ends[busy], jobs[busy]
+        self.bucket = max(1, math.ceil((self.t1 - self.t0) / base_buckets))
+
+        count = math.ceil((self.t1 - self.t0) / self.bucket)
+        edges = self.t0 + self.bucket * np.arange(count + 1, dtype=np.int64)
+        self.levels: List[Buckets] = [aggregate(self.starts, self.ends, self.jobs, edges)]
+        while len(self.levels[-1]["busy"]) > 1:
+            self.levels.append(_merge_pairs(self.levels[-1]))
+
+    def query(self, start: Optional[float] = None, end: Optional[float] = None, width: int = 1000) -> Buckets:
+        """
+        Agrega la ventana [start, end) en `width` pixeles. Regresa edges, utilization,
+        switches, switch_density (cambios por unidad de tiempo) y dominant (códigos de
+        `labels`, IDLE si no corrió nadie).
+        """
+        start = self.t0 if start is None else start
+        end = self.t1 if end is None else end
+        if end <= start or width <= 0:
+            raise ValueError("La ventana debe tener end > start y width > 0")
+        edges = np.linspace(start, end, width + 1)
+        pixel = (end - start) / width
+
+        if pixel < self.bucket:
+            # Más detalle que el nivel 0: la ventana es chica y se agrega de los segmentos
+            data = aggregate(self.starts, self.ends, self.jobs, edges)
+            length = np.full(width, pixel)
+        else:
+            k = min(int(math.log2(pixel / self.bucket)), len(self.levels) - 1)
+            level = self.levels[k]
+            size = self.bucket * 2**k
+            first = max(0, int((start - self.t0) // size))
+            last = min(len(level["busy"]), math.ceil((end - self.t0) / size))
+            centers = self.t0 + (np.arange(first, last) + 0.5) * size
+            px = np.clip(((centers - start) // pixel).astype(np.int64), 0, width - 1)
+
+            dominant_time = level["dominant_time"][first:last]
+            order = np.lexsort((dominant_time, px))
+            tail = order[np.flatnonzero(np.r_[px[order][1:] != px[order][:-1], True])]
+            dominant = np.full(width, IDLE, dtype=np.int64)
+            dominant[px[tail]] = level["dominant"][first:last][tail]
+            data = {
+                "busy": np.bincount(px, weights=level["busy"][first:last], minlength=width),
+                "switches": np.bincount(px, weights=level["switches"][first:last], minlength=width).astype(np.int64),
+                "dominant": dominant,
+            }
+            length = np.bincount(px, minlength=width) * float(size)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            utilization = np.where(length > 0, np.minimum(data["busy"] / length, 1.0), 0.0)
+        return {
+            "edges": edges,
+            "utilization": utilization,
+            "switches": data["switches"],
+            "switch_density": data["switches"] / pixel,
+            "dominant": data["dominant"],
+        }
+
+    def render(self, outfile: Union[str, Path], start: Optional[float] = None, end: Optional[float] = None, width: int = 1200, dpi: int = 100) -> Path:
+        """
+        Dibuja la ventana como Gantt de una fila (color = proceso dominante, intensidad =
+        utilización) con la utilización y la densidad de cambios de contexto debajo.
+        """
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+
+        data = self.query(start, end, width)
+        edges = data["edges"]
+        colors = plt.get_cmap("tab20")(np.maximum(data["dominant"], 0) % 20)
+        colors[:, 3] = data["utilization"]
+        colors[data["dominant"] == IDLE] = (1.0, 1.0, 1.0, 1.0)
+
+        fig, (gantt, util, switches) = plt.subplots(
+            3, 1, figsize=(width / dpi, 4), sharex=True, gridspec_kw={"height_ratios": [2, 1, 1]}
+        )
+        gantt.imshow(colors[np.newaxis], aspect="auto", extent=(edges[0], edges[-1], 0, 1), interpolation="nearest")
+        gantt.set_yticks([])
+        gantt.set_title("Proceso dominante por pixel")
+        centers = (edges[:-1] + edges[1:]) / 2
+        util.plot(centers, data["utilization"], linewidth=0.8)
+        util.set_ylim(0, 1.05)
+        util.set_ylabel("Utilización")
+        switches.plot(centers, data["switch_density"], linewidth=0.8, color="tab:red")
+        switches.set_ylabel("Cambios / t")
+        switches.set_xlabel("Tiempo")
+
+        fig.tight_layout()
+        outfile = Path(outfile)
+        outfile.parent.mkdir(parents=True, exist_ok=True)
+        fig.savefig(outfile, dpi=dpi)
+        plt.close(fig)
+        return outfile
+
+def pid_labels(pyramid: GanttPyramid, dominant: np.ndarray) -> List[Any]:
+    """Traduce los códigos de proceso dominante a pids (None = CPU libre)."""
+    labels = pyramid.labels.tolist()
+    return [None if code == IDLE else labels[code] for code in dominant.tolist()]
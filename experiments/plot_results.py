@@ -1,13 +1,42 @@
+import argparse
 import csv
+import hashlib
+import json
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-import matplotlib.pyplot as plt
 
 RESULTS_CSV = Path("data/results/summary.csv")
+RESULTS_STORE = Path("data/results/store")
 OUTPUT_DIR = Path("data/results/plots")
+PLOT_COLUMNS = ("scenario", "algorithm", "avg_waiting", "avg_turnaround", "avg_response")
+
+# Resolución normal y de vista previa rápida
+DPI = 200
+PREVIEW_DPI = 50
+# Archivo con el hash de los datos con que se dibujó cada gráfica
+HASHES_FILE = ".hashes.json"
+# Cambiar al modificar cómo se dibuja, para invalidar las gráficas anteriores
+PLOT_VERSION = 1
+
+METRICS = [
+    ("avg_waiting", "Tiempo de espera promedio"),
+    ("avg_turnaround", "Turnaround promedio"),
+    ("avg_response", "Tiempo de respuesta promedio"),
+]
 
 def load_results():
-    """Carga el summary.csv generado por run_experiments."""
+    """
+    Carga el resumen generado por run_experiments. Se lee directo del almacén columnar
+    (solo las columnas que se grafican); si no existe, se usa summary.csv. NumPy solo se
+    importa si hay almacén.
+    """
+    if Path(RESULTS_STORE).is_dir():
+        from experiments.result_store import ResultStore
+        store = ResultStore(RESULTS_STORE)
+        if store.has_summary():
+            return store.summary_rows(PLOT_COLUMNS)
+
     rows = []
     with RESULTS_CSV.open(newline="") as f:
         reader = csv.DictReader(f)
@@ -27,47 +56,102 @@ def group_by_scenario(rows):
         grouped[r["scenario"]].append(r)
     return grouped
 
-def plot_per_scenario(grouped):
+def scenario_hash(rows, dpi):
+    """Hash de las filas de un escenario (sin importar su orden) y de la resolución."""
+    content = {
+        "version": PLOT_VERSION,
+        "dpi": dpi,
+        "rows": sorted(
+            ([r["algorithm"]] + [r[key] for key, _ in METRICS] for r in rows),
+            key=lambda values: values[0],
+        ),
+    }
+    return hashlib.sha256(json.dumps(content).encode()).hexdigest()
+
+def render_scenario(scenario, rows, outfile, dpi=DPI):
     """
-    Para cada escenario genera una figura con tres gráficas de barras: espera, turnaround y respuesta promedio por algoritmo.
+    Dibuja la figura de un escenario: tres gráficas de barras con espera, turnaround y
+    respuesta promedio por algoritmo.
     """
+    # matplotlib se importa solo al dibujar: si ningún escenario cambió, no se carga
+    import matplotlib
+    matplotlib.use("Agg") # backend sin ventana: sirve en procesos del pool y en servidores
+    import matplotlib.pyplot as plt
+
+    # Ordenamos por nombre de algoritmo para que salgan siempre igual
+    rows = sorted(rows, key=lambda r: r["algorithm"])
+
+    algos = [r["algorithm"] for r in rows]
+    x = range(len(algos))
+
+    fig, axes = plt.subplots(1, 3, figsize=(12, 4))
 
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    for ax, (key, title) in zip(axes, METRICS):
+        values = [r[key] for r in rows]
+        ax.bar(x, values)
+        ax.set_xticks(list(x))
+        ax.set_xticklabels(algos, rotation=45, ha="right")
+        ax.set_title(title)
+        ax.set_ylabel("Tiempo")
 
-    metrics = [
-        ("avg_waiting", "Tiempo de espera promedio"),
-        ("avg_turnaround", "Turnaround promedio"),
-        ("avg_response", "Tiempo de respuesta promedio"),
-    ]
+    fig.suptitle(f"Escenario: {scenario}")
+    fig.tight_layout()
+    fig.savefig(outfile, dpi=dpi)
+    plt.close(fig)
+    return outfile
 
+def _render_task(task):
+    return render_scenario(*task)
+
+def plot_per_scenario(grouped, workers=1, preview=False, force=False, output_dir=None):
+    """
+    Genera una figura por escenario, solo para los escenarios cuyos datos cambiaron desde
+    la última vez (según el hash guardado en HASHES_FILE), salvo con force=True.
+
+    Las figuras se dibujan en un pool de `workers` procesos (None = todos los núcleos).
+    Con preview=True se dibujan a baja resolución en `plots/preview/`, sin tocar las
+    gráficas finales. Regresa la lista de archivos generados.
+    """
+    output_dir = Path(output_dir or OUTPUT_DIR)
+    dpi = DPI
+    if preview:
+        output_dir = output_dir / "preview"
+        dpi = PREVIEW_DPI
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    hashes_path = output_dir / HASHES_FILE
+    old_hashes = json.loads(hashes_path.read_text()) if hashes_path.exists() else {}
+    hashes = {}
+    tasks = []
     for scenario, rows in grouped.items():
-        # Ordenamos por nombre de algoritmo para que salgan siempre igual
-        rows = sorted(rows, key=lambda r: r["algorithm"])
-
-        algos = [r["algorithm"] for r in rows]
-        x = range(len(algos))
-
-        fig, axes = plt.subplots(1, 3, figsize=(12, 4))
-
-        for ax, (key, title) in zip(axes, metrics):
-            values = [r[key] for r in rows]
-            ax.bar(x, values)
-            ax.set_xticks(list(x))
-            ax.set_xticklabels(algos, rotation=45, ha="right")
-            ax.set_title(title)
-            ax.set_ylabel("Tiempo")
-
-        fig.suptitle(f"Escenario: {scenario}")
-        fig.tight_layout()
-        outfile = OUTPUT_DIR / f"{scenario}.png"
-        fig.savefig(outfile, dpi=200)
-        plt.close(fig)
+        hashes[scenario] = scenario_hash(rows, dpi)
+        outfile = output_dir / f"{scenario}.png"
+        if force or old_hashes.get(scenario) != hashes[scenario] or not outfile.exists():
+            tasks.append((scenario, rows, outfile, dpi))
+
+    if workers == 1 or len(tasks) <= 1:
+        written = [_render_task(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            written = list(pool.map(_render_task, tasks))
+
+    # Se conservan los hashes de escenarios que no están en esta corrida
+    hashes_path.write_text(json.dumps({**old_hashes, **hashes}, indent=2, sort_keys=True))
+    for outfile in written:
         print(f"Guardada gráfica: {outfile}")
+    print(f"{len(written)} gráficas generadas, {len(grouped) - len(written)} sin cambios")
+    return written
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Genera una gráfica por escenario a partir de los resultados.")
+    parser.add_argument("--workers", type=int, default=0, help="procesos para dibujar (0 = todos los núcleos)")
+    parser.add_argument("--preview", action="store_true", help=f"vista previa rápida a {PREVIEW_DPI} dpi en plots/preview/")
+    parser.add_argument("--force", action="store_true", help="redibuja todo aunque los datos no hayan cambiado")
+    args = parser.parse_args(argv)
 
-def main():
     rows = load_results()
     grouped = group_by_scenario(rows)
-    plot_per_scenario(grouped)
+    plot_per_scenario(grouped, workers=args.workers or None, preview=args.preview, force=args.force)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,99 @@
+"""
+Perfilado por celda de los experimentos (run_experiments.py --profile).
+
+Cada celda se ejecuta bajo cProfile y tracemalloc y se registra su tiempo de pared, su
+tiempo de CPU, el pico de memoria asignada durante la simulación y las funciones donde
+pasó más tiempo. Los perfiles se guardan en JSON junto a summary.csv.
+
+Ambos instrumentos vuelven más lenta la celda perfilada, así que los tiempos sirven para
+comparar celdas entre sí, no con una ejecución normal. Sin --profile nada de esto corre.
+"""
+import cProfile
+import json
+import pstats
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+DEFAULT_PROFILE_PATH = "data/results/profile.json"
+
+def _function_name(key: Tuple[str, int, str]) -> str:
+    filename, line, name = key
+    if filename == "~":
+        # Funciones de C: cProfile las reporta como "<built-in method ...>"
+        return name
+    return f"{Path(filename).name}:{line}({name})"
+
+def hot_functions(profiler: cProfile.Profile, top: int = 10) -> List[Dict[str, Any]]:
+    """Las `top` funciones con más tiempo propio (sin contar las que llaman)."""
+    stats = pstats.Stats(profiler).stats # {(archivo, línea, función): (cc, nc, tt, ct, llamadores)}
+    ranked = sorted(stats.items(), key=lambda item: item[1][2], reverse=True)
+    return [
+        {"function": _function_name(key), "calls": nc, "tottime": tt, "cumtime": ct}
+        for key, (_, nc, tt, ct, _) in ranked[:top]
+    ]
+
+def profile_call(fn: Callable[..., Any], *args: Any, top: int = 10) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Ejecuta fn(*args) bajo cProfile y tracemalloc. Regresa (resultado, perfil), donde el
+    perfil tiene wall_time y cpu_time (segundos), peak_memory (bytes asignados en el pico,
+    medido desde el inicio de la llamada) y hot_functions.
+    """
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    profiler = cProfile.Profile()
+
+    started = time.perf_counter()
+    cpu_started = time.process_time()
+    profiler.enable()
+    try:
+        result = fn(*args)
+    finally:
+        profiler.disable()
+        cpu_time = time.process_time() - cpu_started
+        wall_time = time.perf_counter() - started
+        peak = tracemalloc.get_traced_memory()[1]
+        if not tracing:
+            tracemalloc.stop()
+
+    return result, {
+        "wall_time": wall_time,
+        "cpu_time": cpu_time,
+        "peak_memory": peak - baseline,
+        "hot_functions": hot_functions(profiler, top),
+    }
+
+def save_profile(rows: List[Dict[str, Any]], path: str = DEFAULT_PROFILE_PATH) -> None:
+    """Guarda los perfiles de las filas (las que tienen "profile") como JSON."""
+    cells = [
+        {"scenario": r["scenario"], "algorithm": r["algorithm"], **r["profile"]}
+        for r in rows if r.get("profile") is not None
+    ]
+    out_path = Path(path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    with out_path.open("w", encoding="utf-8") as f:
+        json.dump({"cells": cells}, f, indent=2)
+    print(f"Perfiles guardados en {out_path}")
+
+def load_profile(path: str = DEFAULT_PROFILE_PATH) -> List[Dict[str, Any]]:
+    """Lee los perfiles guardados por save_profile."""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["cells"]
+
+def print_profile_report(rows: List[Dict[str, Any]], top: Optional[int] = 10) -> None:
+    """Imprime las celdas perfiladas de la más lenta a la más rápida, con su función más cara."""
+    profiled = [r for r in rows if r.get("profile") is not None]
+    ordered = sorted(profiled, key=lambda r: r["profile"]["wall_time"], reverse=True)
+    print("\nCeldas más lentas (perfiladas):")
+    print(f"  {'#':>3}  {'pared ms':>10}  {'CPU ms':>10}  {'pico MiB':>9}  celda / función más cara")
+    for rank, r in enumerate(ordered[:top], start=1):
+        profile = r["profile"]
+        hottest = profile["hot_functions"][0]["function"] if profile["hot_functions"] else "-"
+        print(
+            f"  {rank:>3}  {profile['wall_time'] * 1000:10.3f}  {profile['cpu_time'] * 1000:10.3f}  "
+            f"{profile['peak_memory'] / 2**20:9.2f}  {r['scenario']} / {r['algorithm']}  [{hottest}]"
+        )
@@ -0,0 +1,179 @@
+"""
+Almacén columnar de resultados de experimentos (requiere `numpy`).
+
+Estructura en disco:
+  <store>/summary/chunk-000000.npz    resumen por celda, en bloques de `chunk_rows` filas
+  <store>/cells/<key>/processes/*.npy métricas por proceso de una celda, un .npy por columna
+  <store>/cells/<key>/timeline/*.npy  timeline de una celda (start, end, pid; -1 = CPU libre)
+
+Las celdas se identifican con la misma llave que la caché (cell_key). El resumen se va
+agregando conforme terminan las celdas y los detalles se escriben en cuanto se calculan.
+Para leer no hace falta cargar todo: read_summary lee solo las columnas pedidas de cada
+bloque y read_detail abre los .npy mapeados en memoria.
+"""
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+
+from src.cpu_scheduler import CompactTimeline
+
+DEFAULT_STORE_PATH = Path("data/results/store")
+
+SUMMARY_COLUMNS = ("scenario", "algorithm", "key", "avg_waiting", "avg_turnaround", "avg_response", "wall_time", "cached")
+PROCESS_COLUMNS = ("pid", "arrival", "burst", "start", "completion", "waiting", "turnaround", "response")
+TIMELINE_COLUMNS = ("start", "end", "pid")
+DETAIL_TABLES = ("processes", "timeline")
+
+Detail = Dict[str, Dict[str, np.ndarray]]
+
+def _pid_column(pids: Sequence[Any]) -> np.ndarray:
+    """Columna de pids: int64 (CPU libre = -1) o texto si algún pid no es entero."""
+    if all(p is None or isinstance(p, int) for p in pids):
+        return np.fromiter((-1 if p is None else p for p in pids), dtype=np.int64, count=len(pids))
+    return np.array(["" if p is None else str(p) for p in pids])
+
+def detail_columns(result: Dict[str, Any]) -> Detail:
+    """Convierte "processes" y "timeline" de un resultado de simulate_* en columnas."""
+    processes = result.get("processes", [])
+    columns = {
+        name: np.fromiter((p[name] for p in processes), dtype=np.int64, count=len(processes))
+        for name in PROCESS_COLUMNS if name != "pid"
+    }
+    columns["pid"] = _pid_column([p["pid"] for p in processes])
+
+    timeline = result.get("timeline", [])
+    if isinstance(timeline, CompactTimeline):
+        jobs = np.frombuffer(timeline.jobs, dtype=np.int64)
+        pids = [None if job == CompactTimeline.IDLE else timeline.pids[job] for job in jobs.tolist()]
+        segments = {
+            "start": np.frombuffer(timeline.starts, dtype=np.int64).copy(),
+            "end": np.frombuffer(timeline.ends, dtype=np.int64).copy(),
+        }
+    else:
+        pids = [pid for _, _, pid in timeline]
+        segments = {
+            "start": np.fromiter((start for start, _, _ in timeline), dtype=np.int64, count=len(timeline)),
+            "end": np.fromiter((end for _, end, _ in timeline), dtype=np.int64, count=len(timeline)),
+        }
+    segments["pid"] = _pid_column(pids)
+    return {"processes": columns, "timeline": segments}
+
+class ResultStore:
+    """
+    Almacén columnar de resultados con escritura incremental.
+
+    append() agrega la fila de resumen de una celda (y, si se da, su detalle). Las filas se
+    escriben en bloques de `chunk_rows`; flush() (o cerrar el almacén) escribe el bloque
+    pendiente. Se puede usar como context manager.
+    """
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_STORE_PATH, chunk_rows: int = 256) -> None:
+        self.path = Path(path)
+        self.chunk_rows = chunk_rows
+        self._pending: List[Dict[str, Any]] = []
+        self._next_chunk = len(self._chunks())
+
+    def __enter__(self) -> "ResultStore":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _chunks(self) -> List[Path]:
+        return sorted((self.path / "summary").glob("chunk-*.npz"))
+
+    def _cell_dir(self, key: str) -> Path:
+        return self.path / "cells" / key
+
+    def has_detail(self, key: str) -> bool:
+        """True si ya están guardados los detalles de la celda."""
+        return all((self._cell_dir(key) / table).is_dir() for table in DETAIL_TABLES)
+
+    def has_summary(self) -> bool:
+        return bool(self._chunks())
+
+    def clear_summary(self) -> None:
+        """Borra el resumen (los detalles por celda se conservan)."""
+        for chunk in self._chunks():
+            chunk.unlink()
+        self._pending = []
+        self._next_chunk = 0
+
+    def append(self, row: Dict[str, Any], detail: Optional[Detail] = None) -> None:
+        """Agrega la fila de resumen de una celda y, opcionalmente, su detalle."""
+        if detail is not None:
+            self.write_detail(row["key"], detail)
+        self._pending.append(row)
+        if len(self._pending) >= self.chunk_rows:
+            self.flush()
+
+    def write_detail(self, key: str, detail: Detail) -> None:
+        """Escribe las columnas de detalle de una celda, reemplazando las anteriores."""
+        target = self._cell_dir(key)
+        tmp = target.with_name(target.name + ".tmp")
+        shutil.rmtree(tmp, ignore_errors=True)
+        for table, columns in detail.items():
+            (tmp / table).mkdir(parents=True)
+            for name, values in columns.items():
+                np.save(tmp / table / f"{name}.npy", values)
+        shutil.rmtree(target, ignore_errors=True)
+        os.replace(tmp, target)
+
+    def flush(self) -> None:
+        """Escribe las filas pendientes como un bloque nuevo del resumen."""
+        if not self._pending:
+            return
+        columns = {name: np.array([row[name] for row in self._pending]) for name in SUMMARY_COLUMNS}
+        directory = self.path / "summary"
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"chunk-{self._next_chunk:06d}.npz"
+        # Se escribe a un temporal y se renombra para que un lector nunca vea un bloque a medias
+        tmp = path.with_name(path.name + ".tmp")
+        with tmp.open("wb") as f:
+            np.savez(f, **columns)
+        os.replace(tmp, path)
+        self._next_chunk += 1
+        self._pending = []
+
+    def close(self) -> None:
+        self.flush()
+
+    def prune(self, keys: Iterable[str]) -> int:
+        """Borra los detalles de las celdas que no están en `keys`. Regresa cuántas borró."""
+        keep = set(keys)
+        removed = 0
+        cells = self.path / "cells"
+        if not cells.is_dir():
+            return 0
+        for cell in cells.iterdir():
+            if cell.name not in keep:
+                shutil.rmtree(cell)
+                removed += 1
+        return removed
+
+    def read_summary(self, columns: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+        """Lee el resumen completo; solo se descomprimen las columnas pedidas."""
+        names = tuple(columns or SUMMARY_COLUMNS)
+        parts: Dict[str, List[np.ndarray]] = {name: [] for name in names}
+        for chunk in self._chunks():
+            with np.load(chunk) as data:
+                for name in names:
+                    parts[name].append(data[name])
+        return {name: np.concatenate(values) if values else np.array([]) for name, values in parts.items()}
+
+    def summary_rows(self, columns: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        """El resumen como lista de filas (diccionarios con tipos de Python)."""
+        data = self.read_summary(columns)
+        names = list(data)
+        return [dict(zip(names, values)) for values in zip(*(data[name].tolist() for name in names))]
+
+    def read_detail(self, key: str, table: str = "processes", columns: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+        """Columnas de detalle de una celda, mapeadas en memoria (no se leen hasta usarlas)."""
+        if table not in DETAIL_TABLES:
+            raise ValueError(f"Tabla desconocida: {table} (opciones: {', '.join(DETAIL_TABLES)})")
+        names = columns or (PROCESS_COLUMNS if table == "processes" else TIMELINE_COLUMNS)
+        directory = self._cell_dir(key) / table
+        return {name: np.load(directory / f"{name}.npy", mmap_mode="r") for name in names}
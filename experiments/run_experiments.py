@@ -1,43 +1,166 @@
-from typing import Callable, List, Dict, Any
+from typing import TYPE_CHECKING, List, Dict, Any, Optional
+import argparse
 import csv
+import functools
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from src.cpu_scheduler import Process, simulate_fcfs, simulate_sjf, simulate_rr, simulate_srtf
+from src.cpu_scheduler import AlgorithmFn, ProcessTable, as_process_table, select_algorithms
 from experiments.scenarios import all_scenarios, Scenario
+from experiments.cache import ResultCache, cell_key
 
-AlgorithmFn = Callable[[List[Process]], Dict[str, Any]]
+STORE_PATH = Path("data/results/store")
+
+if TYPE_CHECKING:
+    # El almacén columnar requiere NumPy; solo se importa al usarlo
+    from experiments.result_store import ResultStore
 
 def get_algorithms() -> List[tuple[str, AlgorithmFn]]:
     """
-    Lista de algoritmos a comparar.
+    Lista de algoritmos a comparar: los DEFAULT_ALGORITHMS del registro de
+    src/cpu_scheduler.py (ahí se fijan sus parámetros con functools.partial).
+    """
+    return select_algorithms()
+
+# Una celda del grid: (escenario, nombre del algoritmo, algoritmo, carga como tabla columnar)
+Cell = tuple[str, str, AlgorithmFn, ProcessTable]
+
+# Métricas de cada fila que se guardan en la caché
+ROW_METRICS = ("avg_waiting", "avg_turnaround", "avg_response")
+
+def _grid_cells() -> List[Cell]:
+    """Celdas escenario × algoritmo en el orden en que se reportan."""
+    cells: List[Cell] = []
+    for scenario in all_scenarios():
+        # Una sola conversión a tabla columnar por escenario, compartida por todos los algoritmos
+        table = as_process_table(scenario.workload())
+        for name, fn in get_algorithms():
+            cells.append((scenario.name, name, fn, table))
+    return cells
+
+def _run_cell(cell: Cell, detail: bool = False, profile: bool = False) -> Dict[str, Any]:
     """
-    return [
-        ("FCFS", simulate_fcfs),
-        ("SJF", simulate_sjf),
-        ("SRTF", simulate_srtf),
-        ("RR_q2", lambda procs: simulate_rr(procs, quantum=2)),
-    ]
-
-def run_all_experiments() -> List[Dict[str, Any]]:
+    Ejecuta una celda y mide su tiempo de pared. Con detail=True la fila incluye además
+    "detail": las métricas por proceso y el timeline como columnas para el ResultStore.
+    Con profile=True la celda corre bajo cProfile y tracemalloc y la fila incluye
+    "profile" (ver experiments/profiling.py) con los contadores del simulador.
+    """
+    scenario_name, name, fn, table = cell
+
+    cell_profile = None
+    if profile:
+        # cProfile, pstats y tracemalloc solo se cargan al perfilar
+        from experiments.profiling import profile_call
+        result, cell_profile = profile_call(fn, table)
+        cell_profile["counters"] = result.get("counters")
+        wall_time = cell_profile["wall_time"]
+    else:
+        started = time.perf_counter()
+        result = fn(table)
+        wall_time = time.perf_counter() - started
+
+    row = {
+        "scenario": scenario_name,
+        "algorithm": name,
+        **{metric: result[metric] for metric in ROW_METRICS},
+        "wall_time": wall_time,
+        "cached": False,
+    }
+    if detail:
+        from experiments.result_store import detail_columns
+        row["detail"] = detail_columns(result)
+    if cell_profile is not None:
+        row["profile"] = cell_profile
+    return row
+
+def run_all_experiments(
+    workers: int = 1,
+    chunksize: int = 1,
+    cache: Optional[ResultCache] = None,
+    store: Optional["ResultStore"] = None,
+    profile: bool = False,
+) -> List[Dict[str, Any]]:
     """
     Ejecuta todos los algoritmos en todos los escenarios y regresa una lista de filas con métricas promedio.
+
+    Con workers > 1 (o workers=None para usar todos los núcleos) las celdas se reparten en un
+    pool de procesos en bloques de `chunksize`. Las filas siempre salen en el mismo orden que
+    en la ejecución serial, así que el CSV resultante es idéntico. Cada fila incluye además
+    "wall_time", el tiempo de pared de su celda en segundos.
+
+    Con una ResultCache solo se recalculan las celdas cuya carga, algoritmo, parámetros o
+    código del simulador cambiaron; las demás se leen de la caché ("cached" = True).
+
+    Con un ResultStore el resumen se reescribe conforme terminan las celdas (en el orden del
+    grid) y se guardan las métricas por proceso y el timeline de cada celda. Si la corrida se
+    interrumpe, las filas pendientes se escriben antes de salir. Una celda de la caché solo
+    se reutiliza si el almacén ya tiene su detalle.
+
+    Con profile=True todas las celdas se ejecutan (la caché solo se actualiza) bajo
+    cProfile y tracemalloc, y cada fila incluye "profile".
     """
-    rows: List[Dict[str, Any]] = []
+    cells = _grid_cells()
+    rows: List[Optional[Dict[str, Any]]] = [None] * len(cells)
+    keys: List[Optional[str]] = [None] * len(cells)
 
-    for scenario in all_scenarios():
-        for name, fn in get_algorithms():
-            result = fn(scenario.processes)
-            rows.append(
-                {
-                    "scenario": scenario.name,
-                    "algorithm": name,
-                    "avg_waiting": result["avg_waiting"],
-                    "avg_turnaround": result["avg_turnaround"],
-                    "avg_response": result["avg_response"],
-                }
-            )
+    pending: List[int] = []
+    for i, (scenario_name, name, fn, table) in enumerate(cells):
+        if cache is not None or store is not None:
+            keys[i] = cell_key(table, fn)
+        if cache is not None and not profile:
+            hit = cache.get(keys[i])
+            if hit is not None and (store is None or store.has_detail(keys[i])):
+                rows[i] = {"scenario": scenario_name, "algorithm": name, **hit, "wall_time": 0.0, "cached": True}
+                continue
+        pending.append(i)
+
+    if store is not None:
+        store.clear_summary()
+    written = 0
+
+    def write_ready() -> None:
+        # El resumen se escribe en el orden del grid: todas las filas listas desde la última escrita
+        nonlocal written
+        while written < len(rows) and rows[written] is not None:
+            store.append({**rows[written], "key": keys[written]})
+            written += 1
+
+    todo = [cells[i] for i in pending]
+    run_cell = functools.partial(_run_cell, detail=store is not None, profile=profile)
+    pool = ProcessPoolExecutor(max_workers=workers) if workers != 1 else None
+    try:
+        # map conserva el orden de entrada sin importar qué celda termine primero
+        computed = pool.map(run_cell, todo, chunksize=chunksize) if pool else map(run_cell, todo)
+        for i, row in zip(pending, computed):
+            detail = row.pop("detail", None)
+            rows[i] = row
+            if cache is not None:
+                cache.put(keys[i], {metric: row[metric] for metric in ROW_METRICS})
+            if store is not None:
+                store.write_detail(keys[i], detail)
+                write_ready()
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        if store is not None:
+            # También si la corrida se interrumpe: las celdas ya terminadas quedan en el resumen
+            write_ready()
+            store.flush()
+
+    if store is not None:
+        store.prune(keys)
 
     return rows
 
+def print_cell_times(rows: List[Dict[str, Any]], top: Optional[int] = 10) -> None:
+    """
+    Imprime las celdas más lentas según su tiempo de pared.
+    """
+    ordered = sorted(rows, key=lambda r: r["wall_time"], reverse=True)
+    print("\nCeldas más lentas:")
+    for r in ordered[:top]:
+        print(f"  {r['wall_time'] * 1000:10.3f} ms  {r['scenario']} / {r['algorithm']}")
+
 def print_markdown_table(rows: List[Dict[str, Any]]) -> None:
     """
     Utilidad para imprimir una tabla de resultados en formato Markdown
@@ -59,13 +182,56 @@ def save_csv(rows: List[Dict[str, Any]], path: str = "data/results/summary.csv")
 
     fieldnames = ["scenario", "algorithm", "avg_waiting", "avg_turnaround", "avg_response"]
     with out_path.open("w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        # Columnas extra (como wall_time) no van al resumen
+        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
         writer.writeheader()
         writer.writerows(rows)
 
     print(f"Resultados guardados en {out_path}")
 
-if __name__ == "__main__":
-    rows = run_all_experiments()
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Ejecuta todos los algoritmos en todos los escenarios.")
+    parser.add_argument("--workers", type=int, default=1, help="procesos en paralelo (0 = todos los núcleos)")
+    parser.add_argument("--chunksize", type=int, default=1, help="celdas por tarea enviada a cada proceso")
+    parser.add_argument("--timings", action="store_true", help="muestra las celdas más lentas")
+    parser.add_argument("--no-cache", action="store_true", help="recalcula todo sin leer ni escribir la caché")
+    parser.add_argument("--clear-cache", action="store_true", help="vacía la caché antes de ejecutar")
+    parser.add_argument("--no-store", action="store_true", help="no guarda resultados por proceso ni timelines")
+    parser.add_argument(
+        "--profile", action="store_true",
+        help="perfila cada celda (cProfile + tracemalloc) y guarda data/results/profile.json",
+    )
+    args = parser.parse_args(argv)
+
+    store = None
+    if not args.no_store:
+        from experiments.result_store import ResultStore
+        store = ResultStore(STORE_PATH)
+    elif STORE_PATH.is_dir():
+        # summary.csv se va a reescribir y plot_results prefiere el almacén: su resumen
+        # anterior ya no corresponde (los detalles por celda se conservan para la caché)
+        from experiments.result_store import ResultStore
+        ResultStore(STORE_PATH).clear_summary()
+    options = {"workers": args.workers or None, "chunksize": args.chunksize, "store": store, "profile": args.profile}
+    if args.no_cache:
+        rows = run_all_experiments(**options)
+    else:
+        with ResultCache() as cache:
+            if args.clear_cache:
+                cache.clear()
+            rows = run_all_experiments(cache=cache, **options)
+            hits = sum(1 for r in rows if r["cached"])
+            print(f"Caché: {hits} de {len(rows)} celdas reutilizadas")
+    if store is not None:
+        print(f"Resultados columnares en {store.path}")
     print_markdown_table(rows)
-    save_csv(rows)
\ No newline at end of file
+    if args.timings:
+        print_cell_times(rows)
+    save_csv(rows)
+    if args.profile:
+        from experiments.profiling import print_profile_report, save_profile
+        save_profile(rows)
+        print_profile_report(rows)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -1,16 +1,39 @@
 from dataclasses import dataclass
-from typing import List
-from src.cpu_scheduler import Process
+from pathlib import Path
+from typing import List, Optional, Union
+from src.cpu_scheduler import Process, Workload
+from src.traces import load_trace
 import random
 
 @dataclass
 class Scenario:
     """
     Modelo de escenario para la simulación de CPU.
+
+    La carga puede venir en `processes` o en un archivo de traza binaria (`trace`) que
+    se carga (mapeado en memoria) la primera vez que se pide con workload().
     """
     name: str
     description: str
-    processes: List[Process]
+    processes: Optional[Workload] = None # lista de Process o ProcessTable
+    trace: Optional[str] = None # ruta a una traza binaria (ver src/traces.py)
+
+    def workload(self) -> Workload:
+        """Regresa la carga del escenario, cargando la traza si hace falta."""
+        if self.processes is None:
+            if self.trace is None:
+                raise ValueError(f"El escenario {self.name} no tiene procesos ni traza")
+            self.processes = load_trace(self.trace)
+        return self.processes
+
+def scenario_from_trace(path: Union[str, Path], name: Optional[str] = None, description: Optional[str] = None) -> Scenario:
+    """Escenario que apunta a una traza binaria; el archivo no se abre hasta usarlo."""
+    path = Path(path)
+    return Scenario(
+        name=name or path.stem,
+        description=description or f"Traza binaria {path.name}.",
+        trace=str(path),
+    )
 
 def scenario_batch_jobs() -> Scenario:
     """
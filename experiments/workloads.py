@@ -0,0 +1,109 @@
+"""
+Generador vectorizado de cargas con distribuciones realistas, basado en numpy.random.Generator.
+
+Produce llegadas y ráfagas en bloque (millones de procesos en segundos) y es reproducible a
+partir de una semilla. Soporta:
+  - llegadas: Poisson (entre llegadas exponenciales), ráfagas de llegadas on/off y uniformes
+  - ráfagas de CPU: exponenciales, Pareto y lognormales (colas pesadas) y uniformes
+  - una utilización objetivo: la tasa de llegadas se ajusta para que
+    (suma de ráfagas) / (lapso de llegadas) ronde `utilization`.
+
+Requiere `numpy`.
+"""
+from typing import Any, Optional
+
+import numpy as np
+
+from src.cpu_scheduler import ProcessTable
+from experiments.scenarios import Scenario
+
+ARRIVAL_MODELS = ("poisson", "onoff", "uniform")
+BURST_MODELS = ("exponential", "pareto", "lognormal", "uniform")
+
+def _bursts(rng: np.random.Generator, n: int, model: str, mean: float, pareto_shape: float, lognormal_sigma: float, max_burst: int) -> np.ndarray:
+    """Ráfagas enteras >= 1 con la media pedida (antes de redondear hacia arriba)."""
+    if model == "exponential":
+        values = rng.exponential(mean, n)
+    elif model == "pareto":
+        if pareto_shape <= 1:
+            raise ValueError("pareto_shape debe ser mayor que 1 para que la media exista")
+        # Pareto clásica con mínimo xm: media = shape * xm / (shape - 1)
+        xm = mean * (pareto_shape - 1) / pareto_shape
+        values = (rng.pareto(pareto_shape, n) + 1) * xm
+    elif model == "lognormal":
+        mu = np.log(mean) - lognormal_sigma ** 2 / 2
+        values = rng.lognormal(mu, lognormal_sigma, n)
+    elif model == "uniform":
+        values = rng.uniform(1, 2 * mean - 1, n)
+    else:
+        raise ValueError(f"Modelo de ráfagas desconocido: {model} (opciones: {', '.join(BURST_MODELS)})")
+    return np.clip(np.ceil(values), 1, max_burst).astype(np.int64)
+
+def _arrivals(rng: np.random.Generator, n: int, model: str, mean_gap: float, onoff_size: float, onoff_share: float) -> np.ndarray:
+    """Tiempos de llegada enteros, ordenados, con separación media `mean_gap`."""
+    if model == "poisson":
+        gaps = rng.exponential(mean_gap, n)
+    elif model == "onoff":
+        # Periodos ON con llegadas frecuentes separados por periodos OFF sin llegadas.
+        # Cada llegada abre un periodo nuevo con probabilidad 1 / onoff_size; una fracción
+        # onoff_share del tiempo entre llegadas se va en los periodos OFF.
+        on_gap = (1 - onoff_share) * mean_gap
+        off_gap = onoff_share * mean_gap * onoff_size
+        new_period = rng.random(n) < 1 / onoff_size
+        gaps = rng.exponential(on_gap, n) + new_period * rng.exponential(off_gap, n)
+    elif model == "uniform":
+        return np.sort(rng.integers(0, max(1, int(mean_gap * n)), n))
+    else:
+        raise ValueError(f"Modelo de llegadas desconocido: {model} (opciones: {', '.join(ARRIVAL_MODELS)})")
+    gaps[0] = 0.0
+    return np.floor(np.cumsum(gaps)).astype(np.int64)
+
+def generate_arrays(
+    n: int,
+    seed: int = 0,
+    arrivals: str = "poisson",
+    bursts: str = "exponential",
+    utilization: float = 0.8,
+    mean_burst: float = 10.0,
+    pareto_shape: float = 1.5,
+    lognormal_sigma: float = 1.0,
+    onoff_size: float = 20.0,
+    onoff_share: float = 0.8,
+    max_burst: int = 10**12,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Genera (pid, arrival, burst) como arreglos int64, con pids 1..n y llegadas ordenadas.
+
+    La separación media entre llegadas se calcula con la media real de las ráfagas
+    generadas, así que la utilización obtenida queda cerca de `utilization` incluso con
+    colas pesadas.
+    """
+    if n <= 0:
+        raise ValueError("n debe ser positivo")
+    if not 0 < utilization:
+        raise ValueError("utilization debe ser positiva")
+
+    rng = np.random.default_rng(seed)
+    burst = _bursts(rng, n, bursts, mean_burst, pareto_shape, lognormal_sigma, max_burst)
+    mean_gap = float(burst.mean()) / utilization
+    arrival = _arrivals(rng, n, arrivals, mean_gap, onoff_size, onoff_share)
+    pid = np.arange(1, n + 1, dtype=np.int64)
+    return pid, arrival, burst
+
+def generate_workload(n: int, seed: int = 0, **options: Any) -> ProcessTable:
+    """
+    Como generate_arrays, pero regresa una ProcessTable lista para los simuladores. Las
+    llegadas ya salen ordenadas y los pids son crecientes, así que la tabla se marca como
+    ordered y los simuladores no la vuelven a ordenar.
+    """
+    pid, arrival, burst = generate_arrays(n, seed=seed, **options)
+    return ProcessTable(pid, arrival, burst, ordered=True)
+
+def generate_scenario(name: str, n: int, seed: int = 0, description: Optional[str] = None, **options: Any) -> Scenario:
+    """Escenario generado (con su carga como ProcessTable)."""
+    if description is None:
+        arrivals = options.get("arrivals", "poisson")
+        bursts = options.get("bursts", "exponential")
+        utilization = options.get("utilization", 0.8)
+        description = f"Carga generada: {n} procesos, llegadas {arrivals}, ráfagas {bursts}, utilización {utilization}."
+    return Scenario(name=name, description=description, processes=generate_workload(n, seed=seed, **options))
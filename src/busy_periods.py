@@ -0,0 +1,178 @@
+"""
+Descomposición en periodos de ocupación (busy periods) para simular una traza enorme en
+varios núcleos.
+
+Todos los algoritmos del simulador son conservativos en trabajo: nunca dejan la CPU libre
+si hay procesos listos. Por eso, cuando la CPU queda libre el sistema está vacío y cada
+periodo de ocupación se puede simular por separado. Las fronteras dependen solo de las
+llegadas y las ráfagas, así que se calculan una vez y sirven para cualquier algoritmo.
+"""
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from src.cpu_scheduler import MetricsAccumulator, ProcessTable, Workload, as_process_table
+
+AlgorithmFn = Callable[..., Dict[str, Any]]
+
+class BusyPeriods:
+    """
+    Carga ordenada por llegada y partida en periodos de ocupación.
+
+    - table: la carga ordenada por (arrival, pid)
+    - bounds: lista de (primera fila, fila final exclusiva, inicio, fin) por periodo
+    """
+
+    def __init__(self, processes: Workload) -> None:
+        table = as_process_table(processes)
+        order = table.arrival_order()
+        if order != list(range(len(order))):
+            table = _take(table, order)
+        self.table = table
+        self.bounds: List[tuple[int, int, int, int]] = []
+
+        arrival, burst = table.arrival, table.burst
+        first = 0
+        period_start = end = None
+        for k in range(len(arrival)):
+            a = arrival[k]
+            if end is None or a > end:
+                # La CPU queda libre antes de esta llegada: empieza otro periodo
+                if end is not None:
+                    self.bounds.append((first, k, period_start, end))
+                first = k
+                period_start = end = max(a, 0)
+            end += burst[k]
+        if end is not None:
+            self.bounds.append((first, len(arrival), period_start, end))
+
+    def __len__(self) -> int:
+        return len(self.bounds)
+
+    def period_table(self, i: int) -> ProcessTable:
+        """Subtabla con los procesos del periodo i."""
+        first, last = self.bounds[i][:2]
+        t = self.table
+        return ProcessTable(t.pid[first:last], t.arrival[first:last], t.burst[first:last], t.priority[first:last])
+
+def _take(table: ProcessTable, order: List[int]) -> ProcessTable:
+    """Reordena las filas de una tabla."""
+    pid = [table.pid[k] for k in order]
+    if isinstance(table.pid, array):
+        pid = array("q", pid)
+    return ProcessTable(
+        pid,
+        array("q", (table.arrival[k] for k in order)),
+        array("q", (table.burst[k] for k in order)),
+        array("q", (table.priority[k] for k in order)),
+    )
+
+def _simulate_chunk(algorithm: AlgorithmFn, tables: List[ProcessTable]) -> List[tuple[Any, List[Dict[str, Any]], MetricsAccumulator, str, Dict[str, Any]]]:
+    """Simula varios periodos seguidos en un proceso del pool."""
+    out = []
+    for table in tables:
+        result = algorithm(table)
+        accumulator = MetricsAccumulator()
+        for p in result["processes"]:
+            accumulator.add(p["arrival"], p["burst"], p["start"], p["completion"])
+        out.append((result["timeline"], result["processes"], accumulator, result["algorithm"], result["counters"]))
+    return out
+
+def _merge_counters(total: Dict[str, Any], part: Dict[str, Any]) -> None:
+    """Suma los contadores de un periodo (max_ready se combina con max)."""
+    for key, value in part.items():
+        if key == "max_ready":
+            total[key] = max(total[key], value)
+        elif key not in ("elapsed", "avg_ready"):
+            total[key] += value
+
+def _chunks(periods: BusyPeriods, target: int) -> List[List[int]]:
+    """Agrupa periodos consecutivos en bloques de alrededor de `target` procesos."""
+    chunks: List[List[int]] = []
+    current: List[int] = []
+    size = 0
+    for i, (first, last, _, _) in enumerate(periods.bounds):
+        current.append(i)
+        size += last - first
+        if size >= target:
+            chunks.append(current)
+            current, size = [], 0
+    if current:
+        chunks.append(current)
+    return chunks
+
+def simulate_busy_periods(
+    processes: Any,
+    algorithm: AlgorithmFn,
+    workers: Optional[int] = None,
+    chunk_processes: int = 10_000,
+) -> Dict[str, Any]:
+    """
+    Simula una carga periodo por periodo con cualquier simulate_* (o un functools.partial,
+    por ejemplo partial(simulate_rr, quantum=2)) y une los resultados.
+
+    `processes` puede ser una lista de Process, una ProcessTable o un BusyPeriods ya
+    calculado (para reutilizar las fronteras con varios algoritmos). Los periodos se
+    agrupan en bloques de unos `chunk_processes` procesos y se reparten en un pool de
+    `workers` procesos (workers=1 corre todo en este proceso).
+
+    El resultado tiene la forma de siempre; el timeline y las métricas coinciden con los
+    del algoritmo sobre toda la carga, y los procesos se reportan en orden de llegada.
+    Los contadores del kernel se suman periodo por periodo. Incluye además "busy_periods",
+    el número de periodos.
+    """
+    periods = processes if isinstance(processes, BusyPeriods) else BusyPeriods(processes)
+    chunks = _chunks(periods, chunk_processes)
+    tasks = [[periods.period_table(i) for i in chunk] for chunk in chunks]
+
+    if workers == 1:
+        done = [_simulate_chunk(algorithm, tables) for tables in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            done = list(pool.map(_simulate_chunk, [algorithm] * len(tasks), tasks))
+
+    timeline: List[Any] = []
+    processes_out: List[Dict[str, Any]] = []
+    accumulator = MetricsAccumulator()
+    counters: Dict[str, Any] = {}
+    name = None
+    origin = 0
+    previous_end: Optional[int] = None
+
+    results = (item for chunk in done for item in chunk)
+    for (_, _, start, end), (period_timeline, period_processes, period_metrics, name, period_counters) in zip(periods.bounds, results):
+        segments = list(period_timeline)
+        if previous_end is None:
+            counters = dict(period_counters)
+            origin = end - period_counters["elapsed"]
+        else:
+            # Cada periodo se simuló desde el tiempo 0: quitamos su hueco inicial y
+            # ponemos el hueco real desde el fin del periodo anterior
+            _merge_counters(counters, period_counters)
+            while segments and segments[0][2] is None:
+                gap_start, gap_end, _ = segments.pop(0)
+                counters["idle_periods"] -= 1
+                counters["idle_time"] -= gap_end - gap_start
+            if start > previous_end:
+                timeline.append((previous_end, start, None))
+                counters["idle_periods"] += 1
+                counters["idle_time"] += start - previous_end
+            # El primer despacho del periodo cambia de contexto desde el último del anterior
+            counters["context_switches"] += 1
+        timeline.extend(segments)
+        processes_out.extend(period_processes)
+        accumulator.merge(period_metrics)
+        previous_end = end
+
+    if previous_end is not None:
+        counters["elapsed"] = elapsed = previous_end - origin
+        counters["avg_ready"] = counters["ready_area"] / elapsed if elapsed > 0 else 0.0
+
+    return {
+        "algorithm": name,
+        "timeline": timeline,
+        "processes": processes_out,
+        **accumulator.summary(),
+        "counters": counters,
+        "busy_periods": len(periods),
+    }
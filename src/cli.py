@@ -0,0 +1,120 @@
+"""
+Línea de comandos única del simulador.
+
+    python3 -m src simulate [--algorithm RR_q4 ...] [--csv F | --trace F | --scenario NOMBRE]
+    python3 -m src compare  [--algorithm ...] [--csv F | --trace F | --scenario NOMBRE]
+    python3 -m src experiments [opciones de experiments.run_experiments]
+    python3 -m src plot        [opciones de experiments.plot_results]
+    python3 -m src bench       [opciones de experiments.bench]
+
+Este módulo solo importa la biblioteca estándar y el simulador; cada subcomando importa lo
+que necesita (NumPy, matplotlib, los experimentos) al ejecutarse, así que `simulate` y
+`compare` arrancan sin cargar dependencias pesadas. Los algoritmos se eligen por nombre del
+registro de src/cpu_scheduler.py (ALGORITHMS, más RR_q<quantum>).
+"""
+import argparse
+import importlib
+import json
+import sys
+from typing import Any, Dict, List, Optional
+
+from src.cpu_scheduler import (
+    ALGORITHMS,
+    DEFAULT_ALGORITHMS,
+    ProcessTable,
+    as_process_table,
+    compare_algorithms,
+    example_processes,
+    print_summary,
+    select_algorithms,
+    summary_options,
+)
+
+# Subcomandos que delegan en el main() de otro módulo, con sus propias opciones
+FORWARDED = {
+    "experiments": ("experiments.run_experiments", "ejecuta todos los algoritmos en todos los escenarios"),
+    "plot": ("experiments.plot_results", "genera las gráficas por escenario"),
+    "bench": ("experiments.bench", "benchmark de escalamiento de los algoritmos"),
+}
+
+def load_input(args: argparse.Namespace) -> ProcessTable:
+    """Carga de procesos según --csv, --trace o --scenario (por defecto, el ejemplo)."""
+    if args.trace:
+        from src.traces import load_trace
+        return load_trace(args.trace)
+    if args.csv:
+        from src.traces import read_csv_table
+        return read_csv_table(args.csv)
+    if args.scenario:
+        from experiments.scenarios import all_scenarios
+        scenarios = {scenario.name: scenario for scenario in all_scenarios()}
+        if args.scenario not in scenarios:
+            raise SystemExit(f"Escenario desconocido: {args.scenario} (opciones: {', '.join(scenarios)})")
+        return as_process_table(scenarios[args.scenario].workload())
+    return as_process_table(example_processes())
+
+def _algorithms(args: argparse.Namespace) -> List[str]:
+    names = args.algorithm or list(DEFAULT_ALGORITHMS)
+    try:
+        select_algorithms(names)
+    except ValueError as e:
+        raise SystemExit(str(e))
+    return names
+
+def cmd_simulate(args: argparse.Namespace) -> None:
+    table = load_input(args)
+    # Sin timeline no hace falta guardarlo segmento por segmento ni reportar cada proceso
+    summary_only = args.json or args.no_timeline
+    for name, fn in select_algorithms(_algorithms(args)):
+        options = summary_options(fn) if summary_only else {"per_process": False}
+        result = fn(table, **options)
+        if args.json:
+            summary: Dict[str, Any] = {"name": name, "algorithm": result["algorithm"], "processes": len(table)}
+            summary.update((key, value) for key, value in result.items() if key not in ("algorithm", "timeline"))
+            print(json.dumps(summary))
+        else:
+            print_summary(name, result, timeline=not args.no_timeline)
+
+def cmd_compare(args: argparse.Namespace) -> None:
+    compare_algorithms(load_input(args), _algorithms(args))
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python3 -m src", description="Simulador de planificación de CPU.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    inputs = argparse.ArgumentParser(add_help=False)
+    inputs.add_argument(
+        "--algorithm", action="append",
+        help=f"algoritmo del registro (repetible; por defecto {', '.join(DEFAULT_ALGORITHMS)}). "
+             f"Opciones: {', '.join(ALGORITHMS)}, RR_q<quantum>",
+    )
+    source = inputs.add_mutually_exclusive_group()
+    source.add_argument("--csv", help="CSV con columnas pid, arrival, burst[, priority]")
+    source.add_argument("--trace", help="traza binaria (ver src/traces.py)")
+    source.add_argument("--scenario", help="escenario de experiments/scenarios.py")
+
+    simulate = commands.add_parser("simulate", parents=[inputs], help="simula y muestra promedios y timeline")
+    simulate.add_argument("--no-timeline", action="store_true", help="solo promedios")
+    simulate.add_argument("--json", action="store_true", help="una línea JSON por algoritmo (métricas y contadores)")
+    simulate.set_defaults(handler=cmd_simulate)
+
+    compare = commands.add_parser("compare", parents=[inputs], help="ranking de algoritmos por métrica")
+    compare.set_defaults(handler=cmd_compare)
+
+    for name, (_, help_text) in FORWARDED.items():
+        # Sin ayuda propia: --help y las demás opciones llegan al módulo
+        commands.add_parser(name, help=help_text, add_help=False)
+    return parser
+
+def main(argv: Optional[List[str]] = None) -> None:
+    argv = sys.argv[1:] if argv is None else list(argv)
+    parser = build_parser()
+    if argv and argv[0] in FORWARDED:
+        module = importlib.import_module(FORWARDED[argv[0]][0])
+        module.main(argv[1:])
+        return
+    args = parser.parse_args(argv)
+    args.handler(args)
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,15 @@
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Callable, Optional, Iterable, Iterator, Sequence, Union
 from collections import deque
-
-@dataclass
+from array import array
+from bisect import bisect_left, bisect_right
+import copy
+import functools
+import heapq
+import math
+import pickle
+
+@dataclass(slots=True)
 class Process:
     """
     Modelo de proceso para la simulación de CPU.
@@ -20,276 +27,1658 @@ class Process:
         # Al inicio, todo el burst está pendiente
         self.remaining = self.burst
 
-def compute_metrics(processes: List[Process]) -> Dict[str, Any]:
+def _int_column(values: Any) -> array:
     """
-    Funcion para calcular metricas de los procesos a partir de su start_time y completion_time.
-    Calcula waiting, turnaround y response, y también los promedios.
+    Convierte una secuencia de enteros en un array('q'). Si ya lo es se comparte sin copiar,
+    y los buffers contiguos de 64 bits (por ejemplo arreglos de NumPy) se copian en bloque.
+    Un memoryview de formato 'q' (por ejemplo sobre un archivo mapeado en memoria) también
+    se comparte sin copiar.
+    """
+    if isinstance(values, array) and values.typecode == "q":
+        return values
+    if isinstance(values, memoryview) and values.format == "q":
+        return values
+    try:
+        view = memoryview(values)
+    except TypeError:
+        return array("q", values)
+    if view.itemsize == 8 and view.format in ("q", "l") and view.c_contiguous:
+        column = array("q")
+        column.frombytes(view.cast("B"))
+        return column
+    return array("q", view.tolist())
+
+class ProcessTable:
+    """
+    Tabla columnar de procesos (struct-of-arrays).
+
+    Guarda pid, arrival, burst y priority en arreglos compactos array('q') en vez de un
+    objeto Process por proceso. Si algún pid no es entero, la columna pid queda como lista.
+    Los simuladores la aceptan directamente y guardan su estado mutable (start, completion,
+    remaining) en arreglos nuevos, así que la tabla nunca se copia ni se modifica.
+    Con ordered=True quien construye la tabla garantiza que las filas ya vienen ordenadas
+    por (arrival, pid), y arrival_order no necesita ordenar.
+    """
+    __slots__ = ("pid", "arrival", "burst", "priority", "ordered")
+
+    def __init__(self, pid: Any, arrival: Any, burst: Any, priority: Any = None, ordered: bool = False) -> None:
+        if isinstance(pid, list) and not all(type(x) is int for x in pid):
+            self.pid: Union[array, List[Any]] = pid
+        else:
+            self.pid = _int_column(pid)
+        self.arrival = _int_column(arrival)
+        self.burst = _int_column(burst)
+        if priority is None:
+            self.priority = array("q", bytes(8 * len(self.arrival)))
+        else:
+            self.priority = _int_column(priority)
+        self.ordered = ordered
+
+        n = len(self.pid)
+        if not (len(self.arrival) == len(self.burst) == len(self.priority) == n):
+            raise ValueError("Todas las columnas deben tener el mismo tamaño")
+
+    @classmethod
+    def from_processes(cls, processes: Iterable[Process]) -> "ProcessTable":
+        """Conversión barata desde una lista de Process (solo se leen los campos de entrada)."""
+        processes = list(processes)
+        return cls(
+            [p.pid for p in processes],
+            [p.arrival for p in processes],
+            [p.burst for p in processes],
+            [p.priority for p in processes],
+        )
+
+    def __len__(self) -> int:
+        return len(self.arrival)
+
+    def __iter__(self) -> Iterator[tuple[Any, int, int, int]]:
+        """Filas (pid, arrival, burst, priority) en el orden de la tabla (ver arrival_order)."""
+        return zip(self.pid, self.arrival, self.burst, self.priority)
+
+    def __reduce__(self) -> tuple:
+        # Las columnas mapeadas en memoria (memoryview) no se pueden serializar: se copian a array('q')
+        columns = tuple(
+            array("q", column.tobytes()) if isinstance(column, memoryview) else column
+            for column in (self.pid, self.arrival, self.burst, self.priority)
+        )
+        return (self.__class__, columns + (self.ordered,))
+
+    def arrival_order(self) -> List[int]:
+        """Índices de las filas en orden de llegada; los empates se ordenan por pid y luego por fila."""
+        pid, arrival = self.pid, self.arrival
+        if self.ordered:
+            return list(range(len(arrival)))
+        return sorted(range(len(arrival)), key=lambda k: (arrival[k], pid[k]))
+
+    def to_processes(self) -> List[Process]:
+        """Regresa la tabla como lista de Process."""
+        return [
+            Process(pid=pid, arrival=arrival, burst=burst, priority=priority)
+            for pid, arrival, burst, priority in self
+        ]
+
+Workload = Union[List[Process], ProcessTable]
+
+def as_process_table(processes: Workload) -> ProcessTable:
+    """Regresa la carga como ProcessTable, convirtiendo una lista de Process si hace falta."""
+    if isinstance(processes, ProcessTable):
+        return processes
+    return ProcessTable.from_processes(processes)
+
+class Histogram:
+    """
+    Histograma de cubetas fijas para percentiles en una sola pasada y con memoria acotada.
+
+    Los valores se guardan en cubetas logarítmicas con error relativo de a lo más
+    `relative_accuracy` (como DDSketch). Con integer=True los enteros menores a
+    `exact_limit` tienen su propia cubeta exacta, así que en cargas chicas los percentiles
+    son exactos. Dos histogramas con los mismos parámetros se combinan sumando cubetas
+    (merge), lo que sirve para ejecuciones en streaming y en paralelo.
+    """
+    __slots__ = ("integer", "exact_limit", "_log_gamma", "_gamma", "exact", "buckets", "count", "min", "max")
+
+    def __init__(self, integer: bool = True, relative_accuracy: float = 0.01, exact_limit: int = 2048) -> None:
+        self.integer = integer
+        self.exact_limit = exact_limit if integer else 0
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.exact: Dict[Any, int] = {} # valor -> conteo (enteros chicos y valores <= 0)
+        self.buckets: Dict[int, int] = {} # índice logarítmico -> conteo
+        self.count = 0
+        self.min: Any = None
+        self.max: Any = None
+
+    def add(self, value: Any) -> None:
+        if self.count == 0:
+            self.min = self.max = value
+        elif value > self.max:
+            self.max = value
+        elif value < self.min:
+            self.min = value
+        self.count += 1
+
+        if value < self.exact_limit or value <= 0:
+            exact = self.exact
+            exact[value] = exact.get(value, 0) + 1
+        else:
+            buckets = self.buckets
+            index = math.ceil(math.log(value) / self._log_gamma)
+            buckets[index] = buckets.get(index, 0) + 1
+
+    def merge(self, other: "Histogram") -> None:
+        """Suma las cubetas de otro histograma con los mismos parámetros."""
+        if other.count == 0:
+            return
+        for value, count in other.exact.items():
+            self.exact[value] = self.exact.get(value, 0) + count
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.count += other.count
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        self.min = other.min if self.min is None else min(self.min, other.min)
+
+    def quantile(self, q: float) -> Any:
+        """Percentil por rango más cercano (q entre 0 y 1). Regresa None si no hay datos."""
+        if self.count == 0:
+            return None
+        rank = max(1, math.ceil(q * self.count))
+
+        # Todas las cubetas exactas son menores que las logarítmicas
+        seen = 0
+        for value in sorted(self.exact):
+            seen += self.exact[value]
+            if seen >= rank:
+                return value
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                value = 2 * self._gamma ** index / (self._gamma + 1)
+                if self.integer:
+                    value = round(value)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+# Métricas que se resumen con percentiles
+DISTRIBUTION_METRICS = ("waiting", "turnaround", "response", "slowdown")
+PERCENTILES = ((50, 0.50), (90, 0.90), (99, 0.99))
+
+class MetricsAccumulator:
+    """
+    Acumula las métricas de los procesos en una sola pasada y con memoria acotada:
+    sumas para los promedios e histogramas para P50/P90/P99 y el máximo.
+
+    El slowdown es turnaround / burst (con burst de al menos 1). Los acumuladores se
+    pueden combinar con merge, por ejemplo al juntar resultados de varios procesos.
+    """
+    __slots__ = ("count", "totals", "histograms")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.totals = {name: 0 for name in DISTRIBUTION_METRICS}
+        self.histograms = {name: Histogram(integer=name != "slowdown") for name in DISTRIBUTION_METRICS}
+
+    def add(self, arrival: int, burst: int, start: int, completion: int) -> tuple[int, int, int]:
+        """Registra un proceso terminado y regresa su (waiting, turnaround, response)."""
+        turnaround = completion - arrival # T_i
+        waiting = turnaround - burst # W_i
+        response = start - arrival # R_i
+        slowdown = turnaround / max(burst, 1)
+
+        self.count += 1
+        totals, histograms = self.totals, self.histograms
+        totals["waiting"] += waiting
+        totals["turnaround"] += turnaround
+        totals["response"] += response
+        totals["slowdown"] += slowdown
+        histograms["waiting"].add(waiting)
+        histograms["turnaround"].add(turnaround)
+        histograms["response"].add(response)
+        histograms["slowdown"].add(slowdown)
+        return waiting, turnaround, response
+
+    def merge(self, other: "MetricsAccumulator") -> None:
+        self.count += other.count
+        for name in DISTRIBUTION_METRICS:
+            self.totals[name] += other.totals[name]
+            self.histograms[name].merge(other.histograms[name])
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Regresa avg_<métrica> y, para cada métrica, p50_<métrica>, p90_<métrica>,
+        p99_<métrica> y max_<métrica>. Sin procesos, los promedios son 0.0 y los
+        percentiles y máximos None.
+        """
+        n = self.count
+        out: Dict[str, Any] = {
+            f"avg_{name}": self.totals[name] / n if n else 0.0
+            for name in DISTRIBUTION_METRICS
+        }
+        for name in DISTRIBUTION_METRICS:
+            histogram = self.histograms[name]
+            for label, q in PERCENTILES:
+                out[f"p{label}_{name}"] = histogram.quantile(q)
+            out[f"max_{name}"] = histogram.max
+        return out
+
+def _metrics_from_columns(
+    pids: Sequence[Any],
+    arrivals: Sequence[int],
+    bursts: Sequence[int],
+    starts: Sequence[int],
+    completions: Sequence[int],
+    order: Iterable[int],
+    per_process: bool = True,
+    folded: Optional[MetricsAccumulator] = None,
+) -> Dict[str, Any]:
+    """
+    Calcula las métricas a partir de columnas, recorriendo los índices en el orden dado.
+    Con per_process=False no se construye la lista de diccionarios por proceso. `folded`
+    son procesos ya acumulados (sin filas) que se suman a los resúmenes.
     """
     results = []
-    total_wait = total_turn = total_resp = 0
-
-    for p in processes:
-        turnaround = p.completion_time - p.arrival # T_i
-        waiting = turnaround - p.burst # W_i
-        response = p.start_time - p.arrival # R_i
-
-        total_wait += waiting
-        total_turn += turnaround
-        total_resp += response
-
-        results.append({
-            "pid": p.pid,
-            "arrival": p.arrival,
-            "burst": p.burst,
-            "start": p.start_time,
-            "completion": p.completion_time,
-            "waiting": waiting,
-            "turnaround": turnaround,
-            "response": response,
-        })
-
-    n = len(processes)
-    return {
-        "processes": results,
-        "avg_waiting": total_wait / n,
-        "avg_turnaround": total_turn / n,
-        "avg_response": total_resp / n,
-    }
-
-def simulate_fcfs(original: List[Process]) -> Dict[str, Any]:
+    accumulator = MetricsAccumulator()
+    if folded is not None:
+        accumulator.merge(folded)
+
+    for k in order:
+        waiting, turnaround, response = accumulator.add(arrivals[k], bursts[k], starts[k], completions[k])
+
+        if per_process:
+            results.append({
+                "pid": pids[k],
+                "arrival": arrivals[k],
+                "burst": bursts[k],
+                "start": starts[k],
+                "completion": completions[k],
+                "waiting": waiting,
+                "turnaround": turnaround,
+                "response": response,
+            })
+
+    summary = accumulator.summary()
+    if not per_process:
+        return summary
+    return {"processes": results, **summary}
+
+def compute_metrics(processes: List[Process], per_process: bool = True) -> Dict[str, Any]:
     """
-    Simula el algoritmo de planificación FIRST-COME, FIRST-SERVED.
+    Funcion para calcular metricas de los procesos a partir de su start_time y completion_time.
+    Calcula waiting, turnaround y response, y también los promedios, percentiles
+    (P50/P90/P99), máximos y el slowdown.
 
-    Regresa:
-      - algorithm: nombre del algoritmo
-      - timeline: lista de segmentos (inicio, fin, pid | None)
-      - processes: métricas por proceso
-      - avg_waiting, avg_turnaround, avg_response
+    Con per_process=False se omite la lista "processes" cuando solo interesan los resúmenes.
     """
+    return _metrics_from_columns(
+        [p.pid for p in processes],
+        [p.arrival for p in processes],
+        [p.burst for p in processes],
+        [p.start_time for p in processes],
+        [p.completion_time for p in processes],
+        range(len(processes)),
+        per_process,
+    )
+
+class CompactTimeline:
+    """
+    Timeline compacto: tres arreglos paralelos array('q') (inicio, fin, job) en vez de una
+    lista de tuplas. Los segmentos contiguos del mismo proceso se fusionan y la CPU libre
+    se codifica con el job IDLE (-1). Los jobs se traducen a pid con la columna `pids`.
+
+    Se itera como la lista de siempre, con tuplas (inicio, fin, pid | None), así que
+    print_results y el resto del código lo pueden usar igual. Además permite preguntar
+    quién corría en un instante en O(log n) (at) y recortar por ventana de tiempo (window).
+    """
+    __slots__ = ("starts", "ends", "jobs", "pids")
+    IDLE = -1
+
+    def __init__(self, pids: Sequence[Any]) -> None:
+        self.starts = array("q")
+        self.ends = array("q")
+        self.jobs = array("q")
+        self.pids = pids
+
+    def add(self, start: int, end: int, job: int) -> None:
+        """Agrega un segmento; si continúa al último segmento del mismo job, lo extiende."""
+        if self.jobs and self.jobs[-1] == job and self.ends[-1] == start:
+            self.ends[-1] = end
+            return
+        self.starts.append(start)
+        self.ends.append(end)
+        self.jobs.append(job)
+
+    def _segment(self, i: int) -> tuple[int, int, Any]:
+        job = self.jobs[i]
+        return self.starts[i], self.ends[i], None if job == self.IDLE else self.pids[job]
+
+    def __len__(self) -> int:
+        return len(self.jobs)
+
+    def __iter__(self) -> Iterator[tuple[int, int, Any]]:
+        pids, idle = self.pids, self.IDLE
+        for start, end, job in zip(self.starts, self.ends, self.jobs):
+            yield start, end, None if job == idle else pids[job]
+
+    def __getitem__(self, i: Any) -> Any:
+        if isinstance(i, slice):
+            return [self._segment(k) for k in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("índice fuera del timeline")
+        return self._segment(i)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (CompactTimeline, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"CompactTimeline({list(self)!r})"
+
+    def at(self, time: int) -> Any:
+        """pid que corría en `time` (None si la CPU estaba libre o el instante cae fuera del timeline)."""
+        i = bisect_right(self.starts, time) - 1
+        if i < 0 or time >= self.ends[i]:
+            return None
+        job = self.jobs[i]
+        return None if job == self.IDLE else self.pids[job]
+
+    def window(self, start: int, end: int) -> "CompactTimeline":
+        """Segmentos dentro de [start, end), recortados a la ventana."""
+        out = CompactTimeline(self.pids)
+        first = max(bisect_right(self.ends, start), 0)
+        last = bisect_left(self.starts, end)
+        for i in range(first, last):
+            out.add(max(self.starts[i], start), min(self.ends[i], end), self.jobs[i])
+        return out
+
+# Tipos de evento del kernel. A tiempos iguales se procesan en este orden:
+# primero el fin del despacho actual, después las llegadas y al final el timer de la política.
+_COMPLETION = 0
+_QUANTUM = 1
+_ARRIVAL = 2
+_TIMER = 3
+
+class SchedulingPolicy:
+    """
+    Interfaz de una política de planificación para el kernel de eventos (Simulator).
+
+    El kernel identifica cada proceso con un entero (job), que es su fila en la tabla de
+    entrada, y expone sus datos como columnas: sim.pid[job], sim.arrival[job], sim.burst[job],
+    sim.priority[job] y sim.remaining[job]. El tiempo actual está en sim.time.
+
+    - on_arrival: el proceso acaba de llegar y está listo.
+    - pick_next: regresa el siguiente job a ejecutar, sacándolo de la cola (None si no hay listos).
+    - on_preempt: el proceso dejó la CPU sin terminar y vuelve a estar listo. Con una
+      política expulsiva, el kernel también lo llama para volver a decidir (después de una
+      llegada o del timer); si pick_next regresa el mismo job, este sigue en la CPU.
+    - time_slice: tiempo máximo del despacho de `job` que se acaba de elegir (por
+      defecto `quantum`; None = hasta terminar).
+    - on_timer: se llama cada `timer` unidades de tiempo (en los múltiplos de `timer`)
+      mientras la CPU está ocupada; después el kernel vuelve a decidir como en una llegada.
+    - drain: saca todos los listos en el orden en que se despacharían; el kernel lo usa
+      para pasarlos a otra política (Simulator.switch_policy).
+
+    Si skip_rounds es True, la política debe ser una rotación FIFO con quantum fijo y
+    exponer su cola en `ready`; el kernel puede entonces saltar rondas completas de un
+    solo golpe mientras no haya llegadas ni terminaciones.
+    """
+    name = "Policy"
+    preemptive = False # si es True, cada llegada puede expulsar al proceso en CPU
+    quantum: Optional[int] = None # tiempo máximo por despacho (None = sin límite)
+    skip_rounds = False # rotación FIFO cuyas rondas completas se pueden calcular analíticamente
+    compress_rounds = False # guarda las rondas saltadas como un solo segmento
+    timer: Optional[int] = None # intervalo de on_timer (None = sin timer)
+
+    def on_arrival(self, sim: "Simulator", job: int) -> None:
+        raise NotImplementedError
+
+    def pick_next(self, sim: "Simulator") -> Optional[int]:
+        raise NotImplementedError
 
-    # Creamos una copia para no modificar la lista original y ordenamos por tiempo de llegada
-    processes = [Process(pid=p.pid, arrival=p.arrival, burst=p.burst, priority=p.priority) for p in original]
-    processes = sorted(processes, key=lambda p: (p.arrival, p.pid))
+    def on_preempt(self, sim: "Simulator", job: int) -> None:
+        # Por defecto un proceso expulsado se trata como una nueva llegada
+        self.on_arrival(sim, job)
 
-    time = 0
-    timeline: List[tuple[int, int, Optional[int]]] = []
+    def time_slice(self, sim: "Simulator", job: int) -> Optional[int]:
+        return self.quantum
 
-    for p in processes:
-        # Verificamos si la CPU está libre hasta que llegua el proceso
-        if time < p.arrival:
-            timeline.append((time, p.arrival, None)) 
-            time = p.arrival
+    def on_timer(self, sim: "Simulator") -> None:
+        pass
 
-        p.start_time = time
-        time += p.burst
-        p.completion_time = time
-        timeline.append((p.start_time, p.completion_time, p.pid))
+    def drain(self, sim: "Simulator") -> List[int]:
+        jobs = []
+        job = self.pick_next(sim)
+        while job is not None:
+            jobs.append(job)
+            job = self.pick_next(sim)
+        return jobs
 
-    metrics = compute_metrics(processes)
+class FCFSPolicy(SchedulingPolicy):
+    """FIRST-COME, FIRST-SERVED: cola FIFO, no expulsiva."""
+    name = "FCFS"
 
-    return {
-        "algorithm": "FCFS",
-        "timeline": timeline,
-        **metrics,
-    }
+    def __init__(self) -> None:
+        self.ready: deque[int] = deque()
 
-def simulate_sjf(original: List[Process]) -> Dict[str, Any]:
+    def on_arrival(self, sim: "Simulator", job: int) -> None:
+        self.ready.append(job)
+
+    def pick_next(self, sim: "Simulator") -> Optional[int]:
+        return self.ready.popleft() if self.ready else None
+
+class SJFPolicy(SchedulingPolicy):
+    """SHORTEST JOB FIRST no expulsiva: montículo con llave (burst, arrival, pid, job)."""
+    name = "SJF (non-preemptive)"
+
+    def __init__(self) -> None:
+        self.ready: List[tuple[int, int, Any, int]] = []
+
+    def on_arrival(self, sim: "Simulator", job: int) -> None:
+        heapq.heappush(self.ready, (sim.burst[job], sim.arrival[job], sim.pid[job], job))
+
+    def pick_next(self, sim: "Simulator") -> Optional[int]:
+        return heapq.heappop(self.ready)[3] if self.ready else None
+
+class SRTFPolicy(SJFPolicy):
+    """SHORTEST REMAINING TIME FIRST: montículo con llave (remaining, arrival, pid, job), expulsiva."""
+    name = "SRTF"
+    preemptive = True
+
+    def on_arrival(self, sim: "Simulator", job: int) -> None:
+        heapq.heappush(self.ready, (sim.remaining[job], sim.arrival[job], sim.pid[job], job))
+
+class RoundRobinPolicy(FCFSPolicy):
     """
-    Simula planificación SHORTEST JOB FIRST no expulsiva.
+    ROUND ROBIN: cola FIFO circular con quantum fijo.
 
-    Regresa:
-      - algorithm: nombre del algoritmo
-      - timeline: lista de segmentos (inicio, fin, pid | None)
-      - processes: métricas por proceso
-      - avg_waiting, avg_turnaround, avg_response
+    Entre eventos la cola rota en un ciclo fijo, así que el kernel salta rondas completas
+    (skip_rounds). Con compress_rounds=True cada tramo de rondas saltadas queda en el
+    timeline como un solo segmento (inicio, fin, (pid_1, ..., pid_k)): los k procesos
+    rotaron en ese orden con rebanadas de `quantum` (ver expand_rounds).
+    """
+    skip_rounds = True
+
+    def __init__(self, quantum: int, compress_rounds: bool = False) -> None:
+        if quantum <= 0:
+            raise ValueError("El quantum debe ser un entero positivo")
+        super().__init__()
+        self.quantum = quantum
+        self.compress_rounds = compress_rounds
+        self.name = f"Round Robin (q={quantum})"
+
+class PriorityPolicy(SchedulingPolicy):
+    """
+    PRIORIDADES (menor número = mayor prioridad): montículo con llave
+    (prioridad, arrival, pid, job). Con preemptive=True una llegada de mayor prioridad
+    expulsa al proceso en CPU.
+
+    Con aging, la prioridad efectiva mejora un nivel por cada `aging` unidades de tiempo
+    desde la llegada: p - (t - arrival) / aging. Como todos los procesos envejecen al mismo
+    ritmo, el orden entre ellos no cambia con el tiempo y basta la llave fija
+    p * aging + arrival; no hay que recorrer la cola para envejecerla.
+    """
+
+    def __init__(self, preemptive: bool = False, aging: Optional[int] = None) -> None:
+        if aging is not None and aging <= 0:
+            raise ValueError("El intervalo de envejecimiento debe ser un entero positivo")
+        self.ready: List[tuple[int, int, Any, int]] = []
+        self.preemptive = preemptive
+        self.aging = aging
+        self.name = "Priority (preemptive)" if preemptive else "Priority (non-preemptive)"
+        if aging is not None:
+            self.name += f" aging={aging}"
+
+    def on_arrival(self, sim: "Simulator", job: int) -> None:
+        priority = sim.priority[job]
+        if self.aging is not None:
+            priority = priority * self.aging + sim.arrival[job]
+        heapq.heappush(self.ready, (priority, sim.arrival[job], sim.pid[job], job))
+
+    def pick_next(self, sim: "Simulator") -> Optional[int]:
+        return heapq.heappop(self.ready)[3] if self.ready else None
+
+class MLFQPolicy(SchedulingPolicy):
     """
+    MULTILEVEL FEEDBACK QUEUE: una cola FIFO (deque) por nivel; el nivel 0 es el de mayor
+    prioridad y `quanta[i]` es el tiempo que un proceso puede usar en el nivel i antes de
+    bajar al siguiente (None en el último nivel = hasta terminar).
+
+    - Los procesos nuevos entran al nivel 0 y una llegada expulsa a un proceso de un
+      nivel inferior.
+    - El tiempo usado en un nivel se conserva aunque el proceso sea expulsado; al agotar
+      el quantum del nivel baja uno y se forma al final de esa cola.
+    - Con boost, cada `boost` unidades de tiempo todos los procesos regresan al nivel 0.
+
+    Cada entrada de cola es (job, tiempo usado en su nivel), así que la política no guarda
+    nada de los procesos que ya terminaron.
+    """
+    preemptive = True
+
+    def __init__(self, quanta: Sequence[Optional[int]] = (2, 4, 8), boost: Optional[int] = None) -> None:
+        if not quanta:
+            raise ValueError("MLFQ necesita al menos un nivel")
+        if any(q is None or q <= 0 for q in quanta[:-1]) or (quanta[-1] is not None and quanta[-1] <= 0):
+            raise ValueError("Los quanta deben ser enteros positivos (solo el último nivel puede ser None)")
+        if boost is not None and boost <= 0:
+            raise ValueError("El intervalo de boost debe ser un entero positivo")
+        self.quanta = list(quanta)
+        self.timer = boost
+        self.queues: List[deque[tuple[int, int]]] = [deque() for _ in self.quanta]
+        self._current: Optional[tuple[int, int, int]] = None # (job, nivel, usado) del proceso en CPU
+        self._dispatched_at = 0
+        levels = "/".join("inf" if q is None else str(q) for q in self.quanta)
+        self.name = f"MLFQ (q={levels})" if boost is None else f"MLFQ (q={levels}, boost={boost})"
+
+    def on_arrival(self, sim: "Simulator", job: int) -> None:
+        self.queues[0].append((job, 0))
+
+    def pick_next(self, sim: "Simulator") -> Optional[int]:
+        for level, queue in enumerate(self.queues):
+            if queue:
+                job, used = queue.popleft()
+                self._current = (job, level, used)
+                self._dispatched_at = sim.time
+                return job
+        return None
+
+    def time_slice(self, sim: "Simulator", job: int) -> Optional[int]:
+        _, level, used = self._current
+        quantum = self.quanta[level]
+        return None if quantum is None else quantum - used
+
+    def on_preempt(self, sim: "Simulator", job: int) -> None:
+        _, level, used = self._current
+        used += sim.time - self._dispatched_at
+        quantum = self.quanta[level]
+        if quantum is not None and used >= quantum:
+            # Agotó su quantum: baja de nivel y se forma al final
+            level = min(level + 1, len(self.quanta) - 1)
+            self.queues[level].append((job, 0))
+        else:
+            # Expulsado antes de tiempo: conserva su lugar al frente de su nivel
+            self.queues[level].appendleft((job, used))
+        self._current = None
+
+    def on_timer(self, sim: "Simulator") -> None:
+        # Boost: todos al nivel 0 con su tiempo usado en cero, conservando el orden por nivel
+        if self._current is not None:
+            self._current = (self._current[0], 0, 0)
+            self._dispatched_at = sim.time
+        boosted = deque((job, 0) for queue in self.queues for job, _ in queue)
+        for queue in self.queues:
+            queue.clear()
+        self.queues[0] = boosted
+
+class SimulationCounters:
+    """
+    Contadores del kernel; cada simulación los reporta en result()["counters"].
+
+    Describen lo que hizo el planificador y lo que costó simularlo:
+      - events: eventos procesados (llegadas, fin de ráfaga o quantum y timer)
+      - decisions: llamadas a pick_next
+      - enqueues: llamadas a on_arrival y on_preempt (operaciones sobre la cola de listos)
+      - dispatches: veces que un proceso recibe la CPU (incluye las rebanadas saltadas de RR)
+      - context_switches: despachos de un proceso distinto al último que estuvo en CPU
+      - preemptions: expulsiones por una llegada, el timer o un cambio de política
+      - quantum_expiries: rebanadas agotadas (incluye las de rondas saltadas)
+      - timer_ticks: eventos de timer de la política (por ejemplo, boosts de MLFQ)
+      - completions, idle_periods, idle_time: terminaciones y huecos de CPU libre
+      - skipped_rounds: rondas de RR calculadas de un solo golpe
+      - max_ready, ready_area: máximo e integral en el tiempo del número de listos
+
+    Los contadores de costo (events, decisions, enqueues, skipped_rounds y timer_ticks)
+    dependen de cómo se partió la simulación: reanudar un checkpoint, correr por tramos con
+    run(until), ramificar con fork o simular por periodos ocupados los cambia
+    aunque el timeline y las métricas sean idénticos. Los demás describen el comportamiento
+    del planificador y no cambian.
+    """
+    __slots__ = (
+        "events", "decisions", "enqueues", "dispatches", "context_switches", "preemptions",
+        "quantum_expiries", "timer_ticks", "completions", "idle_periods", "idle_time",
+        "skipped_rounds", "max_ready", "ready_area",
+    )
 
-    # Copiamos solo los campos de entrada para no modificar los originales
-    processes = [Process(pid=p.pid, arrival=p.arrival, burst=p.burst, priority=p.priority) for p in original]
+    def __init__(self) -> None:
+        for name in self.__slots__:
+            setattr(self, name, 0)
 
-    n = len(processes)
-    completed = 0
-    time = 0
-    timeline: List[tuple[int, int, Optional[int]]] = []
+    def as_dict(self) -> Dict[str, int]:
+        return {name: getattr(self, name) for name in self.__slots__}
 
-    # Mientras haya procesos sin completar
-    while completed < n:
-        # Procesos listos
-        ready = [p for p in processes if p.arrival <= time and p.completion_time == -1]
+class SimulatorHooks:
+    """
+    Callbacks opcionales del kernel (Simulator(hooks=...)); por defecto no hacen nada, así
+    que basta con sobreescribir los que interesan. Sin hooks, el kernel solo paga una
+    comparación con None en cada punto.
 
-        if not ready:
-            # No hay procesos listos: CPU libre hasta el siguiente arrival
-            next_arrival = min(p.arrival for p in processes if p.completion_time == -1)
-            if time < next_arrival:
-                timeline.append((time, next_arrival, None))
-                time = next_arrival
-            continue
+    - on_dispatch: `job` recibe la CPU en `time`.
+    - on_preempt: `job` deja la CPU sin terminar en `time` (quantum, expulsión o timer).
+    - on_complete: `job` termina en `time`.
+    - on_idle: la CPU estuvo libre entre `start` y `end`.
 
-        # Elegimos el proceso con ráfaga más corta
-        p = min(ready, key=lambda x: (x.burst, x.arrival, x.pid))
+    Con hooks, las rondas saltadas de Round Robin se reportan rebanada por rebanada.
+    """
 
-        p.start_time = time
-        time += p.burst
-        p.completion_time = time
-        completed += 1
+    def on_dispatch(self, sim: "Simulator", time: int, job: int) -> None:
+        pass
 
-        timeline.append((p.start_time, p.completion_time, p.pid))
+    def on_preempt(self, sim: "Simulator", time: int, job: int) -> None:
+        pass
 
-    metrics = compute_metrics(processes)
+    def on_complete(self, sim: "Simulator", time: int, job: int) -> None:
+        pass
 
-    return {
-        "algorithm": "SJF (non-preemptive)",
-        "timeline": timeline,
-        **metrics,
-    }
+    def on_idle(self, sim: "Simulator", start: int, end: int) -> None:
+        pass
 
-def simulate_rr(original: List[Process], quantum: int) -> Dict[str, Any]:
+class Simulator:
     """
-    Simula planificación ROUND ROBIN con quantum fijo.
+    Kernel de simulación por eventos discretos compartido por todos los algoritmos.
+
+    Mantiene el reloj, un montículo de eventos (llegadas, fin de ráfaga y fin de quantum),
+    los huecos de CPU libre y el timeline. Las decisiones de planificación se delegan a
+    una SchedulingPolicy, así que cualquier política corre en O(eventos log n) sin
+    escribir su propio ciclo.
+
+    Las llegadas se admiten perezosamente en orden de llegada, ya sea desde una
+    ProcessTable (load) o desde un iterable de filas (add_arrivals); solo la siguiente
+    llegada vive en el montículo.
+
+    Una simulación cargada con load se puede detener con run(until=t), guardar con
+    checkpoint(), recuperar con Simulator.restore() y alimentar con llegadas nuevas
+    (extend) antes de seguir; el resultado final es idéntico al de simular todo de una vez.
+    Con checkpoint(summary_only=True) solo se conservan los procesos vivos y las métricas
+    acumuladas de los terminados.
+
+    Los contadores (SimulationCounters) siempre se llevan; `hooks` (SimulatorHooks) es
+    opcional y recibe cada despacho, expulsión, terminación y hueco de CPU libre.
+    """
+
+    def __init__(
+        self,
+        policy: SchedulingPolicy,
+        start: Optional[int] = 0,
+        compact_timeline: bool = False,
+        hooks: Optional[SimulatorHooks] = None,
+    ) -> None:
+        self.policy = policy
+        # Con start=None el reloj empieza en la primera llegada (sin hueco inicial)
+        self.time = start
+        self._origin = start
+        self.hooks = hooks
+        self.counters = SimulationCounters()
+        # Con compact_timeline el timeline es un CompactTimeline (los segmentos contiguos
+        # del mismo proceso se fusionan y las rondas de RR nunca se guardan comprimidas)
+        self.compact_timeline = compact_timeline
+
+        # Columnas de entrada y estado mutable por job
+        self.pid: Sequence[Any] = []
+        self.arrival: Sequence[int] = []
+        self.burst: Sequence[int] = []
+        self.priority: Sequence[int] = []
+        self.remaining: Any = []
+        self.start_time: Any = []
+        self.completion_time: Any = []
+
+        self.timeline: Any = []
+
+        self._events: List[tuple[int, int, int, int]] = [] # (tiempo, tipo, secuencia, job)
+        self._seq = 0
+        # Fuente de llegadas: jobs en orden de llegada (_order, leídos desde _next_job) o,
+        # en modo streaming, un iterador de filas (_source)
+        self._order = array("q")
+        self._next_job = 0
+        self._source: Optional[Iterator[int]] = None
+        self._owned = False # las columnas de entrada son propias (no se comparten con la tabla)
+        self._until: Optional[int] = None # límite de la ejecución actual (run(until))
+        self._last_arrival: Optional[int] = None
+        self._running: Optional[int] = None
+        self._segment_start = 0
+        self._cpu_event = -1 # secuencia del evento de CPU vigente; los demás están cancelados
+        self._started = False
+        self._quiet_slices = 0 # fines de quantum seguidos sin llegadas ni terminaciones
+        self._timer_pending = False # hay un evento de timer de la política en el montículo
+        self._ready_count = 0 # procesos listos (fuera de la CPU) según el kernel
+        self._last_job: Optional[int] = None # último job que estuvo en CPU
+        # Despacho provisional de switch_policy: (job, _last_job anterior, si fue su primer
+        # despacho). Otro cambio en el mismo instante lo deshace; on_dispatch se avisa al seguir
+        self._held_dispatch: Optional[tuple[int, Optional[int], bool]] = None
+
+        # Si es una lista, el kernel agrega ahí cada job que termina (modo streaming)
+        self.finished: Optional[List[int]] = None
+        # Modo resumen (checkpoint(summary_only=True)): métricas de los procesos terminados
+        # que ya no tienen filas, y número del siguiente job (las columnas son diccionarios)
+        self._folded: Optional[MetricsAccumulator] = None
+        self._next_id = 0
+
+    def load(self, table: ProcessTable, order: Optional[Iterable[int]] = None) -> None:
+        """
+        Usa las columnas de la tabla como entrada (sin copiarlas) y crea arreglos nuevos
+        para el estado mutable. `order` son las filas en orden de llegada.
+        """
+        n = len(table)
+        self.pid = table.pid
+        self.arrival = table.arrival
+        self.burst = table.burst
+        self.priority = table.priority
+        self.remaining = array("q", table.burst)
+        self.start_time = array("q", [-1]) * n
+        self.completion_time = array("q", [-1]) * n
+        if self.compact_timeline:
+            self.timeline = CompactTimeline(self.pid)
+        self._order = array("q", table.arrival_order() if order is None else order)
+        self._next_job = 0
+        self._source = None
+        self._owned = False
+        self._folded = None
+
+    def _own_columns(self) -> None:
+        """Copia las columnas de entrada (compartidas con la tabla) antes de modificarlas."""
+        if self._owned:
+            return
+        for name in ("pid", "arrival", "burst", "priority"):
+            column = getattr(self, name)
+            if isinstance(column, (list, dict)):
+                column = column.copy()
+            elif isinstance(column, memoryview):
+                column = array("q", column.tobytes())
+            else:
+                column = column[:]
+            setattr(self, name, column)
+        if isinstance(self.timeline, CompactTimeline):
+            self.timeline.pids = self.pid
+        self._owned = True
+
+    def checkpoint_time(self) -> int:
+        """Tiempo a partir del cual se pueden agregar llegadas nuevas (ver extend)."""
+        if self.time is None or self._until is None:
+            return self._until if self.time is None else self.time
+        return max(self.time, self._until)
+
+    def extend(self, processes: Workload) -> None:
+        """
+        Agrega llegadas nuevas a una simulación cargada con load, por ejemplo después de
+        run(until=t) o de restore(). Todas deben llegar en checkpoint_time() o después.
+        Los jobs nuevos se numeran después de los existentes, como si la carga original y
+        la nueva fueran una sola tabla.
+        """
+        if self._source is not None:
+            raise ValueError("Una simulación en streaming (add_arrivals) no se puede extender")
+        table = as_process_table(processes)
+        if len(table) == 0:
+            return
+        limit = self.checkpoint_time()
+        if limit is not None and min(table.arrival) < limit:
+            raise ValueError(f"Las nuevas llegadas deben ser posteriores al checkpoint (t={limit})")
+
+        self._own_columns()
+        n = len(table)
+        if self._folded is not None:
+            # Modo resumen: columnas por job, solo con los procesos vivos
+            base = self._next_id
+            self._next_id += n
+            rows = enumerate(zip(table.pid, table.arrival, table.burst, table.priority), start=base)
+            for job, (pid, arrival, burst, priority) in rows:
+                self.pid[job] = pid
+                self.arrival[job] = arrival
+                self.burst[job] = burst
+                self.priority[job] = priority
+                self.remaining[job] = burst
+                self.start_time[job] = -1
+                self.completion_time[job] = -1
+            self._order.extend(base + k for k in table.arrival_order())
+            if self._started and self._next_arrival_time() is None:
+                self._admit_next()
+            return
+
+        base = len(self.arrival)
+        if isinstance(self.pid, list) or not isinstance(table.pid, (array, memoryview)):
+            self.pid = list(self.pid)
+            self.pid.extend(table.pid)
+            if isinstance(self.timeline, CompactTimeline):
+                self.timeline.pids = self.pid
+        else:
+            self.pid.extend(table.pid)
+        self.arrival.extend(table.arrival)
+        self.burst.extend(table.burst)
+        self.priority.extend(table.priority)
+        self.remaining.extend(table.burst)
+        self.start_time.extend(array("q", [-1]) * n)
+        self.completion_time.extend(array("q", [-1]) * n)
+        self._order.extend(base + k for k in table.arrival_order())
+
+        # Si la fuente ya se había agotado, la siguiente llegada no está en el montículo
+        if self._started and self._next_arrival_time() is None:
+            self._admit_next()
+
+    def checkpoint(self, summary_only: bool = False) -> bytes:
+        """
+        Serializa el estado (reloj, eventos, política, columnas y timeline).
+
+        Por defecto guarda toda la historia: las filas de todos los jobs cargados y el
+        timeline completo, porque result() los reporta (unos 80 bytes por job más el
+        timeline). Con summary_only=True la simulación pasa a modo resumen: los procesos
+        terminados se suman a un MetricsAccumulator y se descartan sus filas y el timeline
+        hasta ahora, así que el checkpoint, extend y result() solo cuestan los procesos
+        vivos y los nuevos. Desde entonces result() solo da promedios, percentiles y
+        contadores (per_process=False), y el timeline solo tiene los segmentos posteriores.
+        """
+        if self._source is not None:
+            raise ValueError("Una simulación en streaming (add_arrivals) no se puede guardar")
+        if summary_only:
+            self._fold_finished()
+        # Las columnas mapeadas en memoria no se pueden serializar: se copian una vez
+        self._own_columns()
+        return pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _fold_finished(self) -> None:
+        """Pasa los procesos terminados al acumulador y deja solo las filas de los vivos."""
+        completion = self.completion_time
+        if self._folded is None:
+            self._folded = MetricsAccumulator()
+            jobs: Iterable[int] = range(len(self.arrival))
+            self._next_id = len(self.arrival)
+        else:
+            jobs = list(self.arrival)
+        done = [job for job in jobs if completion[job] != -1]
+        add = self._folded.add
+        arrival, burst, start = self.arrival, self.burst, self.start_time
+        for job in done:
+            add(arrival[job], burst[job], start[job], completion[job])
+
+        names = ("pid", "arrival", "burst", "priority", "remaining", "start_time", "completion_time")
+        if isinstance(self.arrival, dict):
+            for name in names:
+                column = getattr(self, name)
+                for job in done:
+                    del column[job]
+        else:
+            live = [job for job in jobs if completion[job] == -1]
+            for name in names:
+                column = getattr(self, name)
+                setattr(self, name, {job: column[job] for job in live})
+        self._owned = True
+        self._order = self._order[self._next_job:]
+        self._next_job = 0
+        self.timeline = CompactTimeline(self.pid) if self.compact_timeline else []
+
+    def fork(self) -> "Simulator":
+        """
+        Copia del estado actual para continuar por otra rama (por ejemplo con otra
+        política, ver switch_policy). Las columnas de entrada se comparten (se copian hasta
+        que alguna rama las extiende); el estado mutable son arreglos compactos que se
+        copian en bloque, y del timeline solo se copia la lista, no sus segmentos.
+        """
+        if self._source is not None:
+            raise ValueError("Una simulación en streaming (add_arrivals) no se puede bifurcar")
+        clone = copy.copy(self)
+        clone.policy = copy.deepcopy(self.policy)
+        clone.counters = copy.copy(self.counters)
+        clone.remaining = copy.copy(self.remaining)
+        clone.start_time = copy.copy(self.start_time)
+        clone.completion_time = copy.copy(self.completion_time)
+        if self._folded is not None:
+            clone._folded = copy.deepcopy(self._folded)
+        clone._order = self._order[:]
+        clone._events = list(self._events)
+        if isinstance(self.timeline, CompactTimeline):
+            clone.timeline = CompactTimeline(self.pid)
+            clone.timeline.starts = self.timeline.starts[:]
+            clone.timeline.ends = self.timeline.ends[:]
+            clone.timeline.jobs = self.timeline.jobs[:]
+        else:
+            clone.timeline = list(self.timeline)
+        if self.finished is not None:
+            clone.finished = list(self.finished)
+        # Copia al escribir: quien extienda primero copia las columnas compartidas
+        self._owned = clone._owned = False
+        return clone
+
+    def switch_policy(self, policy: SchedulingPolicy, at: Optional[int] = None) -> None:
+        """
+        Cambia de política en el instante `at` (por defecto, checkpoint_time()). Primero
+        procesa los eventos anteriores a `at` y termina al proceso en CPU si su ráfaga
+        acaba justo en `at`. Después pasan a la política nueva, en este orden, los listos
+        (en el orden en que los despacharía la anterior), las llegadas de `at` y el proceso
+        en CPU, y la política nueva decide quién sigue. Todos se entregan con on_arrival:
+        la política nueva no tiene historia de ellos (por ejemplo, en MLFQ empiezan en el
+        nivel 0).
+
+        El despacho que resulta es provisional hasta que la simulación avanza: otro cambio
+        en el mismo `at` lo deshace por completo, y on_dispatch se avisa hasta entonces.
+        No se puede cambiar en un instante cuyos eventos ya se simularon.
+        """
+        if at is None:
+            at = self.checkpoint_time()
+        elif self.time is not None and at < self.time:
+            raise ValueError(f"No se puede cambiar de política en el pasado (t={self.time})")
+        self.run(until=at)
+        counters = self.counters
+        running = self._running
+        if (
+            running is not None and self._segment_start == at
+            and self._held_dispatch is None and self.time is not None
+        ):
+            raise ValueError(f"Los eventos de t={at} ya se simularon con la política anterior")
+        if self.time is not None and at > self.time:
+            if self._held_dispatch is not None:
+                self._release_dispatch()
+            if running is not None:
+                self.remaining[running] -= at - self.time
+            elif self._next_event_time() is not None:
+                # CPU libre hasta el cambio (solo si todavía falta algo por simular)
+                self._idle(self.time, at)
+            counters.ready_area += self._ready_count * (at - self.time)
+            self.time = at
+        if running is not None and self.remaining[running] == 0:
+            # Su fin de ráfaga es justo en `at`: termina antes del cambio
+            self._close_segment()
+            self._finish(running)
+            running = None
+        # Cualquier evento de CPU pendiente queda cancelado: la política nueva vuelve a despachar
+        self._cpu_event = -1
+
+        ready = self.policy.drain(self)
+        counters.enqueues += len(ready)
+        self.policy = policy
+        self._quiet_slices = 0
+        if self._timer_pending:
+            # El timer era de la política anterior
+            self._events = [event for event in self._events if event[1] != _TIMER]
+            heapq.heapify(self._events)
+            self._timer_pending = False
+
+        for job in ready:
+            policy.on_arrival(self, job)
+        if self.time is not None:
+            # Las llegadas de este mismo instante van directo a la política nueva
+            events = self._events
+            while self._next_event_time() == self.time and events[0][1] == _ARRIVAL:
+                job = heapq.heappop(events)[3]
+                counters.events += 1
+                counters.enqueues += 1
+                policy.on_arrival(self, job)
+                self._ready_count += 1
+                self._admit_next()
+
+        chosen = None
+        if running is not None:
+            policy.on_arrival(self, running)
+            counters.enqueues += 1
+            self._ready_count += 1
+        if running is not None or self._ready_count > 0:
+            chosen = policy.pick_next(self)
+            counters.decisions += 1
+        if chosen is not None:
+            self._ready_count -= 1
+            if chosen == running:
+                self._schedule_cpu(running)
+            else:
+                if running is not None and self._segment_start == self.time:
+                    # Lo despachó otro cambio en este mismo instante: se deshace ese
+                    # despacho (no hay segmento que cerrar ni expulsión)
+                    self._undo_dispatch()
+                elif running is not None:
+                    self._preempt(running)
+                self._hold_dispatch(chosen)
+        if self._ready_count > counters.max_ready:
+            counters.max_ready = self._ready_count
+        if self._running is not None and policy.timer is not None:
+            self._timer_pending = True
+            self._push((self.time // policy.timer + 1) * policy.timer, _TIMER, -1)
+
+    @classmethod
+    def restore(cls, data: bytes) -> "Simulator":
+        """Recupera una simulación guardada con checkpoint() (usa pickle: solo checkpoints confiables)."""
+        sim = pickle.loads(data)
+        if not isinstance(sim, cls):
+            raise TypeError("Los datos no son un checkpoint de Simulator")
+        return sim
+
+    def add_arrivals(self, rows: Iterable[tuple[Any, int, int, int]]) -> None:
+        """
+        Define la fuente de llegadas: filas (pid, arrival, burst, priority) ordenadas por llegada.
+        Las columnas son diccionarios por job, así que quien consume la simulación puede
+        descartar los procesos terminados (ver `finished`) y acotar la memoria.
+        """
+        self.pid, self.arrival, self.burst, self.priority = {}, {}, {}, {}
+        self.remaining, self.start_time, self.completion_time = {}, {}, {}
+        self._source = self._append_rows(rows)
+        self._owned = True
+
+    def _append_rows(self, rows: Iterable[tuple[Any, int, int, int]]) -> Iterator[int]:
+        # Cada fila se agrega a las columnas en el momento en que se admite
+        for job, (pid, arrival, burst, priority) in enumerate(rows):
+            self.pid[job] = pid
+            self.arrival[job] = arrival
+            self.burst[job] = burst
+            self.priority[job] = priority
+            self.remaining[job] = burst
+            self.start_time[job] = -1
+            self.completion_time[job] = -1
+            yield job
+
+    def _push(self, time: int, kind: int, job: int) -> int:
+        seq = self._seq
+        heapq.heappush(self._events, (time, kind, seq, job))
+        self._seq += 1
+        return seq
+
+    def _admit_next(self) -> None:
+        """Lee la siguiente llegada de la fuente y la agenda como evento."""
+        if self._source is not None:
+            job = next(self._source, None)
+            if job is None:
+                return
+        else:
+            if self._next_job >= len(self._order):
+                return
+            job = self._order[self._next_job]
+            self._next_job += 1
+        arrival = self.arrival[job]
+        if self._last_arrival is not None and arrival < self._last_arrival:
+            raise ValueError("Las llegadas deben estar ordenadas por tiempo")
+        self._last_arrival = arrival
+        self._push(arrival, _ARRIVAL, job)
+
+    def _next_event_time(self) -> Optional[int]:
+        # Descartamos eventos de CPU de despachos que ya fueron expulsados, y el timer si
+        # la CPU está libre (no hay nadie listo; se vuelve a agendar al despachar)
+        events = self._events
+        while events:
+            kind = events[0][1]
+            if kind <= _QUANTUM and events[0][2] != self._cpu_event:
+                heapq.heappop(events)
+            elif kind == _TIMER and self._running is None:
+                heapq.heappop(events)
+                self._timer_pending = False
+            else:
+                break
+        return events[0][0] if events else None
+
+    def _dispatch(self, job: int) -> None:
+        time = self.time
+        self._running = job
+        self._segment_start = time
+        if self.start_time[job] == -1:
+            self.start_time[job] = time
+        counters = self.counters
+        counters.dispatches += 1
+        if job != self._last_job and self._last_job is not None:
+            counters.context_switches += 1
+        self._last_job = job
+        if self.hooks is not None:
+            self.hooks.on_dispatch(self, time, job)
+        self._schedule_cpu(job)
+
+    def _hold_dispatch(self, job: int) -> None:
+        """Despacho provisional de switch_policy: todo menos el hook (ver _release_dispatch)."""
+        self._held_dispatch = (job, self._last_job, self.start_time[job] == -1)
+        hooks, self.hooks = self.hooks, None
+        try:
+            self._dispatch(job)
+        finally:
+            self.hooks = hooks
+
+    def _release_dispatch(self) -> None:
+        """El despacho provisional queda firme: se avisa a on_dispatch."""
+        job = self._held_dispatch[0]
+        self._held_dispatch = None
+        if self.hooks is not None:
+            self.hooks.on_dispatch(self, self._segment_start, job)
+
+    def _undo_dispatch(self) -> None:
+        """Deshace el despacho provisional (otro cambio de política en el mismo instante)."""
+        job, last_job, first = self._held_dispatch
+        self._held_dispatch = None
+        self._running = None
+        if first:
+            self.start_time[job] = -1
+        counters = self.counters
+        counters.dispatches -= 1
+        if job != last_job and last_job is not None:
+            counters.context_switches -= 1
+        self._last_job = last_job
+
+    def _finish(self, job: int) -> None:
+        """Marca a `job` como terminado en el instante actual (su segmento ya se cerró)."""
+        time = self.time
+        self.counters.completions += 1
+        self.completion_time[job] = time
+        if self.finished is not None:
+            self.finished.append(job)
+        if self.hooks is not None:
+            self.hooks.on_complete(self, time, job)
+
+    def _preempt(self, job: int) -> None:
+        """Saca de la CPU a `job`, que la política ya volvió a formar (on_preempt)."""
+        self._close_segment()
+        self.counters.preemptions += 1
+        if self.hooks is not None:
+            self.hooks.on_preempt(self, self.time, job)
+
+    def _idle(self, start: int, end: int) -> None:
+        """Registra un hueco de CPU libre."""
+        self._record(start, end, CompactTimeline.IDLE)
+        counters = self.counters
+        counters.idle_periods += 1
+        counters.idle_time += end - start
+        if self.hooks is not None:
+            self.hooks.on_idle(self, start, end)
+
+    def _schedule_cpu(self, job: int) -> None:
+        """Agenda el fin del despacho de `job` a partir de ahora (cancela el anterior)."""
+        time = self.time
+        run = self.remaining[job]
+        quantum = self.policy.time_slice(self, job)
+        if quantum is not None and quantum < run:
+            self._cpu_event = self._push(time + quantum, _QUANTUM, job)
+        else:
+            self._cpu_event = self._push(time + run, _COMPLETION, job)
+
+    def _next_arrival_time(self) -> Optional[int]:
+        # Solo la siguiente llegada vive en el montículo, que es muy chico
+        times = [event[0] for event in self._events if event[1] == _ARRIVAL]
+        return min(times) if times else None
+
+    def _skip_rounds(self, job: int) -> None:
+        """
+        Salta rondas completas de una rotación FIFO antes de despachar `job`.
+
+        Se llama solo después de una ronda completa sin llegadas ni terminaciones, así que
+        el ciclo [job] + cola es estable y todos sus procesos ya empezaron. Cada ronda
+        consume `quantum` de cada proceso; se saltan m rondas mientras ningún proceso
+        termine y todas acaben antes de la siguiente llegada.
+        """
+        cycle = [job, *self.policy.ready]
+        k = len(cycle)
+        quantum = self.policy.quantum
+        remaining = self.remaining
+
+        rounds = (min(remaining[j] for j in cycle) - 1) // quantum
+        next_arrival = self._next_arrival_time()
+        if self._until is not None and (next_arrival is None or self._until < next_arrival):
+            # Con run(until) puede haber llegadas que aún no conocemos desde `until`
+            next_arrival = self._until
+        if next_arrival is not None:
+            # Las rondas deben terminar antes de la llegada: si termina justo en ella, la
+            # llegada se forma antes que el último proceso de la ronda
+            rounds = min(rounds, (next_arrival - self.time - 1) // (k * quantum))
+        if rounds <= 0:
+            return
+
+        start = self.time
+        span = rounds * k * quantum
+        for j in cycle:
+            remaining[j] -= rounds * quantum
+
+        # Las rondas saltadas cuentan como si se hubieran simulado rebanada por rebanada;
+        # con k > 1 cada rebanada es un cambio de contexto (la anterior fue de cycle[-1])
+        slices = rounds * k
+        counters = self.counters
+        counters.skipped_rounds += rounds
+        counters.dispatches += slices
+        counters.quantum_expiries += slices
+        if k > 1:
+            counters.context_switches += slices
+        counters.ready_area += (k - 1) * span
+        self._last_job = cycle[-1]
+        hooks = self.hooks
+        if hooks is not None:
+            for i, t in enumerate(range(start, start + span, quantum)):
+                hooks.on_dispatch(self, t, cycle[i % k])
+                hooks.on_preempt(self, t + quantum, cycle[i % k])
+
+        if self.compact_timeline:
+            timeline = self.timeline
+            if k == 1:
+                # Un solo proceso: las rebanadas son contiguas y se fusionan en un segmento
+                timeline.add(start, start + span, job)
+            else:
+                # La primera rebanada puede continuar el último segmento; las demás alternan
+                # de proceso, así que se agregan en bloque sin revisar si se fusionan
+                timeline.add(start, start + quantum, job)
+                timeline.starts.extend(range(start + quantum, start + span, quantum))
+                timeline.ends.extend(range(start + 2 * quantum, start + span + quantum, quantum))
+                timeline.jobs.extend(array("q", cycle[1:] + cycle[:1]) * rounds)
+                del timeline.jobs[-1]
+        elif self.policy.compress_rounds:
+            self.timeline.append((start, start + span, tuple(self.pid[j] for j in cycle)))
+        else:
+            pids = [self.pid[j] for j in cycle] * rounds
+            self.timeline.extend(
+                (t, t + quantum, pid) for t, pid in zip(range(start, start + span, quantum), pids)
+            )
+        self.time = start + span
+
+    def _close_segment(self) -> None:
+        job = self._running
+        self._record(self._segment_start, self.time, job)
+        self._running = None
+
+    def _record(self, start: int, end: int, job: int) -> None:
+        """Agrega un segmento al timeline; job -1 es CPU libre."""
+        if self.compact_timeline:
+            self.timeline.add(start, end, job)
+        else:
+            self.timeline.append((start, end, None if job == CompactTimeline.IDLE else self.pid[job]))
+
+    def _step(self, time: int) -> None:
+        """Procesa todos los eventos que ocurren en `time`."""
+        counters = self.counters
+        hooks = self.hooks
+        running = self._running
+        if running is None:
+            if time > self.time:
+                # CPU libre hasta el siguiente evento
+                self._idle(self.time, time)
+        else:
+            self.remaining[running] -= time - self.time
+        counters.ready_area += self._ready_count * (time - self.time)
+        self.time = time
+
+        policy = self.policy
+        events = self._events
+        expired: Optional[int] = None
+        arrived = completed = timer = False
+
+        while events and events[0][0] == time:
+            _, kind, seq, job = heapq.heappop(events)
+            if kind == _ARRIVAL:
+                counters.events += 1
+                policy.on_arrival(self, job)
+                counters.enqueues += 1
+                self._ready_count += 1
+                arrived = True
+                self._admit_next()
+            elif kind == _TIMER:
+                counters.events += 1
+                counters.timer_ticks += 1
+                timer = True
+                self._timer_pending = False
+            elif seq == self._cpu_event:
+                counters.events += 1
+                self._close_segment()
+                if kind == _COMPLETION:
+                    completed = True
+                    self._finish(job)
+                else:
+                    expired = job
+                    counters.quantum_expiries += 1
+                    if hooks is not None:
+                        hooks.on_preempt(self, time, job)
+
+        if expired is not None:
+            # El proceso vuelve a la cola después de las llegadas de este mismo instante
+            policy.on_preempt(self, expired)
+            counters.enqueues += 1
+            self._ready_count += 1
+        elif self._running is not None and arrived and policy.preemptive:
+            policy.on_preempt(self, running)
+            chosen = policy.pick_next(self)
+            counters.enqueues += 1
+            counters.decisions += 1
+            if chosen != running:
+                self._preempt(running)
+                self._dispatch(chosen)
+
+        if timer:
+            policy.on_timer(self)
+            running = self._running
+            if running is not None:
+                policy.on_preempt(self, running)
+                chosen = policy.pick_next(self)
+                counters.enqueues += 1
+                counters.decisions += 1
+                if chosen != running:
+                    self._preempt(running)
+                    self._dispatch(chosen)
+                else:
+                    # Sigue el mismo proceso, pero el timer pudo cambiar su rebanada
+                    self._schedule_cpu(running)
+
+        if policy.skip_rounds:
+            if arrived or completed or expired is None:
+                self._quiet_slices = 0
+            else:
+                self._quiet_slices += 1
+
+        if self._running is None:
+            chosen = policy.pick_next(self)
+            counters.decisions += 1
+            if chosen is not None:
+                self._ready_count -= 1
+                if policy.skip_rounds and self._quiet_slices > len(policy.ready):
+                    # Se completó una ronda sin eventos: intentamos saltar las siguientes
+                    self._quiet_slices = 0
+                    self._skip_rounds(chosen)
+                self._dispatch(chosen)
+
+        if self._ready_count > counters.max_ready:
+            counters.max_ready = self._ready_count
+
+        if policy.timer is not None and self._running is not None and not self._timer_pending:
+            # El timer solo corre mientras hay alguien en CPU, en los múltiplos de policy.timer
+            self._timer_pending = True
+            self._push((self.time // policy.timer + 1) * policy.timer, _TIMER, -1)
+
+    def step(self) -> bool:
+        """
+        Procesa el siguiente instante con eventos. Regresa False cuando ya no queda nada
+        pendiente o el siguiente evento no es anterior al límite de run(until).
+        """
+        if not self._started:
+            self._started = True
+            self._admit_next()
+        if self.time is None:
+            # El reloj empieza en la primera llegada (que puede llegar después con extend)
+            if not self._events:
+                return False
+            self.time = self._origin = self._events[0][0]
+
+        time = self._next_event_time()
+        if time is None or (self._until is not None and time >= self._until):
+            return False
+        if self._held_dispatch is not None:
+            self._release_dispatch()
+        self._step(time)
+        return True
+
+    def run(self, until: Optional[int] = None) -> "Simulator":
+        """
+        Ejecuta la simulación hasta agotar las llegadas y los procesos listos. Con `until`
+        solo se procesan los eventos anteriores a `until`, así que después se pueden
+        agregar llegadas desde `until` (extend) y continuar con otro run.
+        """
+        self._until = until
+        while self.step():
+            pass
+        return self
+
+    def result(self, order: Optional[Iterable[int]] = None, per_process: bool = True, by_arrival: bool = False) -> Dict[str, Any]:
+        """
+        Regresa el diccionario de resultados de siempre (algorithm, timeline, processes y métricas).
+        `order` indica en qué orden de jobs se reportan los procesos (por defecto, por job);
+        con by_arrival=True se reportan en orden de llegada.
+        """
+        if self._folded is not None:
+            # Modo resumen (checkpoint(summary_only=True)): ya no hay filas de los terminados
+            if per_process:
+                raise ValueError("En modo resumen solo hay métricas agregadas: usa result(per_process=False)")
+            order = list(self.arrival)
+        elif by_arrival:
+            order = self._order
+        metrics = _metrics_from_columns(
+            self.pid, self.arrival, self.burst, self.start_time, self.completion_time,
+            range(len(self.pid)) if order is None else order,
+            per_process,
+            self._folded,
+        )
+        return {
+            "algorithm": self.policy.name,
+            "timeline": self.timeline,
+            **metrics,
+            "counters": self.counter_summary(),
+        }
+
+    def counter_summary(self) -> Dict[str, Any]:
+        """
+        Los contadores como diccionario, más elapsed (tiempo simulado) y avg_ready
+        (procesos listos en promedio en el tiempo, ready_area / elapsed).
+        """
+        summary: Dict[str, Any] = self.counters.as_dict()
+        elapsed = 0 if self.time is None else self.time - self._origin
+        summary["elapsed"] = elapsed
+        summary["avg_ready"] = summary["ready_area"] / elapsed if elapsed > 0 else 0.0
+        return summary
+
+def run_policy(
+    original: Workload,
+    policy: SchedulingPolicy,
+    start: Optional[int] = 0,
+    by_arrival: bool = False,
+    per_process: bool = True,
+    compact_timeline: bool = False,
+    hooks: Optional[SimulatorHooks] = None,
+) -> Dict[str, Any]:
+    """
+    Simula una carga (lista de Process o ProcessTable) con cualquier SchedulingPolicy
+    sobre el kernel de eventos. La entrada no se modifica y los procesos se reportan en
+    el orden de entrada, o en orden de llegada si by_arrival es True. Con
+    per_process=False solo se regresan las métricas resumidas, y con
+    compact_timeline=True el timeline es un CompactTimeline. `hooks` recibe los eventos
+    del kernel (ver SimulatorHooks); los contadores siempre se reportan en "counters".
+    """
+    table = as_process_table(original)
+    # Orden de llegada estable: los empates conservan el orden original
+    order = table.arrival_order()
+
+    sim = Simulator(policy, start=start, compact_timeline=compact_timeline, hooks=hooks)
+    sim.load(table, order)
+    sim.run()
+    return sim.result(order if by_arrival else None, per_process)
+
+def simulate_branches(
+    original: Workload,
+    prefix: SchedulingPolicy,
+    at: int,
+    branches: Dict[str, Optional[SchedulingPolicy]],
+    start: Optional[int] = 0,
+    per_process: bool = True,
+    compact_timeline: bool = False,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Análisis what-if: simula `prefix` hasta el instante `at` una sola vez y desde ahí
+    continúa cada rama con su propia política (None = seguir con `prefix`).
+
+    Regresa {nombre de la rama: diccionario de resultados de siempre}; el algoritmo de
+    cada rama se reporta como "prefijo -> rama @ t=at".
+    """
+    table = as_process_table(original)
+    sim = Simulator(prefix, start=start, compact_timeline=compact_timeline)
+    sim.load(table)
+    sim.run(until=at)
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for name, policy in branches.items():
+        branch = sim.fork()
+        if policy is not None:
+            branch.switch_policy(policy, at)
+        result = branch.run().result(per_process=per_process)
+        if policy is not None:
+            result["algorithm"] = f"{prefix.name} -> {policy.name} @ t={at}"
+        results[name] = result
+    return results
+
+def simulate_fcfs(original: Workload, per_process: bool = True, compact_timeline: bool = False) -> Dict[str, Any]:
+    """
+    Simula el algoritmo de planificación FIRST-COME, FIRST-SERVED.
 
     Regresa:
       - algorithm: nombre del algoritmo
-      - timeline: lista de segmentos (inicio, fin, pid | None)
-      - processes: métricas por proceso
+      - timeline: lista de segmentos (inicio, fin, pid | None); CompactTimeline con compact_timeline=True
+      - processes: métricas por proceso (se omite con per_process=False)
       - avg_waiting, avg_turnaround, avg_response
+      - avg_slowdown y p50/p90/p99/max de waiting, turnaround, response y slowdown
+      - counters: contadores del kernel (ver SimulationCounters)
     """
-    if quantum <= 0:
-        raise ValueError("El quantum debe ser un entero positivo")
-
-    # Copiamos procesos para no modificar los originales
-    processes = [Process(pid=p.pid, arrival=p.arrival, burst=p.burst, priority=p.priority) for p in original]
-    procs_sorted = sorted(processes, key=lambda p: (p.arrival, p.pid))
-
-    n = len(procs_sorted)
-    completed = 0
-    time = 0
-    i = 0  # índice de procesos ordenados por llegada
-    ready: deque[Process] = deque()
-    timeline: List[tuple[int, int, Optional[int]]] = []
-
-    while completed < n:
-        # Agregar a la cola listos todos los procesos que ya llegaron
-        while i < n and procs_sorted[i].arrival <= time:
-            ready.append(procs_sorted[i])
-            i += 1
-
-        if not ready:
-            # CPU libre hasta el siguiente arrival
-            next_arrival = procs_sorted[i].arrival
-            if time < next_arrival:
-                timeline.append((time, next_arrival, None))
-                time = next_arrival
-            continue
-
-        # Tomar el siguiente proceso de la cola circular
-        p = ready.popleft()
+    # Reportamos los procesos en orden de llegada
+    return run_policy(original, FCFSPolicy(), by_arrival=True, per_process=per_process, compact_timeline=compact_timeline)
 
-        # Si es la primera vez que entra a CPU, registramos su start time
-        if p.start_time == -1:
-            p.start_time = time  
+def simulate_sjf(original: Workload, per_process: bool = True, compact_timeline: bool = False) -> Dict[str, Any]:
+    """
+    Simula planificación SHORTEST JOB FIRST no expulsiva.
 
-        start = time
-        run_time = min(quantum, p.remaining)
-        time += run_time
-        p.remaining -= run_time
+    Usa un montículo de listos, por lo que la simulación completa es O(n log n).
 
-        timeline.append((start, time, p.pid))
+    Regresa:
+      - algorithm: nombre del algoritmo
+      - timeline: lista de segmentos (inicio, fin, pid | None); CompactTimeline con compact_timeline=True
+      - processes: métricas por proceso (se omite con per_process=False)
+      - avg_waiting, avg_turnaround, avg_response
+      - avg_slowdown y p50/p90/p99/max de waiting, turnaround, response y slowdown
+      - counters: contadores del kernel (ver SimulationCounters)
+    """
+    return run_policy(original, SJFPolicy(), per_process=per_process, compact_timeline=compact_timeline)
+
+def simulate_rr(
+    original: Workload,
+    quantum: int,
+    per_process: bool = True,
+    compress_rounds: bool = False,
+    compact_timeline: bool = False,
+) -> Dict[str, Any]:
+    """
+    Simula planificación ROUND ROBIN con quantum fijo.
 
-        # Durante este quantum pudieron llegar procesos nuevos
-        while i < n and procs_sorted[i].arrival <= time:
-            ready.append(procs_sorted[i])
-            i += 1
+    Las rondas completas entre eventos se calculan de un solo golpe, así que el costo de la
+    simulación depende de las llegadas y terminaciones, no del número de rebanadas. El
+    timeline sigue teniendo un segmento por rebanada, salvo con compress_rounds=True, donde
+    cada tramo de rondas saltadas es un solo segmento (ver expand_rounds).
 
-        if p.remaining == 0:
-            p.completion_time = time
-            completed += 1
-        else:
-            # Todavía le falta burst: va al final de la cola
-            ready.append(p)
+    Regresa:
+      - algorithm: nombre del algoritmo
+      - timeline: lista de segmentos (inicio, fin, pid | None); CompactTimeline con compact_timeline=True
+      - processes: métricas por proceso (se omite con per_process=False)
+      - avg_waiting, avg_turnaround, avg_response
+      - avg_slowdown y p50/p90/p99/max de waiting, turnaround, response y slowdown
+      - counters: contadores del kernel (ver SimulationCounters)
+    """
+    return run_policy(original, RoundRobinPolicy(quantum, compress_rounds), per_process=per_process, compact_timeline=compact_timeline)
 
-    metrics = compute_metrics(processes)
+def iter_rounds(timeline: Iterable[tuple[int, int, Any]], quantum: int) -> Iterator[tuple[int, int, Any]]:
+    """
+    Recorre el timeline expandiendo los segmentos comprimidos de Round Robin (pid como
+    tupla de pids) en un segmento por rebanada de `quantum`, sin materializarlos.
+    """
+    for start, end, pid in timeline:
+        if not isinstance(pid, tuple):
+            yield start, end, pid
+            continue
+        k = len(pid)
+        for i, t in enumerate(range(start, end, quantum)):
+            yield t, t + quantum, pid[i % k]
 
-    return {
-        "algorithm": f"Round Robin (q={quantum})",
-        "timeline": timeline,
-        **metrics,
-    }
+def expand_rounds(timeline: Iterable[tuple[int, int, Any]], quantum: int) -> List[tuple[int, int, Any]]:
+    """
+    Expande los segmentos comprimidos de Round Robin (pid como tupla de pids) en un
+    segmento por rebanada de `quantum`.
+    """
+    return list(iter_rounds(timeline, quantum))
 
-def simulate_srtf(original: List[Process]) -> Dict[str, Any]:
+def simulate_srtf(original: Workload, per_process: bool = True, compact_timeline: bool = False) -> Dict[str, Any]:
     """
     Simula Shortest Remaining Time First (SRTF), versión expulsiva de SJF.
 
+    La simulación es dirigida por eventos: solo se despierta en la siguiente llegada o
+    al terminar el proceso actual, así que cuesta O((n + expulsiones) log n) sin
+    importar el tamaño de las ráfagas.
+
     Regresa:
       - algorithm: nombre del algoritmo
-      - timeline: lista de segmentos (inicio, fin, pid | None)
-      - processes: métricas por proceso
+      - timeline: lista de segmentos (inicio, fin, pid | None); CompactTimeline con compact_timeline=True
+      - processes: métricas por proceso (se omite con per_process=False)
       - avg_waiting, avg_turnaround, avg_response
+      - avg_slowdown y p50/p90/p99/max de waiting, turnaround, response y slowdown
+      - counters: contadores del kernel (ver SimulationCounters)
     """
-    # Clonamos procesos para no modificar los originales
-    procs = [Process(pid=p.pid, arrival=p.arrival, burst=p.burst, priority=p.priority) for p in original]
-
-    n = len(procs)
-    finished = 0
-    timeline: List[tuple[int, int, Optional[int]]] = []
-
-    if n == 0:
-        metrics = compute_metrics(procs)
-        return {"algorithm": "SRTF", "timeline": timeline, **metrics}
-
     # Empezamos en el primer tiempo de llegada
-    time = min(p.arrival for p in procs)
+    return run_policy(original, SRTFPolicy(), start=None, per_process=per_process, compact_timeline=compact_timeline)
+
+def simulate_priority(
+    original: Workload,
+    preemptive: bool = False,
+    aging: Optional[int] = None,
+    per_process: bool = True,
+    compact_timeline: bool = False,
+) -> Dict[str, Any]:
+    """
+    Simula planificación por PRIORIDADES usando Process.priority (menor número = mayor
+    prioridad), expulsiva o no. Con aging, la prioridad de un proceso mejora un nivel por
+    cada `aging` unidades de tiempo desde su llegada, lo que evita la inanición.
 
-    current: Optional[Process] = None
-    segment_start: Optional[int] = None
+    Usa un montículo con llave fija, así que cuesta O((n + expulsiones) log n).
 
-    while finished < n:
-        # Procesos listos con ráfaga pendiente
-        ready = [p for p in procs if p.arrival <= time and p.remaining > 0]
+    Regresa:
+      - algorithm: nombre del algoritmo
+      - timeline: lista de segmentos (inicio, fin, pid | None); CompactTimeline con compact_timeline=True
+      - processes: métricas por proceso (se omite con per_process=False)
+      - avg_waiting, avg_turnaround, avg_response
+      - avg_slowdown y p50/p90/p99/max de waiting, turnaround, response y slowdown
+      - counters: contadores del kernel (ver SimulationCounters)
+    """
+    return run_policy(original, PriorityPolicy(preemptive, aging), per_process=per_process, compact_timeline=compact_timeline)
+
+def simulate_mlfq(
+    original: Workload,
+    quanta: Sequence[Optional[int]] = (2, 4, 8),
+    boost: Optional[int] = None,
+    per_process: bool = True,
+    compact_timeline: bool = False,
+) -> Dict[str, Any]:
+    """
+    Simula una MULTILEVEL FEEDBACK QUEUE con len(quanta) niveles. `quanta[i]` es el
+    quantum del nivel i (None en el último = hasta terminar) y con `boost` todos los
+    procesos regresan al nivel 0 cada `boost` unidades de tiempo.
 
-        if not ready:
-            # CPU libre hasta el siguiente arrival
-            next_arrival = min(p.arrival for p in procs if p.remaining > 0)
-            if time < next_arrival:
-                timeline.append((time, next_arrival, None))
-                time = next_arrival
-            continue
+    Cada despacho, expulsión y boost es un evento, así que cuesta O(eventos log n).
 
-        # Elegimos el de menor tiempo restante (empates: arrival, pid)
-        ready.sort(key=lambda p: (p.remaining, p.arrival, p.pid))
-        chosen = ready[0]
-
-        # Si cambiamos de proceso, cerramos el segmento anterior
-        if chosen is not current:
-            if current is not None and segment_start is not None:
-                timeline.append((segment_start, time, current.pid))
-            current = chosen
-            segment_start = time
-
-            # Registrar primer uso de CPU
-            if current.start_time == -1:
-                current.start_time = time
-
-        # Ejecutamos 1 unidad de tiempo
-        current.remaining -= 1
-        time += 1
-
-        # Si terminó, fijamos completion_time y cerramos segmento
-        if current.remaining == 0:
-            current.completion_time = time
-            finished += 1
-            if segment_start is not None:
-                timeline.append((segment_start, time, current.pid))
-            current = None
-            segment_start = None
-
-    # Calculamos las metricas
-    metrics = compute_metrics(procs)
-
-    return {
-        "algorithm": "SRTF",
-        "timeline": timeline,
-        **metrics,
-    }
+    Regresa:
+      - algorithm: nombre del algoritmo
+      - timeline: lista de segmentos (inicio, fin, pid | None); CompactTimeline con compact_timeline=True
+      - processes: métricas por proceso (se omite con per_process=False)
+      - avg_waiting, avg_turnaround, avg_response
+      - avg_slowdown y p50/p90/p99/max de waiting, turnaround, response y slowdown
+      - counters: contadores del kernel (ver SimulationCounters)
+    """
+    return run_policy(original, MLFQPolicy(quanta, boost), per_process=per_process, compact_timeline=compact_timeline)
+
+AlgorithmFn = Callable[..., Dict[str, Any]]
+
+# Registro único de algoritmos: nombre -> simulate_* con sus parámetros fijos. Se usan
+# functools.partial para que se puedan mandar a otros procesos y para que la caché de
+# experimentos vea sus parámetros (por ejemplo el quantum).
+ALGORITHMS: Dict[str, AlgorithmFn] = {
+    "FCFS": simulate_fcfs,
+    "SJF": simulate_sjf,
+    "SRTF": simulate_srtf,
+    "RR_q2": functools.partial(simulate_rr, quantum=2),
+    "PRIO": simulate_priority,
+    "PRIO_P": functools.partial(simulate_priority, preemptive=True),
+    "MLFQ": simulate_mlfq,
+}
+
+# Algoritmos que se comparan por defecto (experimentos, comparador y benchmark)
+DEFAULT_ALGORITHMS = ("FCFS", "SJF", "SRTF", "RR_q2")
+
+def get_algorithm(name: str) -> AlgorithmFn:
+    """
+    Busca un algoritmo del registro por nombre. Además de los de ALGORITHMS acepta
+    RR_q<quantum> para Round Robin con cualquier quantum (por ejemplo RR_q8).
+    """
+    if name in ALGORITHMS:
+        return ALGORITHMS[name]
+    quantum = name[len("RR_q"):]
+    if name.startswith("RR_q") and quantum.isdigit() and int(quantum) > 0:
+        return functools.partial(simulate_rr, quantum=int(quantum))
+    raise ValueError(f"Algoritmo desconocido: {name} (opciones: {', '.join(ALGORITHMS)}, RR_q<quantum>)")
+
+def select_algorithms(names: Optional[Iterable[str]] = None) -> List[tuple[str, AlgorithmFn]]:
+    """Pares (nombre, algoritmo) para `names`, o para DEFAULT_ALGORITHMS si es None."""
+    return [(name, get_algorithm(name)) for name in (DEFAULT_ALGORITHMS if names is None else names)]
+
+def summary_options(fn: AlgorithmFn) -> Dict[str, Any]:
+    """
+    Argumentos para correr `fn` solo por sus promedios y contadores: sin métricas por
+    proceso y con el timeline más corto posible. Round Robin comprime las rondas saltadas
+    (compress_rounds) en vez de guardar un segmento por rebanada; los demás usan el
+    timeline compacto.
+    """
+    if getattr(fn, "func", fn) is simulate_rr:
+        return {"per_process": False, "compress_rounds": True}
+    return {"per_process": False, "compact_timeline": True}
 
 def demo_processes() -> List[Process]:
     """Conjunto de procesos de ejemplo para probar el simulador."""
@@ -319,22 +1708,19 @@ def print_results(result: Dict[str, Any]) -> None:
         label = f"P{pid}" if pid is not None else "IDLE"
         print(f"  [{start:2d}, {end:2d}) -> {label}")
 
-def compare_algorithms(processes: List[Process]) -> None:
+def compare_algorithms(processes: Workload, algorithms: Optional[Iterable[str]] = None) -> None:
     """
     Ejecuta todos los algoritmos sobre el mismo conjunto de procesos y muestra un ranking por métricas (espera, turnaround, respuesta) y un ranking global (suma de rangos).
+    `algorithms` son nombres del registro (por defecto, DEFAULT_ALGORITHMS).
     """
 
-    algorithms = [
-        ("FCFS", lambda procs: simulate_fcfs(procs)),
-        ("SJF", lambda procs: simulate_sjf(procs)),
-        ("SRTF", lambda procs: simulate_srtf(procs)),
-        ("RR_q2", lambda procs: simulate_rr(procs, quantum=2)),
-    ]
+    # Convertimos una sola vez; todos los algoritmos leen la misma tabla sin copiarla
+    table = as_process_table(processes)
 
     # Ejecutar todos los algoritmos
     results: dict[str, dict[str, float]] = {}
-    for name, fn in algorithms:
-        res = fn(processes)
+    for name, fn in select_algorithms(algorithms):
+        res = fn(table, **summary_options(fn))
         results[name] = {
             "avg_waiting": res["avg_waiting"],
             "avg_turnaround": res["avg_turnaround"],
@@ -378,33 +1764,35 @@ def compare_algorithms(processes: List[Process]) -> None:
         )
     print()
 
-if __name__ == "__main__":
-    example_processes = [
+def print_summary(name: str, result: Dict[str, Any], timeline: bool = True) -> None:
+    """Imprime los promedios de un algoritmo y, si timeline es True, su timeline."""
+    print("=" * 50)
+    print(f"Algoritmo: {name}")
+    print(f"Tiempo de espera promedio:     {result['avg_waiting']:.2f}")
+    print(f"Tiempo de turnaround promedio: {result['avg_turnaround']:.2f}")
+    print(f"Tiempo de respuesta promedio:  {result['avg_response']:.2f}")
+    if timeline:
+        print("Timeline:")
+        for start, end, pid in result["timeline"]:
+            label = f"P{pid}" if pid is not None else "IDLE"
+            print(f"  {start:2d} - {end:2d}: {label}")
+    print()
+
+def example_processes() -> List[Process]:
+    """Conjunto de procesos del ejemplo de la línea de comandos."""
+    return [
         Process(pid=1, arrival=0, burst=8),
         Process(pid=2, arrival=1, burst=4),
         Process(pid=3, arrival=2, burst=2),
     ]
 
-    # Primero mostramos resultados detallados de cada algoritmo
-    algorithms = [
-        ("FCFS", lambda procs: simulate_fcfs(procs)),
-        ("SJF", lambda procs: simulate_sjf(procs)),
-        ("SRTF", lambda procs: simulate_srtf(procs)),
-        ("RR_q2", lambda procs: simulate_rr(procs, quantum=2)),
-    ]
+if __name__ == "__main__":
+    # Equivale a `python -m src simulate` seguido de `python -m src compare`
+    processes = example_processes()
 
-    for name, algo in algorithms:
-        print("=" * 50)
-        print(f"Algoritmo: {name}")
-        result = algo(example_processes)
-        print(f"Tiempo de espera promedio:     {result['avg_waiting']:.2f}")
-        print(f"Tiempo de turnaround promedio: {result['avg_turnaround']:.2f}")
-        print(f"Tiempo de respuesta promedio:  {result['avg_response']:.2f}")
-        print("Timeline:")
-        for start, end, pid in result["timeline"]:
-            label = f"P{pid}" if pid is not None else "IDLE"
-            print(f"  {start:2d} - {end:2d}: {label}")
-        print()
+    # Primero mostramos resultados detallados de cada algoritmo
+    for name, algo in select_algorithms():
+        print_summary(name, algo(processes))
 
     # Luego mostramos el ranking comparado
-    compare_algorithms(example_processes)
\ No newline at end of file
+    compare_algorithms(processes)
@@ -0,0 +1,157 @@
+"""
+Simulación en streaming: las llegadas se leen de cualquier iterable ordenado por llegada
+(por ejemplo, un lector de archivo) y los resultados se entregan conforme quedan definitivos.
+
+La memoria queda acotada por el tamaño de la cola de listos y no por el largo de la traza:
+ni el timeline ni la lista de procesos se materializan, y las métricas agregadas se
+llevan en un MetricsAccumulator (sumas e histogramas de tamaño acotado).
+"""
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence, Tuple
+
+from src.cpu_scheduler import (
+    FCFSPolicy,
+    MetricsAccumulator,
+    MLFQPolicy,
+    PriorityPolicy,
+    ProcessTable,
+    RoundRobinPolicy,
+    SchedulingPolicy,
+    Simulator,
+    SJFPolicy,
+    SRTFPolicy,
+    iter_rounds,
+)
+
+# Cada elemento que produce el stream es (tipo, dato):
+#   ("segment", (inicio, fin, pid | None))  segmento del timeline ya cerrado
+#   ("process", {...})                      métricas de un proceso que ya terminó
+#   ("summary", {...})                      al final: algoritmo, número de procesos, promedios, percentiles y contadores
+StreamItem = Tuple[str, Any]
+
+def _rows(arrivals: Iterable[Any]) -> Iterator[tuple[Any, int, int, int]]:
+    """
+    Normaliza las llegadas a filas (pid, arrival, burst, priority). Acepta una ProcessTable
+    (se recorre en orden de llegada aunque sus filas no lo estén), objetos con esos
+    atributos (como Process) o tuplas (pid, arrival, burst[, priority]).
+    """
+    if isinstance(arrivals, ProcessTable):
+        if arrivals.ordered:
+            yield from arrivals
+            return
+        pid, arrival, burst, priority = arrivals.pid, arrivals.arrival, arrivals.burst, arrivals.priority
+        for k in arrivals.arrival_order():
+            yield pid[k], arrival[k], burst[k], priority[k]
+        return
+    for item in arrivals:
+        if hasattr(item, "arrival"):
+            yield item.pid, item.arrival, item.burst, getattr(item, "priority", 0)
+        else:
+            pid, arrival, burst, *rest = item
+            yield pid, arrival, burst, rest[0] if rest else 0
+
+def stream_policy(arrivals: Iterable[Any], policy: SchedulingPolicy, start: Optional[int] = 0) -> Iterator[StreamItem]:
+    """
+    Simula en streaming cualquier SchedulingPolicy.
+
+    Las llegadas deben venir ordenadas por tiempo; para obtener exactamente lo mismo que
+    los simulate_*, los empates de llegada deben venir ordenados por pid.
+    """
+    sim = Simulator(policy, start=start)
+    sim.add_arrivals(_rows(arrivals))
+    sim.finished = []
+
+    timeline = sim.timeline
+    finished = sim.finished
+    columns = (
+        sim.pid, sim.arrival, sim.burst, sim.priority,
+        sim.remaining, sim.start_time, sim.completion_time,
+    )
+
+    accumulator = MetricsAccumulator()
+
+    while sim.step():
+        # Con compress_rounds las rondas saltadas llegan como un solo segmento y se
+        # expanden conforme se consumen: la memoria no crece con ráfaga / quantum
+        segments = iter_rounds(timeline, policy.quantum) if policy.compress_rounds else timeline
+        for segment in segments:
+            yield "segment", segment
+        timeline.clear()
+
+        for job in finished:
+            arrival = sim.arrival[job]
+            burst = sim.burst[job]
+            start_time = sim.start_time[job]
+            completion = sim.completion_time[job]
+
+            waiting, turnaround, response = accumulator.add(arrival, burst, start_time, completion)
+
+            yield "process", {
+                "pid": sim.pid[job],
+                "arrival": arrival,
+                "burst": burst,
+                "start": start_time,
+                "completion": completion,
+                "waiting": waiting,
+                "turnaround": turnaround,
+                "response": response,
+            }
+
+            # El proceso ya no se vuelve a consultar: liberamos su estado
+            for column in columns:
+                del column[job]
+        finished.clear()
+
+    yield "summary", {
+        "algorithm": policy.name,
+        "count": accumulator.count,
+        **accumulator.summary(),
+        "counters": sim.counter_summary(),
+    }
+
+def stream_fcfs(arrivals: Iterable[Any]) -> Iterator[StreamItem]:
+    """FCFS en streaming."""
+    return stream_policy(arrivals, FCFSPolicy())
+
+def stream_sjf(arrivals: Iterable[Any]) -> Iterator[StreamItem]:
+    """SJF no expulsivo en streaming."""
+    return stream_policy(arrivals, SJFPolicy())
+
+def stream_rr(arrivals: Iterable[Any], quantum: int) -> Iterator[StreamItem]:
+    """Round Robin en streaming (las rondas saltadas se expanden rebanada por rebanada al consumirse)."""
+    return stream_policy(arrivals, RoundRobinPolicy(quantum, compress_rounds=True))
+
+def stream_srtf(arrivals: Iterable[Any]) -> Iterator[StreamItem]:
+    """SRTF en streaming (el reloj empieza en la primera llegada, como simulate_srtf)."""
+    return stream_policy(arrivals, SRTFPolicy(), start=None)
+
+def stream_priority(arrivals: Iterable[Any], preemptive: bool = False, aging: Optional[int] = None) -> Iterator[StreamItem]:
+    """Planificación por prioridades en streaming."""
+    return stream_policy(arrivals, PriorityPolicy(preemptive, aging))
+
+def stream_mlfq(arrivals: Iterable[Any], quanta: Sequence[Optional[int]] = (2, 4, 8), boost: Optional[int] = None) -> Iterator[StreamItem]:
+    """MLFQ en streaming."""
+    return stream_policy(arrivals, MLFQPolicy(quanta, boost))
+
+def collect(stream: Iterable[StreamItem]) -> Dict[str, Any]:
+    """
+    Junta un stream en el diccionario de resultados de siempre (útil en pruebas y cargas chicas).
+    Los procesos quedan en orden de terminación.
+    """
+    timeline = []
+    processes = []
+    summary: Dict[str, Any] = {}
+    for kind, data in stream:
+        if kind == "segment":
+            timeline.append(data)
+        elif kind == "process":
+            processes.append(data)
+        else:
+            summary = dict(data)
+    summary.pop("count", None)
+    algorithm = summary.pop("algorithm")
+    return {
+        "algorithm": algorithm,
+        "timeline": timeline,
+        "processes": processes,
+        **summary,
+    }
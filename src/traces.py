@@ -0,0 +1,133 @@
+"""
+Formato binario de trazas (pid, arrival, burst, priority) con carga mapeada en memoria.
+
+Estructura del archivo (little-endian):
+  - encabezado de 32 bytes: firma b"CPUTRACE", versión (uint32), banderas (uint32),
+    número de procesos n (uint64) y 8 bytes reservados
+  - cuatro columnas de n enteros int64 cada una, en orden: pid, arrival, burst, priority
+
+Como cada columna es un bloque contiguo de ancho fijo, `load_trace` las expone como
+memoryview sobre el archivo mapeado (mmap): no hay parseo ni copia, y el sistema operativo
+solo lee las páginas que la simulación toca.
+"""
+import argparse
+import csv
+import mmap
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Union
+
+from src.cpu_scheduler import ProcessTable, Workload, as_process_table
+
+MAGIC = b"CPUTRACE"
+VERSION = 1
+HEADER = struct.Struct("<8sIIQQ")
+COLUMNS = ("pid", "arrival", "burst", "priority")
+
+# Banderas del encabezado
+FLAG_SORTED = 1 # las filas ya están ordenadas por (arrival, pid)
+
+PathLike = Union[str, Path]
+
+def _is_sorted(table: ProcessTable) -> bool:
+    pid, arrival = table.pid, table.arrival
+    return all((arrival[k], pid[k]) <= (arrival[k + 1], pid[k + 1]) for k in range(len(arrival) - 1))
+
+def _column_bytes(column: Iterable[int]) -> bytes:
+    data = column if isinstance(column, array) else array("q", column)
+    if sys.byteorder != "little":
+        data = array("q", data)
+        data.byteswap()
+    return data.tobytes()
+
+def write_trace(path: PathLike, processes: Workload) -> int:
+    """Escribe una carga (lista de Process o ProcessTable) como traza binaria. Regresa n."""
+    table = as_process_table(processes)
+    if not isinstance(table.pid, array):
+        raise ValueError("El formato de traza solo admite pids enteros")
+
+    n = len(table)
+    flags = FLAG_SORTED if _is_sorted(table) else 0
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, flags, n, 0))
+        for column in (table.pid, table.arrival, table.burst, table.priority):
+            f.write(_column_bytes(column))
+    return n
+
+def _read_csv(path: PathLike) -> Iterator[tuple[int, int, int, int]]:
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            yield int(row["pid"]), int(row["arrival"]), int(row["burst"]), int(row.get("priority") or 0)
+
+def read_csv_table(path: PathLike) -> ProcessTable:
+    """Lee un CSV con columnas pid, arrival, burst[, priority] como ProcessTable."""
+    columns = tuple(array("q") for _ in COLUMNS)
+    for row in _read_csv(path):
+        for column, value in zip(columns, row):
+            column.append(value)
+    return ProcessTable(*columns)
+
+def csv_to_trace(csv_path: PathLike, trace_path: PathLike) -> int:
+    """
+    Convierte un CSV con columnas pid, arrival, burst[, priority] a traza binaria.
+    Regresa el número de procesos escritos.
+    """
+    return write_trace(trace_path, read_csv_table(csv_path))
+
+def read_header(path: PathLike) -> tuple[int, int, int]:
+    """Regresa (versión, banderas, n) validando la firma del archivo."""
+    with open(path, "rb") as f:
+        raw = f.read(HEADER.size)
+    if len(raw) < HEADER.size:
+        raise ValueError(f"{path}: archivo de traza truncado")
+    magic, version, flags, n, _ = HEADER.unpack(raw)
+    if magic != MAGIC:
+        raise ValueError(f"{path}: no es un archivo de traza")
+    if version != VERSION:
+        raise ValueError(f"{path}: versión de traza no soportada ({version})")
+    return version, flags, n
+
+def load_trace(path: PathLike) -> ProcessTable:
+    """
+    Carga una traza binaria como ProcessTable cuyas columnas son vistas sobre el archivo
+    mapeado en memoria (de solo lectura). Es casi instantáneo sin importar el tamaño.
+    Si la traza se escribió ya ordenada por llegada, la tabla queda marcada como ordered.
+    """
+    _, flags, n = read_header(path)
+    ordered = bool(flags & FLAG_SORTED)
+    size = HEADER.size + 8 * n * len(COLUMNS)
+    with open(path, "rb") as f:
+        if n == 0:
+            return ProcessTable(array("q"), array("q"), array("q"), array("q"))
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if len(mapped) < size:
+        raise ValueError(f"{path}: archivo de traza truncado")
+
+    view = memoryview(mapped)
+    columns = [view[HEADER.size + 8 * n * i:HEADER.size + 8 * n * (i + 1)] for i in range(len(COLUMNS))]
+    if sys.byteorder == "little":
+        # Las vistas mantienen vivo el mapeo mientras la tabla exista
+        return ProcessTable(*(column.cast("q") for column in columns), ordered=ordered)
+
+    swapped = []
+    for column in columns:
+        data = array("q", column.tobytes())
+        data.byteswap()
+        swapped.append(data)
+    return ProcessTable(*swapped, ordered=ordered)
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Convierte un CSV de procesos a traza binaria.")
+    parser.add_argument("csv", help="CSV con columnas pid, arrival, burst[, priority]")
+    parser.add_argument("trace", help="archivo de traza de salida")
+    args = parser.parse_args(argv)
+
+    n = csv_to_trace(args.csv, args.trace)
+    print(f"{n} procesos escritos en {args.trace}")
+
+if __name__ == "__main__":
+    main()
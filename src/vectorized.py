@@ -0,0 +1,182 @@
+"""
+Simulaciones vectorizadas con NumPy para cargas de millones de procesos.
+
+Requiere `numpy`; el resto del simulador no depende de este módulo.
+"""
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+def _as_int_array(values: Any) -> np.ndarray:
+    return np.asarray(values, dtype=np.int64)
+
+def simulate_fcfs_arrays(arrival: Any, burst: Any, pid: Optional[Any] = None) -> Dict[str, Any]:
+    """
+    Versión vectorizada de FIRST-COME, FIRST-SERVED sobre arreglos.
+
+    En FCFS el fin de cada proceso sigue la recurrencia
+        completion_i = max(completion_{i-1}, arrival_i) + burst_i
+    que, con S_i = burst_0 + ... + burst_i, se resuelve como
+        completion_i = S_i + max(0, max_{j <= i} (arrival_j - S_{j-1}))
+    con una suma acumulada y un máximo acumulado.
+
+    Regresa (todo en orden de llegada, desempatando por pid como simulate_fcfs):
+      - pid, arrival, burst, start, completion, waiting, turnaround, response: arreglos por proceso
+      - idle_start, idle_end: huecos de CPU libre
+      - avg_waiting, avg_turnaround, avg_response
+    """
+    arrival = _as_int_array(arrival)
+    burst = _as_int_array(burst)
+    if arrival.shape != burst.shape or arrival.ndim != 1:
+        raise ValueError("arrival y burst deben ser arreglos 1-D del mismo tamaño")
+    if pid is None:
+        pid = np.arange(1, len(arrival) + 1, dtype=np.int64)
+    else:
+        pid = np.asarray(pid)
+
+    # Orden de llegada estable, desempatando por pid
+    order = np.lexsort((pid, arrival))
+    arrival = arrival[order]
+    burst = burst[order]
+    pid = pid[order]
+
+    total = np.cumsum(burst)
+    before = total - burst # S_{i-1}
+    offset = np.maximum.accumulate(arrival - before)
+    np.maximum(offset, 0, out=offset) # el reloj empieza en 0
+    completion = total + offset
+    start = completion - burst
+
+    turnaround = completion - arrival
+    waiting = turnaround - burst
+    response = start - arrival
+
+    # La CPU está libre entre el fin del proceso anterior y una llegada posterior
+    n = len(arrival)
+    previous_end = np.concatenate(([0], completion[:-1]))[:n]
+    idle = arrival > previous_end
+
+    return {
+        "algorithm": "FCFS",
+        "pid": pid,
+        "arrival": arrival,
+        "burst": burst,
+        "start": start,
+        "completion": completion,
+        "waiting": waiting,
+        "turnaround": turnaround,
+        "response": response,
+        "idle_start": previous_end[idle],
+        "idle_end": arrival[idle],
+        "avg_waiting": waiting.sum() / n if n else 0.0,
+        "avg_turnaround": turnaround.sum() / n if n else 0.0,
+        "avg_response": response.sum() / n if n else 0.0,
+    }
+
+def _batch_inputs(arrival: Any, burst: Any, lengths: Optional[Any]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Valida el lote y regresa (arrival, burst, máscara de procesos válidos)."""
+    arrival = _as_int_array(arrival)
+    burst = _as_int_array(burst)
+    if arrival.shape != burst.shape or arrival.ndim != 2:
+        raise ValueError("arrival y burst deben ser arreglos 2-D (cargas × procesos) del mismo tamaño")
+    rows, width = arrival.shape
+    if lengths is None:
+        valid = np.ones((rows, width), dtype=bool)
+    else:
+        lengths = _as_int_array(lengths)
+        valid = np.arange(width)[None, :] < lengths[:, None]
+    return arrival, burst, valid
+
+def _batch_result(algorithm: str, arrival: np.ndarray, burst: np.ndarray, start: np.ndarray, valid: np.ndarray) -> Dict[str, Any]:
+    """Métricas promedio por fila a partir de los tiempos de inicio de cada proceso."""
+    completion = start + burst
+    turnaround = np.where(valid, completion - arrival, 0)
+    waiting = np.where(valid, turnaround - burst, 0)
+    response = np.where(valid, start - arrival, 0)
+    # Una fila vacía suma 0; dividir entre 1 deja su promedio en 0.0
+    counts = np.maximum(valid.sum(axis=1), 1)
+    return {
+        "algorithm": algorithm,
+        "start": np.where(valid, start, -1),
+        "completion": np.where(valid, completion, -1),
+        "avg_waiting": waiting.sum(axis=1) / counts,
+        "avg_turnaround": turnaround.sum(axis=1) / counts,
+        "avg_response": response.sum(axis=1) / counts,
+    }
+
+def simulate_fcfs_batch(arrival: Any, burst: Any, lengths: Optional[Any] = None) -> Dict[str, Any]:
+    """
+    FCFS sobre un lote de cargas chicas en una sola llamada.
+
+    `arrival` y `burst` son arreglos 2-D (cargas × procesos), rellenados a la derecha;
+    `lengths` indica cuántos procesos válidos tiene cada fila (por defecto, todos). El pid
+    de cada proceso es su columna, así que los empates de llegada se resuelven como en
+    simulate_fcfs con pids 1..n. Es la misma recurrencia de simulate_fcfs_arrays aplicada
+    por filas.
+
+    Regresa avg_waiting, avg_turnaround y avg_response como arreglos de una entrada por fila,
+    además de start y completion por proceso (-1 en el relleno).
+    """
+    arrival, burst, valid = _batch_inputs(arrival, burst, lengths)
+
+    # El relleno va al final y no consume CPU
+    sort_arrival = np.where(valid, arrival, np.iinfo(np.int64).max)
+    order = np.argsort(sort_arrival, axis=1, kind="stable")
+    a = np.take_along_axis(arrival, order, axis=1)
+    b = np.take_along_axis(np.where(valid, burst, 0), order, axis=1)
+    v = np.take_along_axis(valid, order, axis=1)
+
+    total = np.cumsum(b, axis=1)
+    before = total - b
+    # El relleno no debe mover el máximo acumulado
+    offset = np.maximum.accumulate(np.where(v, a - before, np.iinfo(np.int64).min), axis=1)
+    np.maximum(offset, 0, out=offset)
+    start_sorted = before + offset
+
+    start = np.empty_like(start_sorted)
+    np.put_along_axis(start, order, start_sorted, axis=1)
+    return _batch_result("FCFS", arrival, burst, start, valid)
+
+def simulate_sjf_batch(arrival: Any, burst: Any, lengths: Optional[Any] = None) -> Dict[str, Any]:
+    """
+    SJF no expulsivo sobre un lote de cargas chicas en una sola llamada.
+
+    Mismo formato de entrada y salida que simulate_fcfs_batch. Cada despacho se decide para
+    todas las filas a la vez: entre los procesos que ya llegaron se elige el de menor
+    ráfaga, desempatando por llegada y luego por columna (pid), como simulate_sjf. El costo
+    es O(cargas × procesos²) en operaciones vectorizadas, pensado para cargas de decenas
+    de procesos.
+    """
+    arrival, burst, valid = _batch_inputs(arrival, burst, lengths)
+    rows, width = arrival.shape
+    big = np.iinfo(np.int64).max
+    row_index = np.arange(rows)
+
+    undone = valid.copy()
+    start = np.full((rows, width), -1, dtype=np.int64)
+    time = np.zeros(rows, dtype=np.int64)
+
+    for _ in range(width):
+        active = undone.any(axis=1)
+        if not active.any():
+            break
+
+        # Sin procesos listos, la CPU queda libre hasta la siguiente llegada
+        next_arrival = np.where(undone, arrival, big).min(axis=1)
+        time = np.where(active, np.maximum(time, next_arrival), time)
+        ready = undone & (arrival <= time[:, None])
+
+        # Menor ráfaga, luego menor llegada, luego la primera columna
+        shortest = np.where(ready, burst, big).min(axis=1)
+        candidates = ready & (burst == shortest[:, None])
+        earliest = np.where(candidates, arrival, big).min(axis=1)
+        candidates &= arrival == earliest[:, None]
+        chosen = np.argmax(candidates, axis=1)
+
+        rows_active = row_index[active]
+        chosen = chosen[active]
+        start[rows_active, chosen] = time[active]
+        undone[rows_active, chosen] = False
+        time[active] += burst[rows_active, chosen]
+
+    return _batch_result("SJF (non-preemptive)", arrival, burst, start, valid)
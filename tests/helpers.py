@@ -0,0 +1,30 @@
+"""Utilidades compartidas por las pruebas."""
+import random
+
+from src.cpu_scheduler import Process
+
+
+def random_procs(seed, n=40, max_arrival=100, max_burst=30):
+    """Carga aleatoria reproducible, ordenada por llegada."""
+    rng = random.Random(seed)
+    procs = [
+        Process(pid=k, arrival=rng.randint(0, max_arrival), burst=rng.randint(1, max_burst), priority=rng.randint(0, 3))
+        for k in range(n)
+    ]
+    return sorted(procs, key=lambda p: (p.arrival, p.pid))
+
+
+# Contadores que describen lo que hizo el planificador. Los demás (events, decisions,
+# enqueues, skipped_rounds, timer_ticks) miden el costo de simularlo y cambian al cortar la
+# simulación en checkpoints, ramas o periodos ocupados.
+BEHAVIOUR_COUNTERS = (
+    "dispatches", "context_switches", "preemptions", "quantum_expiries", "completions",
+    "idle_periods", "idle_time", "max_ready", "ready_area", "elapsed",
+)
+
+
+def assert_same_behaviour(result, expected):
+    """Mismo resultado salvo por los contadores de costo."""
+    assert {k: v for k, v in result.items() if k != "counters"} == {k: v for k, v in expected.items() if k != "counters"}
+    counters, expected_counters = result["counters"], expected["counters"]
+    assert {k: counters[k] for k in BEHAVIOUR_COUNTERS} == {k: expected_counters[k] for k in BEHAVIOUR_COUNTERS}
@@ -0,0 +1,41 @@
+import json
+
+import pytest
+
+from experiments.bench import fit_exponent, generate_workload, run_benchmarks, save_json
+from src.cpu_scheduler import simulate_rr
+
+
+def test_fit_exponent_recovers_power_law():
+    sizes = [100, 1000, 10000]
+    assert fit_exponent(sizes, [n ** 2 * 1e-9 for n in sizes]) == pytest.approx(2.0)
+    assert fit_exponent([100], [0.1]) is None
+
+
+def test_small_benchmark_report(tmp_path):
+    """
+    Una corrida chica produce un reporte JSON con una fila por (algoritmo, régimen, tamaño).
+    """
+    report = run_benchmarks(sizes=[50, 100], regimes=["short"], log=lambda _: None)
+
+    assert len(report["runs"]) == 4 * 2
+    for run in report["runs"]:
+        assert run["wall_time"] > 0
+        assert run["peak_memory"] > 0
+        assert run["events"] >= run["n"]
+    assert {f["algorithm"] for f in report["fits"]} == {"FCFS", "SJF", "SRTF", "RR_q2"}
+
+    save_json(report, tmp_path / "bench.json")
+    assert json.loads((tmp_path / "bench.json").read_text())["meta"]["python"]
+
+    table = generate_workload(100, 1, 10, seed=3)
+    assert list(table.arrival) == sorted(table.arrival)
+
+
+def test_memory_guard_skips_larger_sizes():
+    logs = []
+    report = run_benchmarks(sizes=[50, 100], regimes=["mixed"], algorithms=["RR_q2"], max_memory=1, log=logs.append)
+
+    assert [run["n"] for run in report["runs"]] == [50]
+    assert "memoria pico" in logs[-1]
+    assert report["runs"][0]["events"] == simulate_rr(generate_workload(50, 1, 1_000), 2)["counters"]["events"]
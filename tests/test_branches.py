@@ -0,0 +1,138 @@
+import pytest
+
+from src.cpu_scheduler import (
+    FCFSPolicy,
+    MLFQPolicy,
+    Process,
+    ProcessTable,
+    RoundRobinPolicy,
+    Simulator,
+    SimulatorHooks,
+    SJFPolicy,
+    run_policy,
+    simulate_branches,
+)
+from experiments.scenarios import all_scenarios
+
+from helpers import assert_same_behaviour
+
+
+def make_procs():
+    return [
+        Process(pid=1, arrival=0, burst=6),
+        Process(pid=2, arrival=1, burst=4),
+        Process(pid=3, arrival=2, burst=2),
+    ]
+
+
+def test_switch_from_fcfs_to_rr():
+    """
+    FCFS hasta t=3 y después RR (q=2): los listos (P2, P3) pasan en orden FCFS y P1,
+    que estaba en CPU, se forma detrás de ellos.
+    """
+    results = simulate_branches(make_procs(), FCFSPolicy(), at=3, branches={
+        "fcfs": None,
+        "rr": RoundRobinPolicy(2),
+    })
+
+    assert results["fcfs"]["timeline"] == [(0, 6, 1), (6, 10, 2), (10, 12, 3)]
+    assert results["rr"]["timeline"] == [(0, 3, 1), (3, 5, 2), (5, 7, 3), (7, 9, 1), (9, 11, 2), (11, 12, 1)]
+    assert results["rr"]["algorithm"] == "FCFS -> Round Robin (q=2) @ t=3"
+
+
+@pytest.mark.parametrize("scenario", all_scenarios(), ids=lambda s: s.name)
+def test_branches_at_the_edges_match_plain_runs(scenario):
+    procs = scenario.processes
+    late = max(p.arrival for p in procs) + sum(p.burst for p in procs) + 1
+
+    at_zero = simulate_branches(procs, FCFSPolicy(), at=0, branches={"sjf": SJFPolicy(), "rr": RoundRobinPolicy(3)})
+    assert at_zero["sjf"]["processes"] == run_policy(procs, SJFPolicy())["processes"]
+    assert at_zero["rr"]["timeline"] == run_policy(procs, RoundRobinPolicy(3))["timeline"]
+
+    at_end = simulate_branches(procs, FCFSPolicy(), at=late, branches={"mlfq": MLFQPolicy(boost=5)})
+    assert at_end["mlfq"]["timeline"] == run_policy(procs, FCFSPolicy())["timeline"]
+
+
+def test_fork_leaves_the_parent_untouched():
+    sim = Simulator(RoundRobinPolicy(2))
+    sim.load(ProcessTable.from_processes(make_procs()))
+    sim.run(until=4)
+    timeline = list(sim.timeline)
+
+    branch = sim.fork()
+    branch.switch_policy(SJFPolicy())
+    branch.extend([Process(pid=4, arrival=20, burst=1)])
+    branch.run()
+
+    assert list(sim.timeline) == timeline
+    assert len(sim.arrival) == 3
+    assert_same_behaviour(sim.run().result(), run_policy(make_procs(), RoundRobinPolicy(2)))
+
+
+def test_cannot_switch_in_the_past():
+    sim = Simulator(FCFSPolicy())
+    sim.load(ProcessTable.from_processes(make_procs()))
+    sim.run(until=5)
+
+    with pytest.raises(ValueError):
+        sim.switch_policy(SJFPolicy(), at=0)
+
+
+@pytest.mark.parametrize("prefix", [FCFSPolicy(), RoundRobinPolicy(2), MLFQPolicy((2, 4))], ids=lambda p: p.name)
+def test_switch_to_mlfq_while_a_job_is_running(prefix):
+    """El proceso en CPU llega a MLFQ como uno nuevo (nivel 0), aunque MLFQ nunca lo despachó."""
+    procs = make_procs()
+    result = simulate_branches(procs, prefix, at=3, branches={"mlfq": MLFQPolicy((2, 4, None), boost=5)})["mlfq"]
+
+    segments = [s for s in result["timeline"] if s[2] is not None]
+    assert all(end > start for start, end, _ in result["timeline"])
+    for p in procs:
+        assert sum(end - start for start, end, pid in segments if pid == p.pid) == p.burst
+
+
+def test_switch_exactly_when_the_running_job_completes():
+    """P1 termina justo en t=5: no vuelve a la cola ni deja segmentos vacíos."""
+    procs = [Process(pid=1, arrival=0, burst=5), Process(pid=2, arrival=1, burst=5), Process(pid=3, arrival=5, burst=1)]
+    result = simulate_branches(procs, FCFSPolicy(), at=5, branches={"rr": RoundRobinPolicy(2)})["rr"]
+
+    # P3 llega en el mismo instante del cambio y se forma detrás de P2
+    assert result["timeline"] == [(0, 5, 1), (5, 7, 2), (7, 8, 3), (8, 10, 2), (10, 11, 2)]
+    assert [p["completion"] for p in result["processes"]] == [5, 11, 8]
+    assert result["counters"]["preemptions"] == 0
+    assert result["counters"]["completions"] == 3
+
+
+def test_second_switch_at_the_same_instant_undoes_the_first_dispatch():
+    """El despacho del primer cambio en t=4 no deja rastro: ni inicio, ni cambio de contexto, ni hook."""
+    dispatched = []
+
+    class Hooks(SimulatorHooks):
+        def on_dispatch(self, sim, time, job):
+            dispatched.append((time, sim.pid[job]))
+
+    sim = Simulator(FCFSPolicy(), hooks=Hooks())
+    sim.load(ProcessTable.from_processes([
+        Process(pid=1, arrival=0, burst=10),
+        Process(pid=2, arrival=1, burst=5),
+        Process(pid=3, arrival=2, burst=1),
+    ]))
+    sim.run(until=4)
+    sim.switch_policy(RoundRobinPolicy(100), 4) # despacharía a P2
+    sim.switch_policy(SJFPolicy(), 4)           # despacha a P3
+    result = sim.run().result()
+
+    assert result["timeline"] == [(0, 4, 1), (4, 5, 3), (5, 10, 2), (10, 16, 1)]
+    p2 = result["processes"][1]
+    assert (p2["start"], p2["response"]) == (5, 4)
+    assert result["counters"]["dispatches"] == 4
+    assert result["counters"]["context_switches"] == 3
+    assert dispatched == [(0, 1), (4, 3), (5, 2), (10, 1)]
+
+
+def test_switch_rejects_an_instant_already_simulated():
+    sim = Simulator(FCFSPolicy())
+    sim.load(ProcessTable.from_processes([Process(pid=1, arrival=0, burst=3), Process(pid=2, arrival=1, burst=5)]))
+    sim.run(until=4) # en t=3 termina P1 y se despacha P2
+    assert sim.time == 3
+    with pytest.raises(ValueError, match="ya se simularon"):
+        sim.switch_policy(SJFPolicy(), 3)
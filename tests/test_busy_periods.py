@@ -0,0 +1,48 @@
+import functools
+import random
+
+import pytest
+
+from src.busy_periods import BusyPeriods, simulate_busy_periods
+from src.cpu_scheduler import Process, simulate_fcfs, simulate_rr, simulate_sjf, simulate_srtf
+
+
+def make_trace(seed=11, n=60):
+    """Traza ordenada por llegada con tramos de carga ligera (muchos huecos)."""
+    rng = random.Random(seed)
+    procs = [Process(pid=pid, arrival=rng.randint(0, 400), burst=rng.randint(1, 9)) for pid in range(1, n + 1)]
+    procs.sort(key=lambda p: (p.arrival, p.pid))
+    return procs
+
+
+def test_busy_period_bounds():
+    procs = [
+        Process(pid=1, arrival=2, burst=3),
+        Process(pid=2, arrival=4, burst=1),
+        Process(pid=3, arrival=6, burst=2),
+        Process(pid=4, arrival=10, burst=1),
+    ]
+    periods = BusyPeriods(procs)
+
+    assert periods.bounds == [(0, 3, 2, 8), (3, 4, 10, 11)]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_busy_periods_match_full_simulation(workers):
+    """
+    Simular periodo por periodo (en serie o en paralelo) y unir da lo mismo que simular todo.
+    """
+    procs = make_trace()
+    periods = BusyPeriods(procs)
+    assert len(periods) > 3
+
+    algorithms = [simulate_fcfs, simulate_sjf, simulate_srtf, functools.partial(simulate_rr, quantum=2)]
+    for algorithm in algorithms:
+        expected = algorithm(procs)
+        result = simulate_busy_periods(periods, algorithm, workers=workers, chunk_processes=7)
+
+        assert result["timeline"] == expected["timeline"]
+        assert result["processes"] == expected["processes"]
+        for key, value in expected.items():
+            if key not in ("timeline", "processes"):
+                assert result[key] == pytest.approx(value)
@@ -0,0 +1,42 @@
+import functools
+
+from experiments.cache import ResultCache, cell_key
+from experiments.run_experiments import run_all_experiments
+from src.cpu_scheduler import Process, ProcessTable, simulate_rr
+
+
+def test_rerun_reuses_cached_cells(tmp_path):
+    """
+    La segunda ejecución lee todas las celdas de la caché y da las mismas métricas.
+    """
+    with ResultCache(tmp_path / "cache.sqlite") as cache:
+        first = run_all_experiments(cache=cache)
+        second = run_all_experiments(cache=cache)
+
+    assert not any(r["cached"] for r in first)
+    assert all(r["cached"] for r in second)
+    strip = lambda rows: [(r["scenario"], r["algorithm"], r["avg_waiting"], r["avg_turnaround"], r["avg_response"]) for r in rows]
+    assert strip(second) == strip(first)
+
+
+def test_key_depends_on_workload_and_parameters():
+    table = ProcessTable.from_processes([Process(pid=1, arrival=0, burst=3)])
+    other = ProcessTable.from_processes([Process(pid=1, arrival=0, burst=4)])
+    rr2 = functools.partial(simulate_rr, quantum=2)
+    rr3 = functools.partial(simulate_rr, quantum=3)
+
+    assert cell_key(table, rr2) == cell_key(ProcessTable.from_processes([Process(pid=1, arrival=0, burst=3)]), rr2)
+    assert cell_key(table, rr2) != cell_key(other, rr2)
+    assert cell_key(table, rr2) != cell_key(table, rr3)
+
+
+def test_lru_eviction_keeps_size_bounded(tmp_path):
+    with ResultCache(tmp_path / "cache.sqlite", max_bytes=400) as cache:
+        for i in range(50):
+            cache.put(f"k{i}", {"value": i, "padding": "x" * i})
+            cache.get("k0")  # la entrada más usada no se desaloja
+
+        assert cache.size() <= 400
+        assert cache.get("k0") == {"value": 0, "padding": ""}
+        assert cache.get("k1") is None
+        assert cache.get("k49") is not None
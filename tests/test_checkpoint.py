@@ -0,0 +1,104 @@
+import pytest
+
+from src.cpu_scheduler import (
+    MLFQPolicy,
+    Process,
+    ProcessTable,
+    RoundRobinPolicy,
+    Simulator,
+    SRTFPolicy,
+    run_policy,
+)
+from src.traces import load_trace, write_trace
+
+from helpers import assert_same_behaviour, random_procs
+
+
+@pytest.mark.parametrize("make_policy, start", [
+    (lambda: RoundRobinPolicy(3), 0),
+    (SRTFPolicy, None),
+    (lambda: MLFQPolicy((2, 5, None), boost=17), 0),
+])
+def test_resume_with_new_arrivals_matches_full_run(make_policy, start):
+    procs = random_procs(seed=4)
+    cuts = [25, 60]
+
+    sim = Simulator(make_policy(), start=start)
+    sim.load(ProcessTable.from_processes([p for p in procs if p.arrival < cuts[0]]))
+    sim.run(until=cuts[0])
+    assert sim.time < cuts[0]
+
+    # Día siguiente: se recupera el checkpoint y solo se agregan las llegadas nuevas
+    sim = Simulator.restore(sim.checkpoint())
+    sim.extend([p for p in procs if cuts[0] <= p.arrival < cuts[1]])
+    sim.run(until=cuts[1])
+
+    sim = Simulator.restore(sim.checkpoint())
+    sim.extend([p for p in procs if p.arrival >= cuts[1]])
+    result = sim.run().result()
+
+    # Cortar la simulación cambia el costo (eventos, rondas saltadas), no el comportamiento
+    assert_same_behaviour(result, run_policy(procs, make_policy(), start=start))
+
+
+def test_extend_rejects_arrivals_before_checkpoint():
+    sim = Simulator(RoundRobinPolicy(2))
+    sim.load(ProcessTable.from_processes([Process(pid=1, arrival=0, burst=10)]))
+    sim.run(until=5)
+
+    with pytest.raises(ValueError):
+        sim.extend([Process(pid=2, arrival=4, burst=1)])
+
+
+def test_checkpoint_of_mapped_trace_does_not_touch_the_input(tmp_path):
+    procs = random_procs(seed=9, n=20)
+    write_trace(tmp_path / "day1.trace", procs[:10])
+    table = load_trace(tmp_path / "day1.trace")
+
+    sim = Simulator(RoundRobinPolicy(4), compact_timeline=True)
+    sim.load(table)
+    sim.run(until=procs[10].arrival)
+    sim = Simulator.restore(sim.checkpoint())
+    sim.extend(procs[10:])
+    result = sim.run().result()
+
+    assert len(table) == 10
+    expected = run_policy(procs, RoundRobinPolicy(4), compact_timeline=True)
+    assert list(result["timeline"]) == list(expected["timeline"])
+    assert result["processes"] == expected["processes"]
+
+
+@pytest.mark.parametrize("make_policy, start", [
+    (lambda: RoundRobinPolicy(3), 0),
+    (SRTFPolicy, None),
+    (lambda: MLFQPolicy((2, 5, None), boost=17), 0),
+])
+def test_summary_only_checkpoint_keeps_only_live_jobs(make_policy, start):
+    procs = random_procs(seed=6, n=60)
+    cut = 60
+
+    sim = Simulator(make_policy(), start=start)
+    sim.load(ProcessTable.from_processes([p for p in procs if p.arrival < cut]))
+    sim.run(until=cut)
+    full = sim.checkpoint()
+    summary = sim.checkpoint(summary_only=True)
+
+    # Solo quedan las filas de los procesos que no han terminado
+    assert len(summary) < len(full)
+    assert all(sim.completion_time[job] == -1 for job in sim.arrival)
+
+    sim = Simulator.restore(summary)
+    sim.extend([p for p in procs if p.arrival >= cut])
+    result = sim.run().result(per_process=False)
+    expected = run_policy(procs, make_policy(), start=start, per_process=False)
+
+    for key, value in expected.items():
+        if key == "avg_slowdown":
+            assert result[key] == pytest.approx(value)
+        elif key not in ("timeline", "counters"):
+            assert result[key] == value
+    # El timeline solo tiene lo posterior al checkpoint
+    assert result["timeline"] == [segment for segment in expected["timeline"] if segment[0] >= result["timeline"][0][0]]
+    with pytest.raises(ValueError, match="per_process=False"):
+        sim.result()
+
@@ -0,0 +1,71 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from experiments.run_experiments import get_algorithms
+from src.cli import main
+from src.cpu_scheduler import DEFAULT_ALGORITHMS, get_algorithm, select_algorithms, summary_options
+
+
+def test_registry_resolves_names():
+    assert [name for name, _ in select_algorithms()] == list(DEFAULT_ALGORITHMS)
+    assert get_algorithms() == select_algorithms()
+    assert get_algorithm("RR_q5").keywords == {"quantum": 5}
+    with pytest.raises(ValueError, match="RR_q<quantum>"):
+        get_algorithm("RR_q0")
+
+
+def test_summary_options_compress_round_robin():
+    # Solo por métricas: Round Robin comprime sus rondas, el resto usa el timeline compacto
+    assert summary_options(get_algorithm("RR_q8"))["compress_rounds"] is True
+    assert summary_options(get_algorithm("SJF"))["compact_timeline"] is True
+
+
+def test_simulate_prints_summary_and_timeline(capsys):
+    main(["simulate", "--algorithm", "RR_q2"])
+    out = capsys.readouterr().out
+
+    assert "Algoritmo: RR_q2" in out
+    assert "Tiempo de espera promedio:     4.33" in out
+    assert "   0 -  2: P1" in out
+
+
+def test_simulate_json_from_csv(tmp_path, capsys):
+    path = tmp_path / "procs.csv"
+    path.write_text("pid,arrival,burst\n1,0,5\n2,1,2\n")
+    main(["simulate", "--csv", str(path), "--json", "--algorithm", "SJF", "--algorithm", "MLFQ"])
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+    assert [line["name"] for line in lines] == ["SJF", "MLFQ"]
+    assert lines[0]["processes"] == 2
+    assert lines[0]["avg_waiting"] == 2.0
+    assert lines[1]["counters"]["completions"] == 2
+
+
+def test_compare_and_unknown_algorithm(capsys):
+    main(["compare", "--scenario", "batch_jobs", "--algorithm", "FCFS", "--algorithm", "PRIO_P"])
+    assert "PRIO_P" in capsys.readouterr().out
+
+    with pytest.raises(SystemExit, match="Algoritmo desconocido"):
+        main(["simulate", "--algorithm", "LOTTERY"])
+
+
+def test_forwarded_subcommand_uses_module_options(capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        main(["bench", "--help"])
+    assert exit_info.value.code == 0
+    assert "--max-size" in capsys.readouterr().out
+
+
+def test_simulate_does_not_import_heavy_modules():
+    code = (
+        "import sys\n"
+        "from src.cli import main\n"
+        "main(['simulate', '--scenario', 'batch_jobs', '--no-timeline'])\n"
+        "main(['compare'])\n"
+        "print(sorted(m for m in ('numpy', 'matplotlib', 'experiments.run_experiments') if m in sys.modules))\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert out.splitlines()[-1] == "[]"
@@ -1,7 +1,10 @@
+import subprocess
+import sys
+
 import pytest
 
 from experiments.scenarios import all_scenarios
-from experiments.run_experiments import run_all_experiments, get_algorithms
+from experiments.run_experiments import run_all_experiments, get_algorithms, save_csv
 
 def test_run_all_experiments_shape():
     """
@@ -29,3 +32,31 @@ def test_run_all_experiments_shape():
         assert isinstance(r["avg_waiting"], (int, float))
         assert isinstance(r["avg_turnaround"], (int, float))
         assert isinstance(r["avg_response"], (int, float))
+
+def test_parallel_run_matches_serial(tmp_path):
+    """
+    La ejecución en paralelo regresa las filas en el mismo orden y el CSV queda idéntico.
+    """
+    serial = run_all_experiments()
+    parallel = run_all_experiments(workers=2, chunksize=3)
+
+    drop_time = lambda rows: [{k: v for k, v in r.items() if k != "wall_time"} for r in rows]
+    assert drop_time(parallel) == drop_time(serial)
+    assert all(r["wall_time"] >= 0 for r in parallel)
+
+    save_csv(serial, str(tmp_path / "serial.csv"))
+    save_csv(parallel, str(tmp_path / "parallel.csv"))
+    assert (tmp_path / "serial.csv").read_bytes() == (tmp_path / "parallel.csv").read_bytes()
+
+
+def test_runs_without_numpy_when_not_storing():
+    """Sin almacén (--no-store) los experimentos no necesitan NumPy."""
+    code = (
+        "import sys\n"
+        "sys.modules['numpy'] = None\n"  # cualquier import de numpy falla
+        "from experiments import plot_results\n"
+        "from experiments.run_experiments import run_all_experiments\n"
+        "print(len(run_all_experiments()))\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert int(out) == len(all_scenarios()) * len(get_algorithms())
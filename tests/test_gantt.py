@@ -0,0 +1,67 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.cpu_scheduler import Process, simulate_rr, simulate_srtf
+from experiments.gantt import GanttPyramid, pid_labels, timeline_arrays
+from experiments.scenarios import all_scenarios
+
+
+def _overlaps(timeline, edges):
+    """Tiempo de cada pid en cada cubeta, calculado segmento por segmento."""
+    buckets = [{} for _ in range(len(edges) - 1)]
+    for start, end, pid in timeline:
+        for b, per_pid in enumerate(buckets):
+            overlap = min(end, edges[b + 1]) - max(start, edges[b])
+            if pid is not None and overlap > 0:
+                per_pid[pid] = per_pid.get(pid, 0) + overlap
+    return buckets
+
+
+@pytest.mark.parametrize("scenario", all_scenarios(), ids=lambda s: s.name)
+def test_fine_query_matches_segment_overlaps(scenario):
+    timeline = simulate_rr(scenario.processes, quantum=2)["timeline"]
+    pyramid = GanttPyramid(timeline, base_buckets=8)
+    data = pyramid.query(width=40)
+    edges = data["edges"]
+    expected = _overlaps(timeline, edges)
+
+    assert np.allclose(data["utilization"], [sum(b.values()) for b in expected] / np.diff(edges))
+    for pid, per_pid in zip(pid_labels(pyramid, data["dominant"]), expected):
+        assert (pid is None and not per_pid) or per_pid[pid] == max(per_pid.values())
+
+    busy = [(s, pid) for s, _, pid in timeline if pid is not None]
+    switches = sum(1 for (_, a), (_, b) in zip(busy, busy[1:]) if a != b)
+    assert data["switches"].sum() == switches
+
+
+def test_coarse_levels_keep_totals():
+    timeline = simulate_srtf(all_scenarios()[-1].processes, compact_timeline=True)["timeline"]
+    pyramid = GanttPyramid(timeline, base_buckets=16)
+    data = pyramid.query(width=4)
+    busy = sum(end - start for start, end, pid in timeline if pid is not None)
+
+    assert len(pyramid.levels) > 1
+    assert np.sum(data["utilization"] * np.diff(data["edges"])) == pytest.approx(busy, rel=0.25)
+    assert set(pid_labels(pyramid, data["dominant"])) <= {pid for _, _, pid in timeline}
+
+
+def test_compressed_round_robin_timeline_needs_its_quantum():
+    procs = [Process(pid=k, arrival=k, burst=60 + k) for k in range(3)]
+    full = simulate_rr(procs, quantum=2)["timeline"]
+    compressed = simulate_rr(procs, quantum=2, compress_rounds=True)["timeline"]
+    assert any(isinstance(pid, tuple) for _, _, pid in compressed)
+
+    with pytest.raises(ValueError, match="quantum"):
+        timeline_arrays(compressed)
+    for a, b in zip(timeline_arrays(compressed, quantum=2), timeline_arrays(full)):
+        assert np.array_equal(a, b)
+    assert GanttPyramid(compressed, base_buckets=8, quantum=2).query(width=10)["switches"].sum() > 0
+
+
+def test_render_writes_png(tmp_path):
+    pytest.importorskip("matplotlib")
+    timeline = simulate_rr(all_scenarios()[0].processes, quantum=2)["timeline"]
+
+    outfile = GanttPyramid(timeline).render(tmp_path / "gantt.png", width=300)
+    assert outfile.stat().st_size > 0
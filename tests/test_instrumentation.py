@@ -0,0 +1,129 @@
+import pytest
+
+from src.cpu_scheduler import (
+    MLFQPolicy,
+    PriorityPolicy,
+    Process,
+    RoundRobinPolicy,
+    SimulatorHooks,
+    SRTFPolicy,
+    run_policy,
+    simulate_fcfs,
+    simulate_mlfq,
+    simulate_rr,
+    simulate_srtf,
+)
+from src.streaming import collect, stream_rr
+
+from helpers import BEHAVIOUR_COUNTERS, random_procs
+
+
+class RecordingHooks(SimulatorHooks):
+    """Reconstruye el timeline a partir de los hooks."""
+
+    def __init__(self):
+        self.segments = []
+        self.completed = []
+        self._dispatched = None
+
+    def on_dispatch(self, sim, time, job):
+        self._dispatched = (time, job)
+
+    def on_preempt(self, sim, time, job):
+        self._close(sim, time, job)
+
+    def on_complete(self, sim, time, job):
+        self._close(sim, time, job)
+        self.completed.append(sim.pid[job])
+
+    def on_idle(self, sim, start, end):
+        self.segments.append((start, end, None))
+
+    def _close(self, sim, time, job):
+        start, dispatched = self._dispatched
+        assert dispatched == job
+        self.segments.append((start, time, sim.pid[job]))
+
+
+class SliceByRoundRobin(RoundRobinPolicy):
+    """Round Robin sin saltar rondas: simula cada rebanada."""
+    skip_rounds = False
+
+
+def test_counters_for_a_small_round_robin():
+    procs = [
+        Process(pid=1, arrival=0, burst=5),
+        Process(pid=2, arrival=2, burst=3),
+        Process(pid=3, arrival=12, burst=1),
+    ]
+    counters = simulate_rr(procs, quantum=2)["counters"]
+
+    # Timeline: P1 0-2, P2 2-4, P1 4-6, P2 6-7, P1 7-8, libre 8-12, P3 12-13
+    assert counters["dispatches"] == 6
+    assert counters["context_switches"] == 5
+    assert counters["quantum_expiries"] == 3
+    assert counters["preemptions"] == 0
+    assert counters["completions"] == 3
+    assert counters["idle_periods"] == 1
+    assert counters["idle_time"] == 4
+    assert counters["max_ready"] == 1
+    assert counters["elapsed"] == 13
+
+
+@pytest.mark.parametrize("simulate", [simulate_fcfs, simulate_srtf, lambda p: simulate_rr(p, 3), simulate_mlfq])
+def test_ready_area_is_total_waiting_time(simulate):
+    """La integral de la cola de listos es el tiempo de espera total (ley de Little)."""
+    result = simulate(random_procs(seed=2, max_arrival=150, max_burst=40))
+    counters = result["counters"]
+
+    assert counters["ready_area"] == sum(p["waiting"] for p in result["processes"])
+    assert counters["avg_ready"] == pytest.approx(counters["ready_area"] / counters["elapsed"])
+    assert counters["completions"] == len(result["processes"])
+
+
+def test_skipped_rounds_count_like_simulated_slices():
+    procs = [Process(pid=k, arrival=k, burst=200 + 7 * k) for k in range(4)] + [Process(pid=9, arrival=500, burst=3)]
+
+    skipped = run_policy(procs, RoundRobinPolicy(2))["counters"]
+    sliced = run_policy(procs, SliceByRoundRobin(2))["counters"]
+
+    assert skipped["skipped_rounds"] > 0 and sliced["skipped_rounds"] == 0
+    # Saltar rondas cambia el costo, no lo que hizo el planificador
+    assert skipped["events"] < sliced["events"]
+    assert {k: skipped[k] for k in BEHAVIOUR_COUNTERS} == {k: sliced[k] for k in BEHAVIOUR_COUNTERS}
+
+
+@pytest.mark.parametrize("make_policy, start", [
+    (lambda: RoundRobinPolicy(4), 0),
+    (SRTFPolicy, None),
+    (lambda: PriorityPolicy(preemptive=True, aging=5), 0),
+    (lambda: MLFQPolicy((2, 6, None), boost=25), 0),
+])
+def test_hooks_rebuild_the_timeline(make_policy, start):
+    procs = random_procs(seed=8, max_arrival=150, max_burst=40)
+    hooks = RecordingHooks()
+    result = run_policy(procs, make_policy(), start=start, hooks=hooks)
+
+    assert hooks.segments == result["timeline"]
+    assert sorted(hooks.completed) == sorted(p.pid for p in procs)
+    assert result == run_policy(procs, make_policy(), start=start)
+
+
+def test_preemptions_and_timer_ticks():
+    procs = [
+        Process(pid=1, arrival=0, burst=8),
+        Process(pid=2, arrival=1, burst=2),
+    ]
+    counters = simulate_srtf(procs)["counters"]
+    assert counters["preemptions"] == 1
+    assert counters["context_switches"] == 2
+
+    counters = simulate_mlfq(procs, quanta=(2, None), boost=3)["counters"]
+    assert counters["timer_ticks"] == 3
+
+
+def test_streaming_reports_the_same_counters():
+    procs = random_procs(seed=5, max_arrival=150, max_burst=40)
+    expected = simulate_rr(procs, quantum=3)["counters"]
+
+    assert collect(stream_rr(procs, quantum=3))["counters"] == expected
@@ -0,0 +1,51 @@
+from collections import deque
+
+from src.cpu_scheduler import Process, SchedulingPolicy, run_policy, simulate_rr
+
+
+class LIFOPolicy(SchedulingPolicy):
+    """
+    Política de prueba: siempre ejecuta el último proceso que llegó.
+    """
+    name = "LIFO"
+
+    def __init__(self):
+        self.ready = deque()
+
+    def on_arrival(self, sim, job):
+        self.ready.append(job)
+
+    def pick_next(self, sim):
+        return self.ready.pop() if self.ready else None
+
+
+def test_custom_policy_runs_on_kernel():
+    """
+    Una política propia solo implementa on_arrival/pick_next y el kernel hace el resto.
+    """
+    procs = [
+        Process(pid=1, arrival=0, burst=3),
+        Process(pid=2, arrival=1, burst=2),
+        Process(pid=3, arrival=2, burst=2),
+        Process(pid=4, arrival=10, burst=1),
+    ]
+    result = run_policy(procs, LIFOPolicy())
+
+    assert result["algorithm"] == "LIFO"
+    assert result["timeline"] == [(0, 3, 1), (3, 5, 3), (5, 7, 2), (7, 10, None), (10, 11, 4)]
+    # Los procesos se reportan en el orden de entrada y los originales no cambian
+    assert [p["pid"] for p in result["processes"]] == [1, 2, 3, 4]
+    assert all(p.start_time == -1 and p.remaining == p.burst for p in procs)
+
+
+def test_rr_quantum_expiry_after_same_time_arrivals():
+    """
+    En RR, lo que llega justo al vencer el quantum entra a la cola antes que el proceso expulsado.
+    """
+    procs = [
+        Process(pid=1, arrival=0, burst=4),
+        Process(pid=2, arrival=2, burst=2),
+    ]
+    result = simulate_rr(procs, quantum=2)
+
+    assert result["timeline"] == [(0, 2, 1), (2, 4, 2), (4, 6, 1)]
@@ -0,0 +1,63 @@
+import random
+
+import pytest
+
+from src.cpu_scheduler import Histogram, MetricsAccumulator, Process, compute_metrics, simulate_fcfs
+
+
+def test_percentiles_and_slowdown():
+    """
+    Con enteros chicos los percentiles son exactos (rango más cercano).
+    """
+    procs = [
+        Process(pid=1, arrival=0, burst=5),
+        Process(pid=2, arrival=2, burst=3),
+        Process(pid=3, arrival=4, burst=1),
+    ]
+    result = simulate_fcfs(procs)
+
+    # waiting = [0, 3, 4], turnaround = [5, 6, 5]
+    assert result["p50_waiting"] == 3
+    assert result["p90_waiting"] == 4
+    assert result["max_waiting"] == 4
+    assert result["p99_turnaround"] == 6
+    assert result["max_slowdown"] == pytest.approx(5.0)
+    assert result["avg_slowdown"] == pytest.approx((1 + 2 + 5) / 3)
+
+
+def test_summary_only_and_merge():
+    """
+    per_process=False omite la lista de procesos, y combinar acumuladores equivale a
+    haberlos llenado juntos.
+    """
+    procs = [Process(pid=i, arrival=0, burst=1) for i in range(4)]
+    for i, p in enumerate(procs):
+        p.start_time = i
+        p.completion_time = i + 1
+
+    summary = compute_metrics(procs, per_process=False)
+    assert "processes" not in summary
+    assert summary["avg_waiting"] == 1.5
+
+    left, right, both = MetricsAccumulator(), MetricsAccumulator(), MetricsAccumulator()
+    for i, p in enumerate(procs):
+        (left if i % 2 else right).add(p.arrival, p.burst, p.start_time, p.completion_time)
+        both.add(p.arrival, p.burst, p.start_time, p.completion_time)
+    left.merge(right)
+    assert left.summary() == both.summary()
+
+
+def test_histogram_relative_error_on_large_values():
+    rng = random.Random(7)
+    values = [rng.randint(1, 10**9) for _ in range(20_000)]
+    histogram = Histogram()
+    for v in values:
+        histogram.add(v)
+
+    values.sort()
+    for q in (0.5, 0.9, 0.99):
+        exact = values[int(q * len(values)) - 1]
+        assert histogram.quantile(q) == pytest.approx(exact, rel=0.011)
+    assert histogram.max == values[-1]
+    # La memoria depende del rango de valores, no del número de muestras
+    assert len(histogram.buckets) < 1500
@@ -0,0 +1,52 @@
+import pytest
+from src.cpu_scheduler import Process, simulate_fcfs, simulate_mlfq, simulate_rr
+
+def test_demotion_and_preemption_keep_used_time():
+    """
+    P1 agota el quantum del nivel 0 y baja; la llegada de P2 lo expulsa del nivel 1 y al
+    volver solo le queda lo que no usó de ese quantum.
+    """
+    procs = [
+        Process(pid=1, arrival=0, burst=10),
+        Process(pid=2, arrival=3, burst=2),
+    ]
+    result = simulate_mlfq(procs, quanta=(2, 4))
+
+    assert result["algorithm"] == "MLFQ (q=2/4)"
+    assert result["timeline"] == [(0, 2, 1), (2, 3, 1), (3, 5, 2), (5, 8, 1), (8, 12, 1)]
+
+def test_boost_interleaves_long_jobs():
+    procs = [
+        Process(pid=1, arrival=0, burst=10),
+        Process(pid=2, arrival=1, burst=10),
+    ]
+    plain = simulate_mlfq(procs, quanta=(2, None))
+    boosted = simulate_mlfq(procs, quanta=(2, None), boost=6)
+
+    # Sin boost P1 se queda en el último nivel hasta terminar
+    assert (4, 12, 1) in plain["timeline"]
+    # Con boost en t=6, P1 vuelve al nivel 0, agota su quantum y P2 corre antes de que P1 termine
+    assert (8, 10, 2) in boosted["timeline"]
+    assert sum(end - start for start, end, pid in boosted["timeline"] if pid is not None) == 20
+
+def test_single_level_matches_rr_and_fcfs():
+    procs = [
+        Process(pid=1, arrival=0, burst=5),
+        Process(pid=2, arrival=1, burst=3),
+        Process(pid=3, arrival=2, burst=7),
+        Process(pid=4, arrival=12, burst=2),
+        Process(pid=5, arrival=25, burst=4),
+    ]
+    rr = simulate_rr(procs, quantum=2)
+    single = simulate_mlfq(procs, quanta=(2,))
+    assert single["timeline"] == rr["timeline"]
+    assert single["processes"] == rr["processes"]
+
+    fcfs = simulate_fcfs(procs)
+    assert simulate_mlfq(procs, quanta=(None,))["timeline"] == fcfs["timeline"]
+
+def test_invalid_quanta():
+    with pytest.raises(ValueError):
+        simulate_mlfq([], quanta=(2, None, 4))
+    with pytest.raises(ValueError):
+        simulate_mlfq([], quanta=())
@@ -0,0 +1,28 @@
+import pytest
+
+pytest.importorskip("matplotlib")
+
+from experiments.plot_results import plot_per_scenario
+
+
+def _rows(waiting):
+    return {
+        "a": [{"scenario": "a", "algorithm": "FCFS", "avg_waiting": waiting, "avg_turnaround": 5.0, "avg_response": 1.0}],
+        "b": [{"scenario": "b", "algorithm": "SJF", "avg_waiting": 1.0, "avg_turnaround": 2.0, "avg_response": 1.0}],
+    }
+
+
+def test_only_changed_scenarios_are_redrawn(tmp_path):
+    first = plot_per_scenario(_rows(3.0), output_dir=tmp_path)
+    assert sorted(p.name for p in first) == ["a.png", "b.png"]
+
+    assert plot_per_scenario(_rows(3.0), output_dir=tmp_path) == []
+    assert plot_per_scenario(_rows(4.0), workers=2, output_dir=tmp_path) == [tmp_path / "a.png"]
+    assert len(plot_per_scenario(_rows(4.0), force=True, output_dir=tmp_path)) == 2
+
+
+def test_preview_goes_to_its_own_directory(tmp_path):
+    written = plot_per_scenario(_rows(3.0), preview=True, output_dir=tmp_path)
+
+    assert all(p.parent == tmp_path / "preview" for p in written)
+    assert not (tmp_path / "a.png").exists()
@@ -0,0 +1,56 @@
+import pytest
+from src.cpu_scheduler import Process, simulate_fcfs, simulate_priority
+
+def make_procs():
+    return [
+        Process(pid=1, arrival=0, burst=5, priority=3),
+        Process(pid=2, arrival=1, burst=3, priority=1),
+        Process(pid=3, arrival=2, burst=1, priority=2),
+    ]
+
+def test_non_preemptive_priority_order():
+    result = simulate_priority(make_procs())
+
+    assert result["algorithm"] == "Priority (non-preemptive)"
+    assert result["timeline"] == [(0, 5, 1), (5, 8, 2), (8, 9, 3)]
+
+def test_preemptive_priority_order():
+    result = simulate_priority(make_procs(), preemptive=True)
+
+    assert result["timeline"] == [(0, 1, 1), (1, 4, 2), (4, 5, 3), (5, 9, 1)]
+    p1 = next(p for p in result["processes"] if p["pid"] == 1)
+    assert p1["completion"] == 9
+    assert p1["response"] == 0
+
+def test_equal_priorities_behave_like_fcfs():
+    procs = [
+        Process(pid=1, arrival=0, burst=4),
+        Process(pid=2, arrival=2, burst=1),
+        Process(pid=3, arrival=2, burst=3),
+        Process(pid=4, arrival=9, burst=2),
+    ]
+    result = simulate_priority(procs)
+    expected = simulate_fcfs(procs)
+
+    assert result["timeline"] == expected["timeline"]
+    assert result["avg_waiting"] == pytest.approx(expected["avg_waiting"])
+
+def test_aging_prevents_starvation():
+    """
+    Un proceso de baja prioridad frente a un flujo continuo de procesos de prioridad alta:
+    sin envejecimiento corre al final; con aging=1 corre en cuanto los nuevos llegan
+    más tarde que su prioridad envejecida.
+    """
+    procs = [Process(pid=0, arrival=0, burst=1, priority=10)]
+    procs += [Process(pid=k, arrival=2 * (k - 1), burst=2, priority=0) for k in range(1, 31)]
+
+    starved = simulate_priority(procs)
+    aged = simulate_priority(procs, aging=1)
+
+    start = lambda result: next(p["start"] for p in result["processes"] if p["pid"] == 0)
+    assert start(starved) == 60
+    assert start(aged) <= 12
+
+def test_aging_must_be_positive():
+    with pytest.raises(ValueError):
+        simulate_priority(make_procs(), aging=0)
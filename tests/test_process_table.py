@@ -0,0 +1,37 @@
+from array import array
+
+from src.cpu_scheduler import Process, ProcessTable, simulate_fcfs, simulate_rr, simulate_sjf, simulate_srtf
+
+
+def make_procs():
+    return [
+        Process(pid=1, arrival=0, burst=8),
+        Process(pid=2, arrival=1, burst=4),
+        Process(pid=3, arrival=2, burst=2),
+        Process(pid=4, arrival=20, burst=3),
+    ]
+
+
+def test_simulators_accept_process_table():
+    """
+    Todos los simuladores aceptan una ProcessTable y dan lo mismo que con List[Process].
+    """
+    procs = make_procs()
+    table = ProcessTable.from_processes(procs)
+    simulators = [simulate_fcfs, simulate_sjf, simulate_srtf, lambda w: simulate_rr(w, quantum=2)]
+
+    for simulate in simulators:
+        assert simulate(table) == simulate(procs)
+
+    # La tabla de entrada no se modifica
+    assert list(table.burst) == [8, 4, 2, 3]
+    assert isinstance(table.arrival, array)
+
+
+def test_process_table_columns():
+    table = ProcessTable(["A", "B"], [3, 1], [2, 5])
+
+    assert table.pid == ["A", "B"]
+    assert list(table.priority) == [0, 0]
+    assert table.arrival_order() == [1, 0]
+    assert [p.pid for p in table.to_processes()] == ["A", "B"]
@@ -0,0 +1,53 @@
+import subprocess
+import sys
+
+from experiments.profiling import load_profile, print_profile_report, profile_call, save_profile
+from experiments.run_experiments import run_all_experiments
+
+
+def test_profile_call_reports_time_memory_and_hot_functions():
+    def build(n):
+        return sorted([(k * 7919) % n for k in range(n)])
+
+    result, profile = profile_call(build, 50_000, top=3)
+
+    assert result == list(range(50_000))
+    assert profile["wall_time"] >= profile["cpu_time"] * 0.5 > 0
+    # La lista de 50 mil enteros se asignó dentro de la llamada
+    assert profile["peak_memory"] > 50_000 * 8
+    assert 0 < len(profile["hot_functions"]) <= 3
+    assert any("build" in f["function"] or "sorted" in f["function"] for f in profile["hot_functions"])
+
+
+def test_profiled_grid_writes_json_report(tmp_path, capsys):
+    plain = run_all_experiments()
+    rows = run_all_experiments(workers=2, profile=True)
+
+    assert all("profile" not in r for r in plain)
+    metrics = ("scenario", "algorithm", "avg_waiting", "avg_turnaround", "avg_response")
+    assert [{k: r[k] for k in metrics} for r in rows] == [{k: r[k] for k in metrics} for r in plain]
+    for r in rows:
+        assert r["profile"]["wall_time"] == r["wall_time"]
+        assert r["profile"]["counters"]["completions"] > 0
+
+    path = tmp_path / "profile.json"
+    save_profile(rows, str(path))
+    cells = load_profile(str(path))
+    assert [(c["scenario"], c["algorithm"]) for c in cells] == [(r["scenario"], r["algorithm"]) for r in rows]
+
+    print_profile_report(rows, top=3)
+    report = capsys.readouterr().out
+    slowest = max(rows, key=lambda r: r["wall_time"])
+    assert f"{slowest['scenario']} / {slowest['algorithm']}" in report.splitlines()[-3]
+
+
+def test_profiling_modules_load_only_with_profile():
+    code = (
+        "import sys\n"
+        "from experiments.run_experiments import run_all_experiments\n"
+        "run_all_experiments()\n"
+        "print(sorted(m for m in ('cProfile', 'pstats', 'tracemalloc', 'experiments.profiling') if m in sys.modules))\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert out.splitlines()[-1] == "[]"
+
@@ -0,0 +1,107 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.cpu_scheduler import as_process_table, simulate_rr
+from experiments.cache import ResultCache
+from experiments.result_store import ResultStore, detail_columns
+from experiments.run_experiments import run_all_experiments
+from experiments.scenarios import all_scenarios
+
+
+def test_store_holds_summary_and_detail_of_every_cell(tmp_path):
+    store = ResultStore(tmp_path / "store", chunk_rows=3)
+    rows = run_all_experiments(store=store)
+
+    summary = store.read_summary(["scenario", "algorithm", "avg_waiting"])
+    assert summary["scenario"].tolist() == [r["scenario"] for r in rows]
+    assert summary["algorithm"].tolist() == [r["algorithm"] for r in rows]
+    assert np.allclose(summary["avg_waiting"], [r["avg_waiting"] for r in rows])
+
+    # Detalle de la celda RR_q2 del primer escenario
+    keys = store.read_summary(["key"])["key"].tolist()
+    index = next(i for i, r in enumerate(rows) if r["algorithm"] == "RR_q2")
+    expected = simulate_rr(all_scenarios()[0].processes, quantum=2)
+    processes = store.read_detail(keys[index])
+    timeline = store.read_detail(keys[index], "timeline")
+
+    assert processes["waiting"].tolist() == [p["waiting"] for p in expected["processes"]]
+    assert list(zip(timeline["start"].tolist(), timeline["end"].tolist())) == [(s, e) for s, e, _ in expected["timeline"]]
+    assert len(list((tmp_path / "store" / "cells").iterdir())) == len(rows)
+
+
+def test_cached_cells_reuse_stored_detail(tmp_path):
+    with ResultCache(tmp_path / "cache.sqlite") as cache:
+        store = ResultStore(tmp_path / "store")
+        first = run_all_experiments(cache=cache, store=store)
+        second = run_all_experiments(cache=cache, store=ResultStore(tmp_path / "store"))
+
+    assert all(r["cached"] for r in second)
+    rows = ResultStore(tmp_path / "store").summary_rows(["algorithm", "avg_turnaround", "cached"])
+    assert [r["avg_turnaround"] for r in rows] == [r["avg_turnaround"] for r in first]
+    assert all(r["cached"] for r in rows)
+
+
+def test_interrupted_run_keeps_finished_cells_and_resumes(tmp_path, monkeypatch):
+    from experiments import run_experiments
+
+    run_cell = run_experiments._run_cell
+    calls = []
+
+    def interrupted(cell, **options):
+        if len(calls) == 5:
+            raise KeyboardInterrupt
+        calls.append(cell)
+        return run_cell(cell, **options)
+
+    with ResultCache(tmp_path / "cache.sqlite") as cache:
+        monkeypatch.setattr(run_experiments, "_run_cell", interrupted)
+        with pytest.raises(KeyboardInterrupt):
+            run_all_experiments(cache=cache, store=ResultStore(tmp_path / "store"))
+        # Las cinco celdas terminadas están en el resumen aunque no se llenó un bloque
+        assert len(ResultStore(tmp_path / "store").summary_rows(["key"])) == 5
+
+        monkeypatch.setattr(run_experiments, "_run_cell", run_cell)
+        rows = run_all_experiments(cache=cache, store=ResultStore(tmp_path / "store"))
+
+    assert sum(r["cached"] for r in rows) == 5
+    assert len(ResultStore(tmp_path / "store").summary_rows(["key"])) == len(rows)
+
+
+def test_detail_columns_from_compact_timeline():
+    table = as_process_table(all_scenarios()[1].processes)
+    result = simulate_rr(table, quantum=2, compact_timeline=True)
+    detail = detail_columns(result)
+
+    assert detail["timeline"]["pid"].tolist() == [-1 if pid is None else pid for _, _, pid in result["timeline"]]
+
+
+def test_plot_results_reads_the_store(tmp_path, monkeypatch):
+    pytest.importorskip("matplotlib")
+    from experiments import plot_results
+
+    rows = run_all_experiments(store=ResultStore(tmp_path / "store"))
+    monkeypatch.setattr(plot_results, "RESULTS_STORE", tmp_path / "store")
+
+    loaded = plot_results.load_results()
+    assert loaded == [
+        {key: r[key] for key in ("scenario", "algorithm", "avg_waiting", "avg_turnaround", "avg_response")}
+        for r in rows
+    ]
+
+
+def test_no_store_run_does_not_leave_a_stale_summary(tmp_path, monkeypatch):
+    pytest.importorskip("matplotlib")
+    from experiments import plot_results
+    from experiments.run_experiments import main
+
+    monkeypatch.chdir(tmp_path)
+    store = ResultStore("data/results/store")
+    store.append({"scenario": "viejo", "algorithm": "FCFS", "key": "k", "avg_waiting": 1.0,
+                  "avg_turnaround": 2.0, "avg_response": 3.0, "wall_time": 0.0, "cached": False})
+    store.flush()
+
+    main(["--no-store", "--no-cache"])
+
+    assert not ResultStore("data/results/store").has_summary()
+    assert "viejo" not in {r["scenario"] for r in plot_results.load_results()}
@@ -1,6 +1,6 @@
 import pytest
 
-from src.cpu_scheduler import Process, simulate_rr
+from src.cpu_scheduler import Process, expand_rounds, simulate_rr
 
 
 def make_procs_rr():
@@ -46,4 +46,25 @@ def test_rr_timeline_and_metrics():
     # Promedios
     assert pytest.approx(result["avg_waiting"], rel=1e-6) == (5 + 5 + 2) / 3
     assert pytest.approx(result["avg_turnaround"], rel=1e-6) == (10 + 10 + 3) / 3
-    assert pytest.approx(result["avg_response"], rel=1e-6) == (0 + 1 + 2) / 3
\ No newline at end of file
+    assert pytest.approx(result["avg_response"], rel=1e-6) == (0 + 1 + 2) / 3
+
+def test_rr_round_skipping_with_long_bursts():
+    """
+    Con ráfagas largas y quantum chico, las rondas se saltan de un golpe: el timeline
+    comprimido tiene pocos segmentos y al expandirlo coincide con el de rebanadas.
+    """
+    procs = [
+        Process(pid=1, arrival=0, burst=10**5),
+        Process(pid=2, arrival=1, burst=10**5),
+        Process(pid=3, arrival=5 * 10**4, burst=7),
+    ]
+    full = simulate_rr(procs, quantum=2)
+    compressed = simulate_rr(procs, quantum=2, compress_rounds=True)
+
+    assert len(full["timeline"]) == 10**5 + 4
+    assert len(compressed["timeline"]) < 20
+    assert expand_rounds(compressed["timeline"], quantum=2) == full["timeline"]
+    assert compressed["processes"] == full["processes"]
+
+    p3 = next(p for p in full["processes"] if p["pid"] == 3)
+    assert p3["completion"] - p3["arrival"] < 30
@@ -48,3 +48,24 @@ def test_sjf_better_avg_wait_than_fcfs():
     result_sjf = simulate_sjf(procs)
 
     assert result_sjf["avg_waiting"] < result_fcfs["avg_waiting"]
+
+def test_sjf_idle_gap_and_ties():
+    """
+    Con CPU libre al inicio y ráfagas empatadas, SJF desempata por llegada y luego por pid.
+    """
+    procs = [
+        Process(pid=3, arrival=2, burst=2),
+        Process(pid=1, arrival=2, burst=2),
+        Process(pid=2, arrival=1, burst=2),
+        Process(pid=4, arrival=10, burst=1),
+    ]
+    result = simulate_sjf(procs)
+
+    assert result["timeline"] == [
+        (0, 1, None),
+        (1, 3, 2),
+        (3, 5, 1),
+        (5, 7, 3),
+        (7, 10, None),
+        (10, 11, 4),
+    ]
@@ -42,4 +42,27 @@ def test_srtf_preempts_long_job():
     timeline_pids = [pid for _, _, pid in result["timeline"]]
     assert timeline_pids[0] == "P1"
     assert "P2" in timeline_pids
-    assert "P3" in timeline_pids
\ No newline at end of file
+    assert "P3" in timeline_pids
+
+def test_srtf_long_bursts_exact_timeline():
+    """
+    Con ráfagas enormes la simulación solo avanza entre eventos, y los segmentos
+    coinciden con los de la versión unidad por unidad.
+    """
+    processes = [
+        Process(pid=1, arrival=0, burst=10**6),
+        Process(pid=2, arrival=10, burst=10**5),
+        Process(pid=3, arrival=20, burst=10**5),
+        Process(pid=4, arrival=3 * 10**6, burst=5),
+    ]
+
+    result = simulate_srtf(processes)
+
+    assert result["timeline"] == [
+        (0, 10, 1),
+        (10, 100010, 2),
+        (100010, 200010, 3),
+        (200010, 1200000, 1),
+        (1200000, 3000000, None),
+        (3000000, 3000005, 4),
+    ]
@@ -0,0 +1,81 @@
+import tracemalloc
+
+import pytest
+
+from experiments.scenarios import all_scenarios
+from src.cpu_scheduler import ProcessTable, simulate_fcfs, simulate_mlfq, simulate_priority, simulate_rr, simulate_sjf, simulate_srtf
+from src.streaming import collect, stream_fcfs, stream_mlfq, stream_priority, stream_rr, stream_sjf, stream_srtf
+
+
+def test_streaming_matches_batch_simulators():
+    """
+    Con las llegadas en orden, el stream produce el mismo timeline, procesos y promedios.
+    """
+    pairs = [
+        (simulate_fcfs, stream_fcfs),
+        (simulate_sjf, stream_sjf),
+        (simulate_srtf, stream_srtf),
+        (lambda w: simulate_rr(w, quantum=2), lambda a: stream_rr(a, quantum=2)),
+        (lambda w: simulate_priority(w, preemptive=True, aging=3), lambda a: stream_priority(a, preemptive=True, aging=3)),
+        (lambda w: simulate_mlfq(w, boost=7), lambda a: stream_mlfq(a, boost=7)),
+    ]
+    for scenario in all_scenarios():
+        arrivals = sorted(scenario.processes, key=lambda p: (p.arrival, p.pid))
+        for simulate, stream in pairs:
+            expected = simulate(scenario.processes)
+            result = collect(stream(iter(arrivals)))
+
+            assert result["timeline"] == expected["timeline"]
+            key = lambda p: p["pid"]
+            assert sorted(result["processes"], key=key) == sorted(expected["processes"], key=key)
+            for metric in ("avg_waiting", "avg_turnaround", "avg_response"):
+                assert result[metric] == pytest.approx(expected[metric])
+
+
+def test_streaming_memory_is_bounded_by_ready_queue():
+    """
+    Con una traza larga y carga ligera, el stream no acumula estado de procesos terminados.
+    """
+    def arrivals():
+        for pid in range(10_000):
+            yield pid, 3 * pid, 2
+
+    seen = 0
+    for kind, data in stream_sjf(arrivals()):
+        if kind == "process":
+            seen += 1
+    assert seen == 10_000
+
+    stream = stream_rr(arrivals(), quantum=1)
+    for kind, data in stream:
+        if kind == "process" and data["pid"] == 5_000:
+            # El generador está suspendido a mitad de la traza: solo vive el estado de la cola
+            sim = stream.gi_frame.f_locals["sim"]
+            assert len(sim.pid) <= 2
+            break
+
+
+def test_streaming_round_robin_memory_does_not_grow_with_long_bursts():
+    """Las rondas saltadas no se materializan: la memoria no depende de ráfaga / quantum."""
+    tracemalloc.start()
+    try:
+        slices = sum(1 for kind, _ in stream_rr([(1, 0, 100_000), (2, 0, 100_000)], quantum=1) if kind == "segment")
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    assert slices == 200_000
+    assert peak < 2**20
+
+
+def test_streaming_accepts_a_process_table():
+    """Una ProcessTable se recorre en orden de llegada aunque sus filas no lo estén."""
+    table = ProcessTable(["C", "A", "B", "D"], [4, 0, 0, 9], [2, 5, 3, 1], [1, 0, 2, 0])
+    assert list(table) == [("C", 4, 2, 1), ("A", 0, 5, 0), ("B", 0, 3, 2), ("D", 9, 1, 0)]
+
+    for simulate, stream in ((simulate_sjf, stream_sjf), (lambda w: simulate_rr(w, 2), lambda a: stream_rr(a, 2))):
+        expected = simulate(table)
+        result = collect(stream(table))
+        assert result["timeline"] == expected["timeline"]
+        assert sorted(result["processes"], key=lambda p: p["pid"]) == sorted(expected["processes"], key=lambda p: p["pid"])
+
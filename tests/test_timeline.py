@@ -0,0 +1,58 @@
+from src.cpu_scheduler import CompactTimeline, Process, print_results, simulate_rr, simulate_srtf
+
+
+def test_compact_timeline_merges_and_iterates_as_tuples(capsys):
+    """
+    Con un solo proceso listo, RR emite una rebanada por quantum; el timeline compacto las
+    fusiona y se sigue iterando como tuplas (inicio, fin, pid | None).
+    """
+    procs = [
+        Process(pid=1, arrival=2, burst=6),
+        Process(pid=2, arrival=20, burst=2),
+    ]
+    full = simulate_rr(procs, quantum=2)
+    compact = simulate_rr(procs, quantum=2, compact_timeline=True)
+
+    assert len(full["timeline"]) == 6
+    assert isinstance(compact["timeline"], CompactTimeline)
+    assert compact["timeline"] == [(0, 2, None), (2, 8, 1), (8, 20, None), (20, 22, 2)]
+    assert compact["processes"] == full["processes"]
+
+    print_results(compact)
+    assert "[ 2,  8) -> P1" in capsys.readouterr().out
+
+
+def test_compact_timeline_lookup_and_window():
+    procs = [
+        Process(pid="A", arrival=0, burst=8),
+        Process(pid="B", arrival=1, burst=4),
+        Process(pid="C", arrival=2, burst=1),
+    ]
+    timeline = simulate_srtf(procs, compact_timeline=True)["timeline"]
+
+    assert list(timeline) == [(0, 1, "A"), (1, 2, "B"), (2, 3, "C"), (3, 6, "B"), (6, 13, "A")]
+    assert timeline.at(0) == "A"
+    assert timeline.at(4) == "B"
+    assert timeline.at(12) == "A"
+    assert timeline.at(13) is None
+    assert list(timeline.window(2, 8)) == [(2, 3, "C"), (3, 6, "B"), (6, 8, "A")]
+    assert timeline[-1] == (6, 13, "A")
+
+
+def test_compact_timeline_with_skipped_rounds_matches_the_sliced_timeline():
+    """Las rondas saltadas se agregan en bloque; el resultado es el mismo que rebanada por rebanada."""
+    procs = [Process(pid=k, arrival=k, burst=50 + 7 * k) for k in range(4)] + [
+        Process(pid=9, arrival=300, burst=3),
+        Process(pid=10, arrival=400, burst=200),
+    ]
+    full = simulate_rr(procs, quantum=3)
+    compact = simulate_rr(procs, quantum=3, compact_timeline=True)
+
+    merged = CompactTimeline([p.pid for p in procs])
+    job = {p.pid: k for k, p in enumerate(procs)}
+    for start, end, pid in full["timeline"]:
+        merged.add(start, end, CompactTimeline.IDLE if pid is None else job[pid])
+    assert compact["timeline"] == merged
+    assert compact["counters"] == full["counters"]
+    # P10 corre solo desde que termina el resto: sus rondas quedan en un solo segmento
+    assert compact["timeline"][-1] == (400, 600, 10)
@@ -0,0 +1,48 @@
+import pickle
+
+from src.cpu_scheduler import Process, ProcessTable, simulate_rr, simulate_srtf
+from src.traces import csv_to_trace, load_trace, write_trace
+from experiments.scenarios import all_scenarios, scenario_from_trace
+
+
+def test_trace_roundtrip_matches_original_simulation(tmp_path):
+    for scenario in all_scenarios():
+        path = tmp_path / f"{scenario.name}.trace"
+        write_trace(path, scenario.processes)
+        table = load_trace(path)
+
+        assert isinstance(table.arrival, memoryview)
+        assert [(p.pid, p.arrival, p.burst, p.priority) for p in table.to_processes()] == [
+            (p.pid, p.arrival, p.burst, p.priority) for p in scenario.processes
+        ]
+        assert simulate_rr(table, quantum=2) == simulate_rr(scenario.processes, quantum=2)
+        assert simulate_srtf(table) == simulate_srtf(scenario.processes)
+
+        # Las tablas mapeadas se pueden mandar a otros procesos
+        assert pickle.loads(pickle.dumps(table)).to_processes() == table.to_processes()
+
+
+def test_csv_conversion_and_lazy_scenario(tmp_path):
+    csv_path = tmp_path / "procs.csv"
+    csv_path.write_text("pid,arrival,burst\n2,3,4\n1,0,5\n", encoding="utf-8")
+    trace = tmp_path / "procs.trace"
+
+    assert csv_to_trace(csv_path, trace) == 2
+
+    scenario = scenario_from_trace(trace)
+    assert scenario.name == "procs"
+    assert scenario.processes is None
+
+    table = scenario.workload()
+    assert not table.ordered
+    assert table.arrival_order() == [1, 0]
+    assert table.to_processes() == [Process(pid=2, arrival=3, burst=4), Process(pid=1, arrival=0, burst=5)]
+
+
+def test_sorted_trace_skips_sorting(tmp_path):
+    path = tmp_path / "sorted.trace"
+    write_trace(path, ProcessTable([1, 2, 3], [0, 0, 4], [3, 1, 2]))
+
+    table = load_trace(path)
+    assert table.ordered
+    assert table.arrival_order() == [0, 1, 2]
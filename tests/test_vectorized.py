@@ -0,0 +1,79 @@
+import random
+import warnings
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from experiments.scenarios import all_scenarios
+from src.cpu_scheduler import Process, simulate_fcfs, simulate_sjf
+from src.vectorized import simulate_fcfs_arrays, simulate_fcfs_batch, simulate_sjf_batch
+
+
+def test_fcfs_arrays_match_simulate_fcfs():
+    """
+    La versión vectorizada debe coincidir exactamente con simulate_fcfs en todos los escenarios.
+    """
+    for scenario in all_scenarios():
+        procs = scenario.processes
+        expected = simulate_fcfs(procs)
+        result = simulate_fcfs_arrays(
+            [p.arrival for p in procs], [p.burst for p in procs], [p.pid for p in procs]
+        )
+
+        for key in ("pid", "start", "completion", "waiting", "turnaround", "response"):
+            assert result[key].tolist() == [p[key] for p in expected["processes"]]
+        for key in ("avg_waiting", "avg_turnaround", "avg_response"):
+            assert result[key] == expected[key]
+
+        idle = [(start, end) for start, end, pid in expected["timeline"] if pid is None]
+        assert list(zip(result["idle_start"].tolist(), result["idle_end"].tolist())) == idle
+
+
+def test_fcfs_arrays_idle_gaps():
+    result = simulate_fcfs_arrays([5, 0, 20], [3, 2, 1])
+
+    assert result["completion"].tolist() == [2, 8, 21]
+    assert result["idle_start"].tolist() == [2, 8]
+    assert result["idle_end"].tolist() == [5, 20]
+
+
+def test_empty_workload_matches_scalar_simulator():
+    """
+    Sin procesos, la versión vectorizada y los lotes dan los mismos promedios en 0.0 que
+    simulate_fcfs, sin NaN ni avisos de NumPy.
+    """
+    expected = simulate_fcfs([])
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        result = simulate_fcfs_arrays([], [])
+        batch = simulate_fcfs_batch([[0, 1]], [[2, 3]], lengths=[0])
+
+    for key in ("avg_waiting", "avg_turnaround", "avg_response"):
+        assert result[key] == expected[key] == 0.0
+        assert batch[key].tolist() == [0.0]
+    assert result["idle_start"].tolist() == result["idle_end"].tolist() == []
+
+
+def test_batch_matches_per_workload_simulators():
+    """
+    Los lotes rellenados dan, fila por fila, los mismos promedios que simulate_fcfs y simulate_sjf.
+    """
+    rng = random.Random(5)
+    rows, width = 200, 12
+    lengths = [rng.randint(1, width) for _ in range(rows)]
+    arrival = [[rng.randint(0, 30) for _ in range(width)] for _ in range(rows)]
+    burst = [[rng.randint(1, 8) for _ in range(width)] for _ in range(rows)]
+
+    fcfs = simulate_fcfs_batch(arrival, burst, lengths)
+    sjf = simulate_sjf_batch(arrival, burst, lengths)
+
+    for r in range(rows):
+        procs = [Process(pid=c + 1, arrival=arrival[r][c], burst=burst[r][c]) for c in range(lengths[r])]
+        for batch, simulate in ((fcfs, simulate_fcfs), (sjf, simulate_sjf)):
+            expected = simulate(procs)
+            for key in ("avg_waiting", "avg_turnaround", "avg_response"):
+                assert batch[key][r] == expected[key]
+            by_pid = {p["pid"]: p for p in expected["processes"]}
+            assert batch["start"][r][: lengths[r]].tolist() == [by_pid[c + 1]["start"] for c in range(lengths[r])]
+            assert batch["start"][r][lengths[r]:].tolist() == [-1] * (width - lengths[r])
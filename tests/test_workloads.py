@@ -0,0 +1,36 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.cpu_scheduler import ProcessTable, simulate_sjf
+from experiments.workloads import generate_arrays, generate_scenario, generate_workload
+
+
+@pytest.mark.parametrize("arrivals", ["poisson", "onoff", "uniform"])
+@pytest.mark.parametrize("bursts", ["exponential", "pareto", "lognormal", "uniform"])
+def test_generated_workloads_are_reproducible_and_hit_utilization(arrivals, bursts):
+    pid, arrival, burst = generate_arrays(50_000, seed=3, arrivals=arrivals, bursts=bursts, utilization=0.7)
+    again = generate_arrays(50_000, seed=3, arrivals=arrivals, bursts=bursts, utilization=0.7)
+
+    for a, b in zip((pid, arrival, burst), again):
+        assert np.array_equal(a, b)
+    assert np.all(np.diff(arrival) >= 0)
+    assert burst.min() >= 1
+    assert burst.sum() / arrival[-1] == pytest.approx(0.7, rel=0.1)
+
+
+def test_generated_scenario_runs_in_simulators():
+    scenario = generate_scenario("onoff_pareto", n=2_000, seed=1, arrivals="onoff", bursts="pareto")
+    result = simulate_sjf(scenario.processes, per_process=False)
+
+    assert len(scenario.processes) == 2_000
+    assert result["avg_turnaround"] >= result["avg_waiting"]
+
+
+def test_generated_table_is_marked_ordered():
+    table = generate_workload(5_000, seed=2, arrivals="uniform")
+    unordered = ProcessTable(table.pid, table.arrival, table.burst)
+
+    assert table.ordered
+    assert list(table.arrival_order()) == unordered.arrival_order()
+